@@ -10,7 +10,7 @@ Permite analizar textos desde la línea de comandos o como módulo.
 import sys
 import argparse
 import json
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, Optional
 from src.models.sentiment_analyzer import SentimentAnalyzer
 from src.models.sentiment_result import SystemConfig
 from src.models.exceptions import SentimentAnalysisError
@@ -27,6 +27,8 @@ Ejemplos de uso:
   python main.py --file textos.txt
   python main.py --interactive
   python main.py --config custom_config.json
+  python main.py --warmup textos.txt --export-snapshot cache.json.gz
+  python main.py --import-snapshot cache.json.gz --file textos.txt
         """
     )
     
@@ -69,6 +71,28 @@ Ejemplos de uso:
         help='Mostrar información del sistema'
     )
     
+    parser.add_argument(
+        '--import-snapshot',
+        help='Instantánea de cache a importar al iniciar'
+    )
+    
+    parser.add_argument(
+        '--export-snapshot',
+        help='Archivo donde exportar los caches al terminar'
+    )
+    
+    parser.add_argument(
+        '--warmup',
+        help='Archivo de textos (uno por línea) para precargar los caches'
+    )
+    
+    parser.add_argument(
+        '--warmup-top',
+        type=int,
+        default=1000,
+        help='Número de textos más frecuentes usados en la precarga (por defecto 1000)'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -78,6 +102,15 @@ Ejemplos de uso:
         # Inicializar analizador
         analyzer = SentimentAnalyzer(config)
         
+        # Precargar caches
+        if args.import_snapshot:
+            counts = analyzer.import_cache_snapshot(args.import_snapshot)
+            print(f"Instantánea importada: {counts['tree_cache']} entradas del árbol, "
+                  f"{counts['result_cache']} resultados")
+        if args.warmup:
+            count = analyzer.warmup(args.warmup, args.warmup_top)
+            print(f"Caches precargados con {count} textos desde '{args.warmup}'")
+        
         # Mostrar información del sistema si se solicita
         if args.info:
             show_system_info(analyzer)
@@ -90,9 +123,17 @@ Ejemplos de uso:
             file_mode(analyzer, args.file, args.verbose, args.output)
         elif args.text:
             single_text_mode(analyzer, args.text, args.verbose, args.output)
-        else:
+        elif not (args.warmup or args.export_snapshot):
             # Modo por defecto: interactivo
             interactive_mode(analyzer, args.verbose, args.output)
+        
+        # Conservar las estadísticas de normalización de corpus para la próxima ejecución
+        analyzer.save_normalization_state()
+        
+        if args.export_snapshot:
+            counts = analyzer.export_cache_snapshot(args.export_snapshot)
+            print(f"Instantánea exportada: {counts['tree_cache']} entradas del árbol, "
+                  f"{counts['result_cache']} resultados")
     
     except KeyboardInterrupt:
         print("\nOperación cancelada por el usuario.")
@@ -200,39 +241,40 @@ def interactive_mode(analyzer: SentimentAnalyzer, verbose: bool, output_file: st
     
     # Guardar resultados si se especifica archivo de salida
     if output_file and results:
-        save_results(results, output_file)
-        print(f"\nResultados guardados en '{output_file}'")
+        if save_results(results, output_file) is not None:
+            print(f"\nResultados guardados en '{output_file}'")
 
 
 def file_mode(analyzer: SentimentAnalyzer, file_path: str, verbose: bool, output_file: str = None):
-    """Modo de archivo"""
+    """Modo de archivo (las líneas se leen, analizan y guardan en flujo)"""
+    output_file = output_file or 'resultados_analisis.json'
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            texts = [line.strip() for line in f if line.strip()]
-        
-        print(f"Analizando {len(texts)} textos desde '{file_path}'...")
-        
-        results = analyzer.batch_analyze(texts)
-        
-        # Mostrar resultados
-        for i, result in enumerate(results):
-            print(f"\n--- Texto {i+1} ---")
-            display_result(result, verbose)
+            print(f"Analizando textos desde '{file_path}'...")
+            
+            # Cada resultado se muestra y se escribe apenas se calcula
+            texts = (text for text in map(str.strip, f) if text)
+            count = save_results(analyzer.analyze_stream(texts), output_file,
+                                 on_result=lambda i, result: display_numbered(i, result, verbose))
         
-        # Guardar resultados
-        if output_file:
-            save_results(results, output_file)
-            print(f"\nResultados guardados en '{output_file}'")
-        else:
-            save_results(results, 'resultados_analisis.json')
-            print("\nResultados guardados en 'resultados_analisis.json'")
+        if count is not None:
+            print(f"\n{count} resultados guardados en '{output_file}'")
             
     except FileNotFoundError:
         print(f"Error: Archivo '{file_path}' no encontrado")
+    except (OSError, UnicodeDecodeError) as e:
+        # Los errores de escritura los informa save_results
+        print(f"Error al leer archivo: {str(e)}")
     except Exception as e:
         print(f"Error al procesar archivo: {str(e)}")
 
 
+def display_numbered(index: int, result, verbose: bool):
+    """Muestra un resultado del modo de archivo con su número"""
+    print(f"\n--- Texto {index + 1} ---")
+    display_result(result, verbose)
+
+
 def single_text_mode(analyzer: SentimentAnalyzer, text: str, verbose: bool, output_file: str = None):
     """Modo de texto único"""
     try:
@@ -243,8 +285,8 @@ def single_text_mode(analyzer: SentimentAnalyzer, text: str, verbose: bool, outp
         
         # Guardar resultado
         if output_file:
-            save_results([result], output_file)
-            print(f"\nResultado guardado en '{output_file}'")
+            if save_results([result], output_file) is not None:
+                print(f"\nResultado guardado en '{output_file}'")
             
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -280,20 +322,64 @@ def display_result(result, verbose: bool):
             print(f"\nSentimientos secundarios: {', '.join(result.secondary_sentiments)}")
 
 
-def save_results(results: list, output_file: str):
-    """Guarda los resultados en un archivo JSON"""
+class OutputWriteError(Exception):
+    """Error al escribir el archivo de resultados (distinto de los de lectura)"""
+
+
+def save_results(results: Iterable, output_file: str,
+                 on_result: Callable[[int, Any], None] = None) -> Optional[int]:
+    """
+    Guarda los resultados en un archivo JSON
+    
+    Los resultados se escriben uno a uno como elementos del arreglo JSON (con
+    el mismo formato que `json.dump(..., indent=2)`), por lo que `results`
+    puede ser un generador que no se guarda completo en memoria. Si leer o
+    analizar `results` falla, el arreglo se cierra con los resultados ya
+    escritos y el error se propaga; los errores de escritura se informan aquí.
+    
+    Args:
+        results: Resultados a guardar (cualquier iterable)
+        output_file: Archivo de salida
+        on_result: Función llamada con (posición, resultado) tras escribir cada uno
+    
+    Returns:
+        Número de resultados guardados, o None si hubo un error al guardar
+    """
     try:
-        # Convertir resultados a formato serializable
-        serializable_results = []
-        for result in results:
-            result_dict = result.to_dict()
-            serializable_results.append(result_dict)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+        f = open(output_file, 'w', encoding='utf-8')
+    except OSError as e:
+        print(f"Error al guardar resultados: {str(e)}")
+        return None
+    
+    count = 0
+    try:
+        try:
+            _checked(f.write, '[')
+            try:
+                for result in results:
+                    element = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+                    _checked(f.write, (',\n  ' if count else '\n  ') + element.replace('\n', '\n  '))
+                    if on_result is not None:
+                        on_result(count, result)
+                    count += 1
+            finally:
+                _checked(f.write, '\n]' if count else ']')
+        finally:
+            # Al cerrar se vuelca el búfer: sus errores también son de escritura
+            _checked(f.close)
+        return count
             
-    except Exception as e:
+    except OutputWriteError as e:
         print(f"Error al guardar resultados: {str(e)}")
+        return None
+
+
+def _checked(operation: Callable, *args):
+    """Ejecuta una operación sobre la salida convirtiendo OSError en OutputWriteError"""
+    try:
+        return operation(*args)
+    except OSError as e:
+        raise OutputWriteError(str(e)) from e
 
 
 if __name__ == "__main__":
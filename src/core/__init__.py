@@ -6,4 +6,7 @@ Contiene los módulos principales del sistema:
 - text_preprocessor: Preprocesamiento de texto
 - tree_searcher: Búsqueda en árbol de decisión
 - fuzzy_logic: Lógica difusa
+- fuzzy_inference: Motor de inferencia Mamdani compilado
+- modifier_scope: Alcance posicional de modificadores
+- neutral_fast_path: Plantillas de resultado para textos sin coincidencias
 """ 
\ No newline at end of file
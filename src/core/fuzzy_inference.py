@@ -0,0 +1,210 @@
+"""
+Motor de Inferencia Difusa Mamdani
+==================================
+
+Módulo responsable de cargar una base de reglas difusas declarativa
+(JSON) y compilarla en tablas de pertenencia discretizadas, de modo que
+la inferencia se reduzca a consultas en arreglos y un centroide vectorizado.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+from ..models.exceptions import FuzzyLogicError
+
+try:
+    import numpy as np
+except ImportError:  # El motor Mamdani requiere NumPy; se valida al compilar
+    np = None
+
+
+# Variables de entrada admitidas por la base de reglas
+INPUT_VARIABLES = ('base_score', 'modifier_intensity', 'punctuation_emphasis')
+
+
+def _membership(grid: Any, term: Dict[str, Any]) -> Any:
+    """
+    Evalúa una función de pertenencia triangular o trapezoidal sobre una malla
+    
+    Args:
+        grid: Puntos del universo de discurso
+        term: Definición del término ({'type': ..., 'points': [...]})
+    
+    Returns:
+        Grados de pertenencia para cada punto de la malla
+    """
+    points = term.get('points', [])
+    term_type = term.get('type', 'triangle')
+    
+    if term_type == 'triangle' and len(points) == 3:
+        a, b, d = points
+        c = b
+    elif term_type == 'trapezoid' and len(points) == 4:
+        a, b, c, d = points
+    else:
+        raise FuzzyLogicError(f"Función de pertenencia inválida: {term}")
+    
+    if not a <= b <= c <= d:
+        raise FuzzyLogicError(f"Los puntos de la función de pertenencia deben ser crecientes: {points}")
+    
+    # Flanco ascendente y descendente (un flanco vertical es un hombro)
+    rising = (grid - a) / (b - a) if b > a else (grid >= a).astype(np.float64)
+    falling = (d - grid) / (d - c) if d > c else (grid <= d).astype(np.float64)
+    
+    return np.clip(np.minimum(rising, falling), 0.0, 1.0)
+
+
+class LinguisticVariable:
+    """Variable lingüística compilada en una tabla de pertenencia"""
+    
+    def __init__(self, name: str, data: Dict[str, Any], resolution: int):
+        self.name = name
+        self.low, self.high = (float(v) for v in data.get('range', (0.0, 1.0)))
+        if self.high <= self.low:
+            raise FuzzyLogicError(f"Rango inválido para la variable '{name}'")
+        
+        terms = data.get('terms', {})
+        if not terms:
+            raise FuzzyLogicError(f"La variable '{name}' no define términos")
+        
+        self.terms: Tuple[str, ...] = tuple(terms)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.grid = np.linspace(self.low, self.high, resolution)
+        # Tabla términos × resolución con los grados de pertenencia discretizados
+        self.table = np.vstack([_membership(self.grid, terms[term]) for term in self.terms])
+        self._scale = (resolution - 1) / (self.high - self.low)
+    
+    def fuzzify(self, values: Any) -> Any:
+        """
+        Obtiene los grados de pertenencia por consulta en la tabla
+        
+        Args:
+            values: Valores de entrada (arreglo 1D)
+        
+        Returns:
+            Matriz términos × N con los grados de pertenencia
+        """
+        index = np.rint((np.clip(values, self.low, self.high) - self.low) * self._scale).astype(np.intp)
+        return self.table[:, index]
+
+
+class FuzzyRuleBase:
+    """Base de reglas difusas Mamdani compilada"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        if np is None:
+            raise FuzzyLogicError("El motor de inferencia Mamdani requiere NumPy")
+        
+        resolution = int(data.get('resolution', 201))
+        if resolution < 2:
+            raise FuzzyLogicError("La resolución debe ser al menos 2")
+        
+        variables = data.get('variables', {})
+        missing = [name for name in INPUT_VARIABLES if name not in variables]
+        if missing:
+            raise FuzzyLogicError(f"Faltan variables de entrada en la base de reglas: {missing}")
+        
+        self.inputs = {name: LinguisticVariable(name, variables[name], resolution) for name in INPUT_VARIABLES}
+        
+        output = data.get('output')
+        if not output:
+            raise FuzzyLogicError("La base de reglas no define la variable de salida")
+        self.output = LinguisticVariable(output.get('name', 'output'), output, resolution)
+        
+        self._compile_rules(data.get('rules', []))
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'FuzzyRuleBase':
+        """
+        Carga y compila una base de reglas desde un archivo JSON
+        
+        Args:
+            path: Ruta del archivo
+        
+        Returns:
+            Base de reglas compilada
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            raise FuzzyLogicError(f"Error al cargar base de reglas difusas: {str(e)}")
+    
+    def _compile_rules(self, rules: List[Dict[str, Any]]):
+        """
+        Compila las reglas a arreglos de índices de términos
+        
+        Cada variable de entrada recibe un arreglo (reglas,) con el índice del
+        término del antecedente, o -1 si la regla no la menciona.
+        """
+        if not rules:
+            raise FuzzyLogicError("La base de reglas no contiene reglas")
+        
+        antecedents = {name: [] for name in INPUT_VARIABLES}
+        consequents = []
+        
+        for rule in rules:
+            conditions = rule.get('if', {})
+            unknown = set(conditions) - set(INPUT_VARIABLES)
+            if unknown:
+                raise FuzzyLogicError(f"Variables desconocidas en la regla {rule}: {sorted(unknown)}")
+            
+            for name, variable in self.inputs.items():
+                term = conditions.get(name)
+                if term is None:
+                    antecedents[name].append(-1)
+                elif term in variable.term_index:
+                    antecedents[name].append(variable.term_index[term])
+                else:
+                    raise FuzzyLogicError(f"Término '{term}' no definido para '{name}'")
+            
+            consequent = rule.get('then')
+            if consequent not in self.output.term_index:
+                raise FuzzyLogicError(f"Consecuente '{consequent}' no definido en la salida")
+            consequents.append(self.output.term_index[consequent])
+        
+        self.rule_count = len(consequents)
+        self._antecedents = {name: np.array(terms, dtype=np.intp) for name, terms in antecedents.items()}
+        self._consequents = np.array(consequents, dtype=np.intp)
+    
+    def infer(self, base_scores: Any, modifier_intensity: Any, punctuation_emphasis: Any) -> Any:
+        """
+        Ejecuta la inferencia Mamdani (min-max) con defuzzificación por centroide
+        
+        Args:
+            base_scores: Puntuaciones base (cualquier forma)
+            modifier_intensity: Intensidad neta de modificadores, difundible a la
+                forma de base_scores (intensificadores - atenuadores)
+            punctuation_emphasis: Énfasis de puntuación, difundible a la forma
+                de base_scores (exclamaciones + interrogaciones)
+        
+        Returns:
+            Arreglo con la forma de base_scores y las puntuaciones inferidas;
+            donde ninguna regla se activa se conserva la puntuación base
+        """
+        base = np.asarray(base_scores, dtype=np.float64)
+        values = {
+            'base_score': base.ravel(),
+            'modifier_intensity': np.broadcast_to(modifier_intensity, base.shape).ravel(),
+            'punctuation_emphasis': np.broadcast_to(punctuation_emphasis, base.shape).ravel()
+        }
+        
+        # Fuerza de activación: AND (mínimo) de los antecedentes; -1 selecciona la fila de unos
+        strength = None
+        for name, variable in self.inputs.items():
+            memberships = variable.fuzzify(values[name])
+            memberships = np.vstack([memberships, np.ones((1, memberships.shape[1]))])
+            degrees = memberships[self._antecedents[name]]
+            strength = degrees if strength is None else np.minimum(strength, degrees)
+        
+        # Agregación por término de salida: OR (máximo) de las reglas con igual consecuente
+        term_strength = np.zeros((len(self.output.terms), strength.shape[1]))
+        np.maximum.at(term_strength, self._consequents, strength)
+        
+        # Implicación (mínimo) y agregación (máximo) sobre la malla de salida
+        aggregated = np.max(np.minimum(term_strength[:, :, None], self.output.table[:, None, :]), axis=0)
+        
+        # Centroide vectorizado
+        area = aggregated.sum(axis=1)
+        centroid = np.divide(aggregated @ self.output.grid, area, out=values['base_score'].copy(), where=area > 0)
+        
+        return centroid.reshape(base.shape)
@@ -7,17 +7,71 @@ de sentimientos, incluyendo intensificación, atenuación y negación.
 """
 
 import math
-from typing import Dict, List
+from typing import Any, Dict, List, Sequence
 from ..models.sentiment_result import SystemConfig
+from ..models.sentiment_vector import SENTIMENTS, SENTIMENT_INDEX, SentimentVector
 from ..models.exceptions import FuzzyLogicError
+from .fuzzy_inference import FuzzyRuleBase
+from .modifier_scope import ScopedModifiers
+
+try:
+    import numpy as np
+except ImportError:  # NumPy solo es necesario para el procesamiento por lotes
+    np = None
+
+
+# Claves de modificadores admitidas por el procesamiento por lotes
+MODIFIER_COUNT_KEYS = ('intensifiers', 'attenuators', 'negations', 'emoticons',
+                       'exclamation_count', 'question_count')
+
+# Claves que admiten conteos por sentimiento con alcance posicional
+SCOPED_COUNT_KEYS = ('intensifiers', 'attenuators', 'negations')
 
 
 class FuzzyLogicProcessor:
     """Procesador de lógica difusa"""
     
-    def __init__(self, config: SystemConfig):
+    def __init__(self, config: SystemConfig, rule_base: FuzzyRuleBase = None):
         self.config = config
-        self.sentiments = ['alegria', 'tristeza', 'enojo', 'preocupacion', 'informacion', 'sorpresa']
+        self.sentiments = list(SENTIMENTS)
+        # Base de reglas Mamdani opcional (reemplaza intensificación, atenuación y puntuación)
+        self.rule_base = rule_base
+        self.refresh_parameters()
+    
+    def refresh_parameters(self):
+        """
+        Congela los parámetros difusos en tablas indexadas por número de modificadores
+        
+        Se invoca en la construcción; debe llamarse de nuevo si se modifica
+        `config.fuzzy_parameters` después de crear el procesador.
+        """
+        params = self.config.fuzzy_parameters
+        self.intensification_factor = params.get('intensification_factor', 1.5)
+        self.attenuation_factor = params.get('attenuation_factor', 0.7)
+        self.mixed_emotion_threshold = params.get('mixed_emotion_threshold', 0.6)
+        
+        # Los conteos de modificadores no superan el número de palabras del texto
+        max_count = max(1, self.config.max_text_length)
+        self.intensify_table = tuple(1.0 + (n * self.intensification_factor) for n in range(max_count + 1))
+        self.attenuate_table = tuple(self.attenuation_factor ** n for n in range(max_count + 1))
+        
+        # Incrementos de contexto: crecen linealmente hasta saturar en su tope
+        self.emoticon_boost_table = self._saturating_table(0.1, 0.2)
+        self.exclamation_boost_table = self._saturating_table(0.05, 0.15)
+        self.question_boost_table = self._saturating_table(0.05, 0.1)
+    
+    @staticmethod
+    def _saturating_table(step: float, cap: float) -> tuple:
+        """Tabla min(cap, n·step) desde n = 0 hasta el primer valor saturado"""
+        table = [0.0]
+        while table[-1] < cap:
+            table.append(min(cap, len(table) * step))
+        return tuple(table)
+    
+    @staticmethod
+    def _lookup(table: tuple, count: int) -> float:
+        """Consulta una tabla saturada (los conteos mayores usan la última entrada)"""
+        return table[count] if count < len(table) else table[-1]
     
     def apply_fuzzy_rules(self, base_scores: Dict[str, float], 
                          modifiers: Dict[str, List[str]]) -> Dict[str, float]:
@@ -35,36 +89,238 @@ class FuzzyLogicProcessor:
             return {}
         
         # Copiar puntuaciones base
-        adjusted_scores = base_scores.copy()
-        
-        # Aplicar intensificación
-        if modifiers.get('intensifiers'):
-            for sentiment in adjusted_scores:
-                adjusted_scores[sentiment] = self.intensify_sentiment(
-                    adjusted_scores[sentiment], 
-                    modifiers['intensifiers']
-                )
+        adjusted_scores = SentimentVector.from_dict(base_scores)
+        
+        return self.apply_fuzzy_rules_vector(adjusted_scores, modifiers).to_dict()
+    
+    def apply_fuzzy_rules_vector(self, scores: SentimentVector,
+                                 modifiers: Dict[str, List[str]],
+                                 scoped: ScopedModifiers = None) -> SentimentVector:
+        """
+        Aplica reglas de lógica difusa sobre un vector, modificándolo en el lugar
+        
+        Args:
+            scores: Vector de puntuaciones base (se modifica)
+            modifiers: Modificadores extraídos del texto
+            scoped: Modificadores con alcance posicional; si se indican, la
+                intensificación, atenuación y negación solo afectan a los
+                sentimientos alcanzados y se ignoran las listas globales
+            
+        Returns:
+            El mismo vector con las puntuaciones ajustadas
+        """
+        if not len(scores):
+            return scores
+        
+        if scoped is not None:
+            self._apply_scoped_modifiers(scores, modifiers, scoped)
+        else:
+            self._apply_global_modifiers(scores, modifiers)
+        
+        # Aplicar contexto
+        self._apply_context_rules_vector(scores, modifiers)
+        
+        # Combinar emociones mixtas
+        self._combine_emotions_vector(scores)
+        
+        # Limitar al rango [0, 1]
+        return scores.clamp(0.0, 1.0)
+    
+    def _apply_global_modifiers(self, scores: SentimentVector, modifiers: Dict[str, List[str]]):
+        """Aplica intensificación, atenuación y negación a todo el vector"""
+        values = scores.values
+        
+        if self.rule_base is not None:
+            # Inferencia Mamdani sobre la vista NumPy del vector (sin copiar)
+            view = np.frombuffer(values, dtype=np.float64)
+            view[:] = self.rule_base.infer(view, *self._rule_base_inputs(modifiers))
+        
+        # Aplicar intensificación (un único factor tabulado para todo el vector)
+        elif modifiers.get('intensifiers'):
+            factor = self._intensify_factor(len(modifiers['intensifiers']))
+            for i in range(len(values)):
+                if values[i] > 0:
+                    values[i] = min(1.0, values[i] * factor)
         
         # Aplicar atenuación
-        if modifiers.get('attenuators'):
-            for sentiment in adjusted_scores:
-                adjusted_scores[sentiment] = self.attenuate_sentiment(
-                    adjusted_scores[sentiment], 
-                    modifiers['attenuators']
-                )
+        if self.rule_base is None and modifiers.get('attenuators'):
+            factor = self._attenuate_factor(len(modifiers['attenuators']))
+            for i in range(len(values)):
+                if values[i] > 0:
+                    values[i] = values[i] * factor
         
         # Aplicar negación
         if modifiers.get('negations'):
-            adjusted_scores = self.apply_negation(adjusted_scores, modifiers['negations'])
+            self._negate_vector(scores, modifiers['negations'])
+    
+    def _apply_scoped_modifiers(self, scores: SentimentVector, modifiers: Dict[str, List[str]],
+                                scoped: ScopedModifiers):
+        """Aplica a cada sentimiento solo los modificadores en su alcance"""
+        values = scores.values
+        positions = [(i, scores.index(sentiment)) for i, sentiment in enumerate(SENTIMENTS)]
+        positions = [(i, position) for i, position in positions if position >= 0]
+        
+        if self.rule_base is not None:
+            # Intensidad neta por sentimiento para la inferencia Mamdani
+            intensity = np.zeros(len(values))
+            for i, position in positions:
+                intensity[position] = scoped.intensifiers[i] - scoped.attenuators[i]
+            view = np.frombuffer(values, dtype=np.float64)
+            view[:] = self.rule_base.infer(view, intensity, self._rule_base_inputs(modifiers)[1])
+        
+        if not scoped.has_effect:
+            return
+        
+        for i, position in positions:
+            value = values[position]
+            if self.rule_base is None and value > 0:
+                if scoped.intensifiers[i]:
+                    value = min(1.0, value * self._intensify_factor(scoped.intensifiers[i]))
+                if scoped.attenuators[i]:
+                    value = value * self._attenuate_factor(scoped.attenuators[i])
+            if scoped.negated[i]:
+                value = 1.0 - value
+            values[position] = value
+    
+    def apply_fuzzy_rules_batch(self, scores: Any, modifier_counts: Dict[str, Any]) -> Any:
+        """
+        Aplica las reglas difusas a un lote de vectores con operaciones de NumPy
         
-        # Aplicar contexto
-        adjusted_scores = self._apply_context_rules(adjusted_scores, modifiers)
+        Equivale a llamar a `apply_fuzzy_rules_vector` fila por fila (hasta
+        la tolerancia de punto flotante), pero sin bucles de Python.
         
-        # Combinar emociones mixtas
-        adjusted_scores = self.combine_emotions(adjusted_scores)
+        Args:
+            scores: Matriz N×6 de puntuaciones en el orden de SENTIMENTS
+            modifier_counts: Conteos por documento (arreglos de longitud N) con
+                las claves de MODIFIER_COUNT_KEYS; las ausentes se toman como 0.
+                Intensificadores, atenuadores y negaciones admiten también una
+                matriz N×6 con conteos por sentimiento (alcance posicional)
+            
+        Returns:
+            Nueva matriz N×6 con las puntuaciones ajustadas
+            
+        Raises:
+            FuzzyLogicError: Si NumPy no está disponible o las dimensiones no coinciden
+        """
+        if np is None:
+            raise FuzzyLogicError("El procesamiento por lotes requiere NumPy")
+        
+        matrix = np.array(scores, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(SENTIMENTS):
+            raise FuzzyLogicError(f"Se esperaba una matriz N×{len(SENTIMENTS)}, se recibió {matrix.shape}")
+        
+        rows = matrix.shape[0]
+        counts = {}
+        for key in MODIFIER_COUNT_KEYS:
+            values = modifier_counts.get(key)
+            counts[key] = (np.zeros(rows, dtype=np.int64) if values is None
+                           else np.asarray(values, dtype=np.int64))
+            if counts[key].ndim != 2 or key not in SCOPED_COUNT_KEYS:
+                counts[key] = counts[key].reshape(rows)
+        
+        # Conteos globales (N,) o por sentimiento (N×6), difundidos a N×6
+        intensifiers, attenuators, negations = (
+            counts[key] if counts[key].ndim == 2 else counts[key][:, None] for key in SCOPED_COUNT_KEYS
+        )
+        
+        if self.rule_base is not None:
+            # Inferencia Mamdani para todo el lote
+            matrix = self.rule_base.infer(
+                matrix,
+                intensifiers - attenuators,
+                (counts['exclamation_count'] + counts['question_count'])[:, None]
+            )
+        else:
+            # Intensificación: score * (1 + n·factor), limitada a 1
+            factor = 1.0 + intensifiers * self.intensification_factor
+            mask = (intensifiers > 0) & (matrix > 0)
+            matrix = np.where(mask, np.minimum(1.0, matrix * factor), matrix)
+            
+            # Atenuación: score * factor^n
+            factor = np.power(self.attenuation_factor, attenuators.astype(np.float64))
+            mask = (attenuators > 0) & (matrix > 0)
+            matrix = np.where(mask, matrix * factor, matrix)
+        
+        # Negación: número impar invierte las puntuaciones
+        matrix = np.where(negations % 2 == 1, 1.0 - matrix, matrix)
+        
+        # Reglas de contexto (el dominante se toma antes de los ajustes)
+        row_index = np.arange(rows)
+        dominant = np.argmax(matrix, axis=1) if rows else np.zeros(0, dtype=np.int64)
+        
+        emoticons = counts['emoticons']
+        joy = SENTIMENT_INDEX['alegria']
+        boost = np.where(emoticons > 0, np.minimum(0.2, emoticons * 0.1), 0.0)
+        matrix[:, joy] = np.where(emoticons > 0, np.minimum(1.0, matrix[:, joy] + boost), matrix[:, joy])
+        
+        # Con base de reglas no se aplican los incrementos por puntuación
+        exclamations = counts['exclamation_count'] if self.rule_base is None else np.zeros(rows, dtype=np.int64)
+        boost = np.minimum(0.15, exclamations * 0.05)
+        current = matrix[row_index, dominant]
+        matrix[row_index, dominant] = np.where(exclamations > 0, np.minimum(1.0, current + boost), current)
+        
+        questions = counts['question_count'] if self.rule_base is None else np.zeros(rows, dtype=np.int64)
+        boost = np.minimum(0.1, questions * 0.05)
+        for sentiment in ('sorpresa', 'informacion'):
+            column = SENTIMENT_INDEX[sentiment]
+            matrix[:, column] = np.where(questions > 0, np.minimum(1.0, matrix[:, column] + boost),
+                                         matrix[:, column])
+        
+        # Emociones mixtas: reducir secundarias según su posición en el ranking
+        mixed = (matrix > 0.6).sum(axis=1) > 1
+        if mixed.any():
+            threshold = self.mixed_emotion_threshold
+            ranking = np.argsort(-matrix, axis=1, kind='stable')
+            original = matrix.copy()
+            for rank in range(1, len(SENTIMENTS)):
+                positions = ranking[:, rank]
+                values = original[row_index, positions]
+                reduce = mixed & (values > threshold)
+                matrix[row_index, positions] = np.where(
+                    reduce, values * max(0.3, 1.0 - rank * 0.2), matrix[row_index, positions]
+                )
         
         # Limitar al rango [0, 1]
-        return {k: max(0.0, min(1.0, v)) for k, v in adjusted_scores.items()}
+        return np.clip(matrix, 0.0, 1.0)
+    
+    @staticmethod
+    def _rule_base_inputs(modifiers: Dict[str, Any]) -> tuple:
+        """Calcula intensidad de modificadores y énfasis de puntuación para la base de reglas"""
+        intensity = len(modifiers.get('intensifiers') or ()) - len(modifiers.get('attenuators') or ())
+        emphasis = modifiers.get('exclamation_count', 0) + modifiers.get('question_count', 0)
+        return intensity, emphasis
+    
+    @staticmethod
+    def count_modifiers(modifiers_list: Sequence[Dict[str, Any]],
+                        scoped_list: Sequence[ScopedModifiers] = None) -> Dict[str, List[Any]]:
+        """
+        Convierte modificadores por documento a conteos para el procesamiento por lotes
+        
+        Args:
+            modifiers_list: Modificadores de cada documento
+            scoped_list: Modificadores con alcance posicional de cada documento;
+                si se indican, intensificadores, atenuadores y negaciones se
+                convierten en conteos por sentimiento
+            
+        Returns:
+            Dict con una lista de conteos por clave de modificador
+        """
+        counts = {key: [] for key in MODIFIER_COUNT_KEYS}
+        
+        for modifiers in modifiers_list:
+            for key in MODIFIER_COUNT_KEYS:
+                value = modifiers.get(key)
+                if isinstance(value, int):
+                    counts[key].append(value)
+                else:
+                    counts[key].append(len(value) if value else 0)
+        
+        if scoped_list is not None:
+            counts['intensifiers'] = [list(scoped.intensifiers) for scoped in scoped_list]
+            counts['attenuators'] = [list(scoped.attenuators) for scoped in scoped_list]
+            counts['negations'] = [list(scoped.negated) for scoped in scoped_list]
+        
+        return counts
     
     def intensify_sentiment(self, score: float, intensifiers: List[str]) -> float:
         """
@@ -80,14 +336,8 @@ class FuzzyLogicProcessor:
         if not intensifiers or score <= 0:
             return score
         
-        # Factor de intensificación basado en configuración
-        intensification_factor = self.config.fuzzy_parameters.get('intensification_factor', 1.5)
-        
-        # Calcular factor total
-        factor = 1.0 + (len(intensifiers) * intensification_factor)
-        
-        # Aplicar intensificación
-        intensified_score = score * factor
+        # Factor tabulado: 1 + n·intensification_factor
+        intensified_score = score * self._intensify_factor(len(intensifiers))
         
         # Limitar al máximo
         return min(1.0, intensified_score)
@@ -106,16 +356,20 @@ class FuzzyLogicProcessor:
         if not attenuators or score <= 0:
             return score
         
-        # Factor de atenuación basado en configuración
-        attenuation_factor = self.config.fuzzy_parameters.get('attenuation_factor', 0.7)
-        
-        # Calcular factor total (exponencial)
-        factor = attenuation_factor ** len(attenuators)
-        
-        # Aplicar atenuación
-        attenuated_score = score * factor
-        
-        return attenuated_score
+        # Factor tabulado (exponencial): attenuation_factor^n
+        return score * self._attenuate_factor(len(attenuators))
+    
+    def _intensify_factor(self, count: int) -> float:
+        """Factor de intensificación para `count` intensificadores"""
+        if count < len(self.intensify_table):
+            return self.intensify_table[count]
+        return 1.0 + (count * self.intensification_factor)
+    
+    def _attenuate_factor(self, count: int) -> float:
+        """Factor de atenuación para `count` atenuadores"""
+        if count < len(self.attenuate_table):
+            return self.attenuate_table[count]
+        return self.attenuation_factor ** count
     
     def apply_negation(self, scores: Dict[str, float], negations: List[str]) -> Dict[str, float]:
         """
@@ -128,18 +382,11 @@ class FuzzyLogicProcessor:
         Returns:
             Puntuaciones con negación aplicada
         """
-        if not negations:
+        # Número par de negaciones mantiene las puntuaciones originales
+        if not negations or len(negations) % 2 == 0:
             return scores
         
-        # Número impar de negaciones invierte las puntuaciones
-        if len(negations) % 2 == 1:
-            negated_scores = {}
-            for sentiment, score in scores.items():
-                negated_scores[sentiment] = 1.0 - score
-            return negated_scores
-        
-        # Número par de negaciones mantiene las puntuaciones originales
-        return scores
+        return self._negate_vector(SentimentVector.from_dict(scores), negations).to_dict()
     
     def combine_emotions(self, scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -154,27 +401,7 @@ class FuzzyLogicProcessor:
         if not scores:
             return {}
         
-        # Detectar emociones mixtas
-        high_scores = {k: v for k, v in scores.items() if v > 0.6}
-        
-        if len(high_scores) <= 1:
-            return scores
-        
-        # Aplicar operador difuso AND para emociones mixtas
-        mixed_emotion_threshold = self.config.fuzzy_parameters.get('mixed_emotion_threshold', 0.6)
-        
-        combined_scores = scores.copy()
-        
-        # Reducir puntuaciones de emociones secundarias
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        for i, (sentiment, score) in enumerate(sorted_scores[1:], 1):
-            if score > mixed_emotion_threshold:
-                # Reducir puntuación de emociones secundarias
-                reduction_factor = 1.0 - (i * 0.2)  # Reducir 20% por cada nivel
-                combined_scores[sentiment] = score * max(0.3, reduction_factor)
-        
-        return combined_scores
+        return self._combine_emotions_vector(SentimentVector.from_dict(scores)).to_dict()
     
     def _apply_context_rules(self, scores: Dict[str, float], modifiers: Dict[str, List[str]]) -> Dict[str, float]:
         """
@@ -187,35 +414,78 @@ class FuzzyLogicProcessor:
         Returns:
             Puntuaciones ajustadas por contexto
         """
-        context_weight = self.config.fuzzy_parameters.get('context_weight', 0.3)
-        adjusted_scores = scores.copy()
+        return self._apply_context_rules_vector(SentimentVector.from_dict(scores), modifiers).to_dict()
+    
+    def _negate_vector(self, scores: SentimentVector, negations: List[str]) -> SentimentVector:
+        """Invierte el vector en el lugar si el número de negaciones es impar"""
+        if len(negations) % 2 == 1:
+            values = scores.values
+            for i in range(len(values)):
+                values[i] = 1.0 - values[i]
+        return scores
+    
+    def _combine_emotions_vector(self, scores: SentimentVector) -> SentimentVector:
+        """Combina emociones mixtas sobre el vector, en el lugar"""
+        values = scores.values
+        
+        # Detectar emociones mixtas
+        high_count = sum(1 for value in values if value > 0.6)
+        
+        if high_count <= 1:
+            return scores
+        
+        # Aplicar operador difuso AND para emociones mixtas
+        mixed_emotion_threshold = self.mixed_emotion_threshold
+        
+        # Reducir puntuaciones de emociones secundarias (orden estable, como sorted)
+        ranking = sorted(range(len(values)), key=values.__getitem__, reverse=True)
+        
+        for rank, position in enumerate(ranking[1:], 1):
+            score = values[position]
+            if score > mixed_emotion_threshold:
+                # Reducir 20% por cada nivel
+                reduction_factor = 1.0 - (rank * 0.2)
+                values[position] = score * max(0.3, reduction_factor)
+        
+        return scores
+    
+    def _apply_context_rules_vector(self, scores: SentimentVector,
+                                    modifiers: Dict[str, List[str]]) -> SentimentVector:
+        """Aplica reglas de contexto sobre el vector, en el lugar"""
+        values = scores.values
+        
+        # El sentimiento dominante se determina antes de cualquier ajuste
+        dominant_position = scores.argmax() if len(values) else -1
         
         # Ajustar basado en emoticones
         if modifiers.get('emoticons'):
             emoticon_count = len(modifiers['emoticons'])
             # Aumentar alegría si hay emoticones positivos
-            if 'alegria' in adjusted_scores:
-                emoticon_boost = min(0.2, emoticon_count * 0.1)
-                adjusted_scores['alegria'] = min(1.0, adjusted_scores['alegria'] + emoticon_boost)
+            position = scores.index('alegria')
+            if position >= 0:
+                emoticon_boost = self._lookup(self.emoticon_boost_table, emoticon_count)
+                values[position] = min(1.0, values[position] + emoticon_boost)
+        
+        # Con base de reglas, la puntuación ya se consideró en la inferencia
+        if self.rule_base is not None:
+            return scores
         
         # Ajustar basado en exclamaciones
-        if modifiers.get('exclamation_count', 0) > 0:
-            exclamation_boost = min(0.15, modifiers['exclamation_count'] * 0.05)
+        if modifiers.get('exclamation_count', 0) > 0 and dominant_position >= 0:
+            exclamation_boost = self._lookup(self.exclamation_boost_table, modifiers['exclamation_count'])
             # Aumentar el sentimiento dominante
-            dominant_sentiment = max(scores.items(), key=lambda x: x[1])[0]
-            if dominant_sentiment in adjusted_scores:
-                adjusted_scores[dominant_sentiment] = min(1.0, adjusted_scores[dominant_sentiment] + exclamation_boost)
+            values[dominant_position] = min(1.0, values[dominant_position] + exclamation_boost)
         
         # Ajustar basado en interrogaciones
         if modifiers.get('question_count', 0) > 0:
             # Aumentar sorpresa e información
-            question_boost = min(0.1, modifiers['question_count'] * 0.05)
-            if 'sorpresa' in adjusted_scores:
-                adjusted_scores['sorpresa'] = min(1.0, adjusted_scores['sorpresa'] + question_boost)
-            if 'informacion' in adjusted_scores:
-                adjusted_scores['informacion'] = min(1.0, adjusted_scores['informacion'] + question_boost)
+            question_boost = self._lookup(self.question_boost_table, modifiers['question_count'])
+            for sentiment in ('sorpresa', 'informacion'):
+                position = scores.index(sentiment)
+                if position >= 0:
+                    values[position] = min(1.0, values[position] + question_boost)
         
-        return adjusted_scores
+        return scores
     
     def fuzzy_and(self, a: float, b: float) -> float:
         """
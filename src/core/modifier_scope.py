@@ -0,0 +1,129 @@
+"""
+Alcance Posicional de Modificadores
+===================================
+
+Módulo responsable de asignar intensificadores, atenuadores y negaciones
+únicamente a las siguientes K coincidencias del léxico, en una sola
+pasada lineal sobre la secuencia de identificadores de tokens.
+"""
+
+from array import array
+from typing import Dict, Tuple
+from ..models.sentiment_vector import SENTIMENTS, SENTIMENT_INDEX
+from ..models.exceptions import ConfigurationError
+from ..utils.keyword_matcher import KeywordMatcher
+from .text_preprocessor import TextPreprocessor
+
+
+# Tipos de modificador codificados por identificador de token
+INTENSIFIER = 1
+ATTENUATOR = 2
+NEGATION = 3
+
+
+class ScopedModifiers:
+    """Modificadores asignados a cada sentimiento según su posición"""
+    
+    __slots__ = ('intensifiers', 'attenuators', 'negated', 'has_effect')
+    
+    def __init__(self):
+        size = len(SENTIMENTS)
+        self.intensifiers = array('H', bytes(2 * size))  # Intensificadores en alcance por sentimiento
+        self.attenuators = array('H', bytes(2 * size))   # Atenuadores en alcance por sentimiento
+        self.negated = array('b', bytes(size))            # 1 si el sentimiento queda negado
+        self.has_effect = False
+    
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Representación por sentimiento (solo los afectados)"""
+        return {
+            sentiment: {
+                'intensifiers': self.intensifiers[i],
+                'attenuators': self.attenuators[i],
+                'negated': bool(self.negated[i])
+            }
+            for i, sentiment in enumerate(SENTIMENTS)
+            if self.intensifiers[i] or self.attenuators[i] or self.negated[i]
+        }
+
+
+class ModifierScopeEngine:
+    """Motor de alcance posicional de modificadores"""
+    
+    def __init__(self, preprocessor: TextPreprocessor, keyword_matcher: KeywordMatcher, window: int):
+        if preprocessor.vocabulary is None or preprocessor.vocabulary is not keyword_matcher.vocabulary:
+            raise ConfigurationError("El preprocesador y la coincidencia de palabras deben compartir vocabulario")
+        
+        self.window = window
+        vocabulary = keyword_matcher.vocabulary
+        
+        # Tipo de modificador por identificador (mismo orden de prioridad que extract_modifiers)
+        self._modifier_kind: Dict[int, int] = {}
+        for kind, words in ((NEGATION, preprocessor.negations),
+                            (ATTENUATOR, preprocessor.attenuators),
+                            (INTENSIFIER, preprocessor.intensifiers)):
+            for word in words:
+                self._modifier_kind[vocabulary.get_id(word)] = kind
+        
+        # Posiciones de sentimiento por identificador de palabra del léxico
+        self._hit_positions: Dict[int, Tuple[int, ...]] = {
+            token_id: tuple(SENTIMENT_INDEX[sentiment] for sentiment, _ in hits)
+            for token_id, hits in keyword_matcher.get_hit_index().items()
+        }
+    
+    def scope(self, token_ids: array) -> ScopedModifiers:
+        """
+        Recorre los tokens una sola vez asignando los modificadores pendientes
+        
+        Un modificador afecta a las siguientes `window` coincidencias del
+        léxico; después el estado pendiente se descarta. Si un sentimiento
+        recibe varias coincidencias, se conserva el mayor número de
+        modificadores y queda negado si la mayoría de sus coincidencias
+        estaban bajo una negación.
+        
+        Args:
+            token_ids: Identificadores de tokens del texto preprocesado
+        
+        Returns:
+            Modificadores asignados por sentimiento
+        """
+        scoped = ScopedModifiers()
+        negation_votes = [0] * len(SENTIMENTS)
+        
+        pending_intensifiers = pending_attenuators = pending_negation = 0
+        remaining = 0
+        modifier_kind = self._modifier_kind
+        hit_positions = self._hit_positions
+        
+        for token_id in token_ids:
+            kind = modifier_kind.get(token_id)
+            if kind is not None:
+                if kind == INTENSIFIER:
+                    pending_intensifiers += 1
+                elif kind == ATTENUATOR:
+                    pending_attenuators += 1
+                else:
+                    pending_negation ^= 1
+                remaining = self.window
+                continue
+            
+            positions = hit_positions.get(token_id)
+            if not positions:
+                continue
+            
+            for position in positions:
+                if remaining:
+                    scoped.intensifiers[position] = max(scoped.intensifiers[position], pending_intensifiers)
+                    scoped.attenuators[position] = max(scoped.attenuators[position], pending_attenuators)
+                negation_votes[position] += 1 if remaining and pending_negation else -1
+            
+            if remaining:
+                remaining -= 1
+                if not remaining:
+                    pending_intensifiers = pending_attenuators = pending_negation = 0
+        
+        for position, votes in enumerate(negation_votes):
+            if votes > 0:
+                scoped.negated[position] = 1
+        
+        scoped.has_effect = any(scoped.intensifiers) or any(scoped.attenuators) or any(scoped.negated)
+        return scoped
@@ -0,0 +1,168 @@
+"""
+Ruta Rápida para Textos Neutrales
+=================================
+
+Módulo que detecta, justo después del preprocesamiento, los textos sin
+coincidencias del léxico, sin modificadores y sin emoticones. Para ellos el
+resultado solo depende de unos pocos rasgos residuales (número de palabras si
+el árbol lo consulta, exclamaciones e interrogaciones), de modo que la
+búsqueda en el árbol, la lógica difusa, la normalización y la confianza se
+calculan una vez por combinación de rasgos y se reutilizan como plantilla.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from ..models.sentiment_vector import SENTIMENTS
+from ..models.exceptions import ConfigurationError
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.memory import deep_sizeof
+from .text_preprocessor import TextPreprocessor
+from .tree_searcher import TreeSearcher
+
+
+# Llamadas has_keyword('sentimiento', 'palabra') de las condiciones del árbol
+_HAS_KEYWORD_PATTERN = re.compile(r'has_keyword\([\'"]([^\'"]+)[\'"],\s*[\'"]([^\'"]+)[\'"]\)')
+
+# Funciones cuyo valor es falso o queda determinado por los rasgos residuales
+_KNOWN_FUNCTIONS = ('has_intensifier()', 'has_negation()', 'has_emoticon()',
+                    'is_question()', 'is_exclamation()')
+
+# Identificadores admitidos en una condición tras reemplazar las funciones
+_ALLOWED_NAMES = {'and', 'or', 'not', 'True', 'False'}
+
+# Plantillas máximas (los rasgos residuales casi siempre se repiten)
+MAX_TEMPLATES = 256
+
+
+class NeutralFastPath:
+    """Plantillas de resultado para textos sin coincidencias ni modificadores"""
+    
+    def __init__(self, preprocessor: TextPreprocessor, keyword_matcher: KeywordMatcher,
+                 tree_searcher: TreeSearcher):
+        if preprocessor.vocabulary is None or preprocessor.vocabulary is not keyword_matcher.vocabulary:
+            raise ConfigurationError("El preprocesador y la coincidencia de palabras deben compartir vocabulario")
+        
+        vocabulary = keyword_matcher.vocabulary
+        conditions = [node.condition for node in tree_searcher.tree.values() if node.condition]
+        
+        # Solo se habilita si todas las condiciones usan funciones conocidas
+        self.enabled = all(self._is_supported(condition) for condition in conditions)
+        self.uses_word_count = any('word_count' in condition for condition in conditions)
+        
+        # Tokens que sacan al texto de la ruta rápida: léxico, modificadores y
+        # palabras consultadas por has_keyword en el árbol
+        trigger_words = preprocessor.intensifiers | preprocessor.attenuators | preprocessor.negations
+        for condition in conditions:
+            trigger_words.update(word.lower() for _, word in _HAS_KEYWORD_PATTERN.findall(condition))
+        self._trigger_ids: FrozenSet[int] = frozenset(
+            [vocabulary.add_token(word) for word in sorted(trigger_words)] +
+            list(keyword_matcher.get_hit_index())
+        )
+        
+        self._templates: Dict[Tuple[int, int, int], Tuple[Dict[str, Any], List[str]]] = {}
+        self.hits = 0
+    
+    @staticmethod
+    def _is_supported(condition: str) -> bool:
+        """Indica si una condición solo usa funciones y variables conocidas"""
+        remainder = _HAS_KEYWORD_PATTERN.sub('True', condition)
+        for function in _KNOWN_FUNCTIONS:
+            remainder = remainder.replace(function, 'True')
+        remainder = remainder.replace('word_count', '0')
+        return set(re.findall(r'[A-Za-z_]\w*', remainder)) <= _ALLOWED_NAMES
+    
+    def is_eligible(self, preprocessed_data: Dict[str, Any]) -> bool:
+        """
+        Indica si un texto preprocesado puede resolverse con una plantilla
+        
+        Args:
+            preprocessed_data: Datos preprocesados del texto
+        
+        Returns:
+            True si el texto no tiene coincidencias, modificadores ni emoticones
+        """
+        token_ids = preprocessed_data.get('token_ids')
+        return (self.enabled and token_ids is not None
+                and not preprocessed_data.get('emoticons')
+                and self._trigger_ids.isdisjoint(token_ids))
+    
+    def _key(self, preprocessed_data: Dict[str, Any]) -> Tuple[int, int, int]:
+        """Rasgos residuales que aún pueden cambiar el resultado"""
+        return (preprocessed_data.get('word_count', 0) if self.uses_word_count else -1,
+                preprocessed_data.get('exclamation_count', 0),
+                preprocessed_data.get('question_count', 0))
+    
+    @staticmethod
+    def empty_matches() -> Dict[str, List[str]]:
+        """
+        Coincidencias de un texto elegible
+        
+        Returns:
+            Dict con una lista vacía por sentimiento
+        """
+        return {sentiment: [] for sentiment in SENTIMENTS}
+    
+    def get(self, preprocessed_data: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+        """
+        Obtiene la plantilla de un texto elegible
+        
+        Args:
+            preprocessed_data: Datos preprocesados del texto
+        
+        Returns:
+            Tupla (resumen, ruta del árbol) con contenedores propios, o None si
+            la combinación de rasgos aún no se calculó
+        """
+        template = self._templates.get(self._key(preprocessed_data))
+        if template is None:
+            return None
+        
+        self.hits += 1
+        summary, tree_path = template
+        copied = dict(summary)
+        copied['sentiments'] = dict(summary['sentiments'])
+        copied['secondary_sentiments'] = list(summary['secondary_sentiments'])
+        return copied, list(tree_path)
+    
+    def put(self, preprocessed_data: Dict[str, Any], summary: Dict[str, Any], tree_path: List[str]):
+        """
+        Registra la plantilla calculada por el pipeline completo
+        
+        Args:
+            preprocessed_data: Datos preprocesados del texto elegible
+            summary: Resumen devuelto por `ScoreNormalizer.summarize`
+            tree_path: Ruta recorrida en el árbol
+        """
+        if len(self._templates) >= MAX_TEMPLATES:
+            return
+        stored = dict(summary)
+        stored['sentiments'] = dict(summary['sentiments'])
+        stored['secondary_sentiments'] = list(summary['secondary_sentiments'])
+        self._templates.setdefault(self._key(preprocessed_data), (stored, list(tree_path)))
+    
+    def clear(self):
+        """Descarta las plantillas y reinicia las estadísticas"""
+        self._templates.clear()
+        self.hits = 0
+    
+    def memory_usage(self) -> int:
+        """
+        Estima los bytes ocupados por las plantillas y las palabras disparadoras
+        
+        Returns:
+            Tamaño aproximado en bytes
+        """
+        return deep_sizeof([self._trigger_ids, self._templates])
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas de la ruta rápida
+        
+        Returns:
+            Dict con habilitación, plantillas calculadas y textos resueltos
+        """
+        return {
+            'enabled': self.enabled,
+            'templates': len(self._templates),
+            'hits': self.hits
+        }
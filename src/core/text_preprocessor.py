@@ -11,13 +11,15 @@ import unicodedata
 from typing import Dict, List, Any
 from ..models.sentiment_result import SystemConfig
 from ..models.exceptions import InvalidInputError
+from ..utils.vocabulary import Vocabulary, OOV_ID
 
 
 class TextPreprocessor:
     """Preprocesador de texto"""
     
-    def __init__(self, config: SystemConfig):
+    def __init__(self, config: SystemConfig, vocabulary: Vocabulary = None):
         self.config = config
+        self.vocabulary = vocabulary
         self._setup_modifiers()
     
     def _setup_modifiers(self):
@@ -50,6 +52,10 @@ class TextPreprocessor:
             '🤒', '🤕', '🤢', '🤮', '🤧', '😈', '👿', '👹', '👺', '💀', '👻', '👽',
             '🤖', '💩', '😺', '😸', '😹', '😻', '😼', '😽', '🙀', '😿', '😾'
         }
+        
+        # Registrar modificadores en el vocabulario compartido
+        if self.vocabulary is not None:
+            self.vocabulary.add_tokens(sorted(self.intensifiers | self.attenuators | self.negations))
     
     def preprocess(self, text: str) -> Dict[str, Any]:
         """
@@ -74,6 +80,12 @@ class TextPreprocessor:
         # Tokenizar
         words = self._tokenize(cleaned_text)
         
+        # Codificar tokens con el vocabulario compartido
+        token_ids = None
+        if self.vocabulary is not None:
+            token_ids = self.vocabulary.encode(self._vocabulary_forms(words))
+            words = self.vocabulary.intern(words, token_ids)
+        
         # Extraer modificadores
         modifiers = self.extract_modifiers(words)
         
@@ -88,7 +100,7 @@ class TextPreprocessor:
         # Detectar emoticones
         emoticons = self._detect_emoticons(text)
         
-        return {
+        preprocessed = {
             'cleaned_text': cleaned_text,
             'words': words,
             'word_count': len(words),
@@ -102,6 +114,29 @@ class TextPreprocessor:
             'emoticons': emoticons,
             'processing_errors': []
         }
+        
+        if token_ids is not None:
+            preprocessed['token_ids'] = token_ids
+            preprocessed['oov_count'] = token_ids.count(OOV_ID)
+        
+        return preprocessed
+    
+    @staticmethod
+    def _vocabulary_forms(words: List[str]) -> List[str]:
+        """Formas de los tokens usadas como claves del vocabulario"""
+        return [word.lower().strip() for word in words]
+    
+    def vocabulary_tokens(self, text: str) -> List[str]:
+        """
+        Obtiene los tokens de un texto tal como se buscan en el vocabulario
+        
+        Args:
+            text: Texto original
+            
+        Returns:
+            Tokens limpios en su forma de vocabulario
+        """
+        return self._vocabulary_forms(self._tokenize(self._clean_text(text)))
     
     def validate_input(self, text: str) -> bool:
         """
@@ -10,7 +10,30 @@ import time
 import json
 from typing import Dict, List, Any, Optional
 from ..models.sentiment_result import SystemConfig, DecisionTreeNode
+from ..models.sentiment_vector import SENTIMENTS, SentimentVector
 from ..models.exceptions import TreeSearchError
+from ..utils.cache import StripedLRUCache
+
+
+class SearchContext:
+    """Estado de una búsqueda (uno por solicitud, nunca compartido entre hilos)"""
+    
+    __slots__ = ('start_time', 'nodes_visited', 'cache_hits', 'backtrack_count')
+    
+    def __init__(self):
+        self.start_time = time.time()
+        self.nodes_visited = 0
+        self.cache_hits = 0
+        self.backtrack_count = 0
+    
+    def to_stats(self) -> Dict[str, Any]:
+        """Estadísticas de la búsqueda"""
+        return {
+            'nodes_visited': self.nodes_visited,
+            'cache_hits': self.cache_hits,
+            'backtrack_count': self.backtrack_count,
+            'search_time': time.time() - self.start_time
+        }
 
 
 class TreeSearcher:
@@ -19,13 +42,18 @@ class TreeSearcher:
     def __init__(self, tree_data: Dict, config: SystemConfig):
         self.tree = self._build_tree(tree_data)
         self.config = config
-        self.memoization_cache = {} if config.enable_memoization else None
-        self.search_stats = {
-            'nodes_visited': 0,
-            'cache_hits': 0,
-            'backtrack_count': 0,
-            'search_time': 0.0
+        # Vectores de puntuaciones precompilados por nodo (solo lectura)
+        self.score_vectors = {
+            node_id: SentimentVector.from_dict(node.sentiment_scores)
+            for node_id, node in self.tree.items()
         }
+        self.memoization_cache = StripedLRUCache(
+            config.tree_search.get('cache_size', 1000),
+            config.tree_search.get('cache_stripes', 16),
+            config.tree_search.get('cache_max_bytes', 0)
+        ) if config.enable_memoization else None
+        # Estadísticas de la última búsqueda (se reemplazan, nunca se modifican en el lugar)
+        self.search_stats = SearchContext().to_stats()
     
     def search(self, preprocessed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -37,20 +65,19 @@ class TreeSearcher:
         Returns:
             Dict con resultados de la búsqueda
         """
-        start_time = time.time()
-        self.search_stats['nodes_visited'] = 0
-        self.search_stats['cache_hits'] = 0
-        self.search_stats['backtrack_count'] = 0
+        context = SearchContext()
         
         try:
             # Verificar cache si está habilitado
             cache_key = self._generate_cache_key(preprocessed_data)
-            if self.memoization_cache and cache_key in self.memoization_cache:
-                self.search_stats['cache_hits'] += 1
-                cached_result = self.memoization_cache[cache_key]
-                cached_result['cache_hits'] = self.search_stats['cache_hits']
-                cached_result['search_time'] = time.time() - start_time
-                return cached_result
+            cached_result = (self.memoization_cache.get(cache_key)
+                             if self.memoization_cache is not None else None)
+            if cached_result is not None:
+                context.cache_hits += 1
+                self.search_stats = context.to_stats()
+                # Copia propia: el resultado del cache nunca se modifica
+                return self._copy_result(cached_result, cache_hits=context.cache_hits,
+                                         search_time=self.search_stats['search_time'])
             
             # Realizar búsqueda
             path = []
@@ -60,7 +87,7 @@ class TreeSearcher:
             
             while current_node_id and len(path) < max_depth:
                 # Verificar timeout
-                if time.time() - start_time > timeout:
+                if time.time() - context.start_time > timeout:
                     raise TreeSearchError("Timeout en búsqueda del árbol")
                 
                 if current_node_id not in self.tree:
@@ -68,25 +95,27 @@ class TreeSearcher:
                 
                 current_node = self.tree[current_node_id]
                 path.append(current_node_id)
-                self.search_stats['nodes_visited'] += 1
+                context.nodes_visited += 1
                 
                 # Si es nodo hoja, retornar puntuaciones
                 if current_node.node_type == 'leaf':
+                    self.search_stats = context.to_stats()
                     result = {
                         'path': path,
                         'final_scores': current_node.sentiment_scores,
+                        'score_vector': self._get_score_vector(current_node),
                         'matched_keywords': self._extract_keywords_from_path(path),
-                        'confidence': self._calculate_path_confidence(path),
+                        'confidence': self._calculate_path_confidence(path, context),
                         'search_depth': len(path),
-                        'nodes_visited': self.search_stats['nodes_visited'],
-                        'search_time': time.time() - start_time,
-                        'cache_hits': self.search_stats['cache_hits'],
-                        'backtrack_count': self.search_stats['backtrack_count']
+                        'nodes_visited': context.nodes_visited,
+                        'search_time': self.search_stats['search_time'],
+                        'cache_hits': context.cache_hits,
+                        'backtrack_count': context.backtrack_count
                     }
                     
-                    # Guardar en cache si está habilitado
+                    # Guardar en cache una copia independiente del resultado devuelto
                     if self.memoization_cache is not None:
-                        self._add_to_cache(cache_key, result)
+                        self._add_to_cache(cache_key, self._copy_result(result))
                     
                     return result
                 
@@ -108,9 +137,51 @@ class TreeSearcher:
             raise TreeSearchError("No se pudo encontrar un nodo hoja en el árbol")
             
         except Exception as e:
-            self.search_stats['search_time'] = time.time() - start_time
+            self.search_stats = context.to_stats()
             raise TreeSearchError(f"Error en búsqueda del árbol: {str(e)}")
     
+    def search_scores(self, preprocessed_data: Dict[str, Any]) -> SentimentVector:
+        """
+        Obtiene solo el vector de puntuaciones de la hoja alcanzada
+        
+        Con un acierto del cache no se copian la ruta ni las palabras clave
+        del resultado almacenado.
+        
+        Args:
+            preprocessed_data: Datos preprocesados del texto
+            
+        Returns:
+            Vector de la hoja (compartido, de solo lectura)
+        """
+        if self.memoization_cache is not None:
+            cached_result = self.memoization_cache.get(self._generate_cache_key(preprocessed_data))
+            if cached_result is not None:
+                context = SearchContext()
+                context.cache_hits += 1
+                self.search_stats = context.to_stats()
+                return cached_result['score_vector']
+        return self.search(preprocessed_data)['score_vector']
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any], **overrides) -> Dict[str, Any]:
+        """
+        Copia un resultado de búsqueda sin compartir sus contenedores mutables
+        
+        Args:
+            result: Resultado a copiar
+            **overrides: Campos a reemplazar en la copia
+            
+        Returns:
+            Copia del resultado
+        """
+        copied = dict(result)
+        copied['path'] = list(result['path'])
+        copied['matched_keywords'] = {
+            sentiment: list(words) for sentiment, words in result['matched_keywords'].items()
+        }
+        copied.update(overrides)
+        return copied
+    
     def evaluate_condition(self, condition: str, data: Dict[str, Any]) -> bool:
         """
         Evalúa una condición del árbol
@@ -253,14 +324,7 @@ class TreeSearcher:
         Returns:
             Dict con palabras clave por sentimiento
         """
-        keywords = {
-            'alegria': [],
-            'tristeza': [],
-            'enojo': [],
-            'preocupacion': [],
-            'informacion': [],
-            'sorpresa': []
-        }
+        keywords = {sentiment: [] for sentiment in SENTIMENTS}
         
         for node_id in path:
             if node_id in self.tree:
@@ -277,12 +341,29 @@ class TreeSearcher:
         
         return keywords
     
-    def _calculate_path_confidence(self, path: List[str]) -> float:
+    def _get_score_vector(self, node: DecisionTreeNode) -> SentimentVector:
+        """
+        Obtiene el vector precompilado de un nodo
+        
+        Args:
+            node: Nodo del árbol
+            
+        Returns:
+            Vector de puntuaciones compartido (no debe modificarse)
+        """
+        vector = self.score_vectors.get(node.id)
+        if vector is None:
+            vector = SentimentVector.from_dict(node.sentiment_scores)
+            self.score_vectors[node.id] = vector
+        return vector
+    
+    def _calculate_path_confidence(self, path: List[str], context: SearchContext = None) -> float:
         """
         Calcula la confianza basada en la ruta recorrida
         
         Args:
             path: Ruta recorrida en el árbol
+            context: Estado de la búsqueda (por defecto, el de la última búsqueda)
             
         Returns:
             Valor de confianza
@@ -293,11 +374,13 @@ class TreeSearcher:
         # Confianza base basada en la profundidad
         depth_confidence = min(1.0, len(path) / 5.0)
         
+        stats = context.to_stats() if context is not None else self.search_stats
+        
         # Confianza adicional por nodos visitados
-        node_confidence = min(1.0, self.search_stats['nodes_visited'] / 10.0)
+        node_confidence = min(1.0, stats['nodes_visited'] / 10.0)
         
         # Confianza por eficiencia (menos backtracking = mejor)
-        efficiency_confidence = max(0.5, 1.0 - (self.search_stats['backtrack_count'] / 5.0))
+        efficiency_confidence = max(0.5, 1.0 - (stats['backtrack_count'] / 5.0))
         
         # Promedio ponderado
         confidence = (
@@ -328,31 +411,113 @@ class TreeSearcher:
     
     def _add_to_cache(self, key: str, result: Dict[str, Any]):
         """
-        Agrega resultado al cache
+        Agrega resultado al cache (el menos usado se expulsa al superar la capacidad)
         
         Args:
             key: Clave del cache
             result: Resultado a cachear
         """
-        if not self.memoization_cache:
+        if self.memoization_cache is None:
             return
         
-        cache_size = self.config.tree_search.get('cache_size', 1000)
+        self.memoization_cache.put(key, result)
+    
+    def export_cache(self) -> List[Dict[str, Any]]:
+        """
+        Exporta las entradas del cache de memoización en formato serializable
         
-        # Si el cache está lleno, remover elemento menos usado
-        if len(self.memoization_cache) >= cache_size:
-            self._evict_least_used()
+        Returns:
+            Lista de entradas con la clave, la ruta y los datos de la búsqueda
+            (las puntuaciones se reconstruyen desde la hoja al importar)
+        """
+        if self.memoization_cache is None:
+            return []
+        
+        return [
+            {
+                'key': key,
+                'path': list(result['path']),
+                'matched_keywords': result['matched_keywords'],
+                'confidence': result['confidence'],
+                'nodes_visited': result['nodes_visited'],
+                'backtrack_count': result['backtrack_count']
+            }
+            for key, result in self.memoization_cache.items()
+        ]
+    
+    def import_cache(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Importa entradas exportadas con `export_cache`
         
-        self.memoization_cache[key] = result
+        Args:
+            entries: Entradas exportadas
+            
+        Returns:
+            Número de entradas importadas (se omiten las que no terminan en una hoja)
+        """
+        if self.memoization_cache is None:
+            return 0
+        
+        count = 0
+        for entry in entries:
+            path = list(entry['path'])
+            leaf = self.tree.get(path[-1]) if path else None
+            if leaf is None or leaf.node_type != 'leaf':
+                continue
+            
+            self._add_to_cache(entry['key'], {
+                'path': path,
+                'final_scores': leaf.sentiment_scores,
+                'score_vector': self._get_score_vector(leaf),
+                'matched_keywords': {sentiment: list(words)
+                                     for sentiment, words in entry['matched_keywords'].items()},
+                'confidence': entry['confidence'],
+                'search_depth': len(path),
+                'nodes_visited': entry['nodes_visited'],
+                'search_time': 0.0,
+                'cache_hits': 0,
+                'backtrack_count': entry['backtrack_count']
+            })
+            count += 1
+        return count
     
-    def _evict_least_used(self):
-        """Remueve el elemento menos usado del cache"""
-        if not self.memoization_cache:
-            return
+    def get_leaf_paths(self) -> Dict[str, List[str]]:
+        """
+        Obtiene la ruta de búsqueda de cada hoja alcanzable por un único camino
+        
+        Returns:
+            Dict {id de hoja: ruta desde la raíz}; las hojas alcanzables por
+            varias ramas se omiten porque la hoja no determina la ruta
+        """
+        max_depth = self.config.tree_search.get('max_depth', 10)
+        paths = {}
+        ambiguous = set()
+        pending = [['root']] if 'root' in self.tree else []
+        
+        while pending:
+            path = pending.pop()
+            node = self.tree.get(path[-1])
+            if node is None:
+                continue
+            
+            if node.node_type == 'leaf':
+                if node.id in paths:
+                    ambiguous.add(node.id)
+                paths.setdefault(node.id, path)
+                continue
+            
+            # Mismas ramas que sigue `search`
+            if node.condition:
+                targets = {node.branches.get('true'), node.branches.get('false')}
+            else:
+                targets = {node.branches.get('default', node.branches.get('true'))}
+            
+            if len(path) < max_depth:
+                for target in targets:
+                    if target and target not in path:
+                        pending.append(path + [target])
         
-        # Implementación simple: remover el primer elemento
-        first_key = next(iter(self.memoization_cache))
-        del self.memoization_cache[first_key]
+        return {leaf_id: path for leaf_id, path in paths.items() if leaf_id not in ambiguous}
     
     def get_tree_info(self) -> Dict[str, Any]:
         """
@@ -374,5 +539,5 @@ class TreeSearcher:
             'leaf_nodes': leaf_count,
             'decision_nodes': decision_count,
             'max_depth': max_depth,
-            'cache_size': len(self.memoization_cache) if self.memoization_cache else 0
+            'cache_size': len(self.memoization_cache) if self.memoization_cache is not None else 0
         } 
\ No newline at end of file
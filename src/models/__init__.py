@@ -6,4 +6,12 @@ Contiene los modelos de datos del sistema:
 - decision_tree: Modelo del árbol de decisión
 - sentiment_analyzer: Analizador principal
 - sentiment_result: Estructura de resultados
+- sentiment_vector: Esquema y vector de sentimientos de orden fijo
+- parallel_batch: Procesamiento en lote con un grupo de procesos
+- async_batching: Micro-lotes para la API asíncrona
+- result_cache: Caches de resultados completos del análisis (memoria y SQLite)
+- shared_cache: Cache de resultados en memoria compartida entre procesos
+- cache_snapshot: Instantáneas de los caches para la precarga
+- pipeline: Pipeline de etapas especializado según la configuración
+- result_batch: Resultados de un lote en columnas compactas
 """ 
\ No newline at end of file
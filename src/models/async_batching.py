@@ -0,0 +1,135 @@
+"""
+Micro-lotes Asíncronos
+======================
+
+Módulo responsable de agrupar solicitudes asyncio en micro-lotes. Las
+solicitudes se encolan y se despachan en lotes de hasta N textos o cuando
+vence un intervalo de T milisegundos desde la primera solicitud del lote;
+cada lote se ejecuta en un ejecutor sin bloquear el bucle de eventos y un
+semáforo limita el número de solicitudes en curso.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Sequence, Tuple
+
+
+# Resultado de analizar un texto: (éxito, resultado o excepción)
+Outcome = Tuple[bool, Any]
+
+
+class MicroBatcher:
+    """Agrupador de solicitudes asíncronas en micro-lotes"""
+    
+    def __init__(self, analyze_batch: Callable[[Sequence[str]], List[Outcome]],
+                 max_batch_size: int = 32, flush_interval_ms: float = 5,
+                 max_in_flight: int = 256, executor: Executor = None):
+        """
+        Args:
+            analyze_batch: Función síncrona que analiza un lote completo
+            max_batch_size: Textos máximos por lote
+            flush_interval_ms: Espera máxima desde la primera solicitud del lote
+            max_in_flight: Solicitudes máximas encoladas o en ejecución
+            executor: Ejecutor de los lotes (por defecto, el del bucle de eventos)
+        """
+        self._loop = asyncio.get_running_loop()
+        self._analyze_batch = analyze_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.flush_interval = max(0.0, flush_interval_ms / 1000.0)
+        self._executor = executor
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max(1, int(max_in_flight)))
+        self._collector = None
+        self._dispatches = set()
+        self.stats = {'batches': 0, 'items': 0}
+    
+    async def submit(self, text: str) -> Any:
+        """
+        Encola un texto y espera su resultado
+        
+        Args:
+            text: Texto a analizar
+        
+        Returns:
+            Resultado del análisis (las excepciones del análisis se propagan)
+        """
+        await self._semaphore.acquire()
+        future = self._loop.create_future()
+        future.add_done_callback(lambda _: self._semaphore.release())
+        
+        if self._collector is None or self._collector.done():
+            self._collector = self._loop.create_task(self._collect())
+        
+        self._queue.put_nowait((text, future))
+        return await future
+    
+    async def _collect(self):
+        """Forma lotes a partir de la cola y los despacha sin esperar su resultado"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.flush_interval
+            
+            while len(batch) < self.max_batch_size:
+                # Tomar primero lo que ya está encolado, sin esperar
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """
+        Ejecuta un lote en el ejecutor y resuelve los futuros de sus solicitudes
+        
+        Args:
+            batch: Pares (texto, futuro) del lote
+        """
+        # Las solicitudes canceladas mientras esperaban no se analizan
+        live = [(text, future) for text, future in batch if not future.done()]
+        if not live:
+            return
+        
+        self.stats['batches'] += 1
+        self.stats['items'] += len(live)
+        
+        try:
+            outcomes = await self._loop.run_in_executor(
+                self._executor, self._analyze_batch, [text for text, _ in live]
+            )
+        except Exception as e:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), (success, value) in zip(live, outcomes):
+            if future.done():
+                continue
+            if success:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+    
+    async def close(self):
+        """Detiene la formación de lotes y espera los lotes en ejecución"""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+        
+        # Solicitudes encoladas que ya no se despacharán
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        
+        await asyncio.gather(*self._dispatches, return_exceptions=True)
@@ -0,0 +1,101 @@
+"""
+Instantáneas de Cache
+=====================
+
+Módulo responsable de exportar e importar el contenido de los caches del
+analizador (memoización del árbol y resultados completos) en un archivo
+JSON comprimido con gzip. Cada instantánea registra la huella de la
+configuración y los recursos con que se generó; una instantánea de otra
+versión del léxico, el árbol o la configuración se rechaza al importarla.
+"""
+
+import gzip
+import json
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, List
+from .exceptions import ConfigurationError
+
+
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot(path: str, fingerprint: str, tree_cache: List[Dict[str, Any]],
+                   result_cache: List[List[Any]]):
+    """
+    Escribe una instantánea de los caches (reemplazo atómico del archivo)
+    
+    Args:
+        path: Ruta del archivo
+        fingerprint: Huella de la configuración y los recursos
+        tree_cache: Entradas de `TreeSearcher.export_cache`
+        result_cache: Entradas de `ResultCache.export_entries`
+    """
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'fingerprint': fingerprint,
+        'created_at': time.time(),
+        'tree_cache': tree_cache,
+        'result_cache': result_cache
+    }
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path: str, fingerprint: str) -> Dict[str, Any]:
+    """
+    Lee una instantánea y valida que corresponda a la huella actual
+    
+    Args:
+        path: Ruta del archivo
+        fingerprint: Huella de la configuración y los recursos actuales
+    
+    Returns:
+        Dict con 'tree_cache' y 'result_cache'
+    
+    Raises:
+        ConfigurationError: Si el archivo no es válido o su huella no coincide
+    """
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        raise ConfigurationError(f"Instantánea de cache inválida: {str(e)}")
+    
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ConfigurationError("Versión de instantánea de cache no soportada")
+    if snapshot.get('fingerprint') != fingerprint:
+        raise ConfigurationError("La instantánea de cache corresponde a otra configuración o recursos")
+    
+    return {
+        'tree_cache': snapshot.get('tree_cache', []),
+        'result_cache': snapshot.get('result_cache', [])
+    }
+
+
+def read_top_texts(path: str, top_n: int) -> List[str]:
+    """
+    Obtiene los textos más frecuentes de un archivo (uno por línea)
+    
+    Args:
+        path: Ruta del archivo
+        top_n: Número de textos a obtener
+    
+    Returns:
+        Textos ordenados de mayor a menor frecuencia
+    """
+    counts = Counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            text = line.strip()
+            if text:
+                counts[text] += 1
+    return [text for text, _ in counts.most_common(top_n)]
@@ -0,0 +1,291 @@
+"""
+Procesamiento Paralelo en Lote
+==============================
+
+Módulo responsable de repartir lotes de textos entre un grupo de procesos.
+Cada proceso construye su analizador una sola vez a partir de los recursos
+ya cargados por el proceso principal y analiza bloques completos de textos,
+de modo que el costo de comunicación se amortiza por bloque y no por texto.
+
+Donde el sistema lo permite, los procesos se crean con `fork` después de
+cargar y compilar todo en el proceso principal: los trabajadores heredan el
+analizador (árbol, índice del léxico y tablas) en páginas compartidas
+copy-on-write y no reconstruyen nada al iniciar. Si está configurado, el
+cache de resultados en memoria compartida se crea antes del `fork` y todos
+los trabajadores lo usan.
+"""
+
+import gc
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+from .sentiment_result import SentimentResult, SystemConfig
+from .exceptions import ConfigurationError
+from ..utils.log_queue import paused_for_fork
+
+
+# Analizador del proceso trabajador (uno por proceso)
+_worker_analyzer = None
+
+# Analizador del proceso principal heredado por los trabajadores creados con fork
+_shared_analyzer = None
+
+
+def _init_worker(config: SystemConfig, resources: Dict[str, Any]):
+    """
+    Inicializa el analizador del proceso trabajador
+    
+    Args:
+        config: Configuración del sistema
+        resources: Recursos cargados por el proceso principal
+    """
+    global _worker_analyzer
+    from .sentiment_analyzer import SentimentAnalyzer
+    _worker_analyzer = SentimentAnalyzer(config, resources=resources)
+
+
+def _init_forked_worker():
+    """Adopta el analizador heredado del proceso principal (sin reconstruirlo)"""
+    global _worker_analyzer
+    _worker_analyzer = _shared_analyzer
+
+
+def _analyze_chunk(chunk: List[str]) -> List[SentimentResult]:
+    """
+    Analiza un bloque de textos en el proceso trabajador
+    
+    Args:
+        chunk: Textos del bloque
+    
+    Returns:
+        Resultados en el mismo orden que los textos
+    """
+    # El proceso principal consulta y actualiza el cache persistente por lotes
+    return [_worker_analyzer.analyze_or_error(text, persistent=False) for text in chunk]
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Obtiene el número efectivo de procesos
+    
+    Args:
+        workers: Número solicitado (0 o negativo = todos los núcleos)
+    
+    Returns:
+        Número de procesos (al menos 1)
+    """
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def resolve_start_method(start_method: str) -> str:
+    """
+    Obtiene el método de inicio de procesos
+    
+    Args:
+        start_method: 'auto', 'fork', 'spawn' o 'forkserver'
+    
+    Returns:
+        Método a usar ('auto' elige 'fork' si está disponible)
+    
+    Raises:
+        ConfigurationError: Si el método no está disponible en el sistema
+    """
+    available = multiprocessing.get_all_start_methods()
+    if start_method in (None, 'auto'):
+        return 'fork' if 'fork' in available else multiprocessing.get_start_method()
+    if start_method not in available:
+        raise ConfigurationError(f"Método de inicio de procesos no disponible: {start_method}")
+    return start_method
+
+
+@contextmanager
+def worker_pool(analyzer, workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Crea el grupo de procesos trabajadores
+    
+    Con 'fork' el estado del proceso principal se congela con `gc.freeze()`
+    antes de crear los procesos, para que el recolector de basura de los
+    trabajadores no escriba en las páginas heredadas y estas sigan
+    compartidas; el congelamiento se revierte al cerrar el grupo, salvo que
+    el proceso ya estuviera congelado al entrar (p. ej. un servidor prefork).
+    Los procesos se crean con el listener de logs detenido.
+    
+    Args:
+        analyzer: Analizador del proceso principal (ya inicializado)
+        workers: Número de procesos
+    
+    Returns:
+        Ejecutor del grupo de procesos
+    """
+    global _shared_analyzer
+    start_method = resolve_start_method(analyzer.config.batch_processing.get('start_method', 'auto'))
+    context = multiprocessing.get_context(start_method)
+    
+    if start_method != 'fork':
+        # Los trabajadores reconstruyen el analizador con los recursos ya cargados
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(analyzer.config, analyzer.get_resources())) as executor:
+            yield executor
+        return
+    
+    # Cache de resultados compartido por los trabajadores heredados
+    analyzer.enable_shared_cache()
+    _shared_analyzer = analyzer
+    thawed = gc.get_freeze_count() == 0
+    gc.collect()
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_forked_worker) as executor:
+            # Con 'fork' el grupo crea todos los procesos en el primer envío
+            with paused_for_fork():
+                executor.submit(os.getpid)
+            yield executor
+    finally:
+        if thawed:
+            gc.unfreeze()
+        _shared_analyzer = None
+
+
+def tune_chunk_size(per_item_seconds: float, remaining: int, workers: int,
+                    target_chunk_seconds: float) -> int:
+    """
+    Calcula el tamaño de bloque a partir del costo medido por texto
+    
+    El bloque debe durar al menos `target_chunk_seconds` para amortizar el
+    envío entre procesos, pero sin superar una cuarta parte de la porción de
+    cada proceso, para que la carga siga equilibrada al final del lote.
+    
+    Args:
+        per_item_seconds: Tiempo medido por texto
+        remaining: Textos pendientes
+        workers: Número de procesos
+        target_chunk_seconds: Duración objetivo de cada bloque
+    
+    Returns:
+        Tamaño de bloque (al menos 1)
+    """
+    by_cost = math.ceil(target_chunk_seconds / per_item_seconds) if per_item_seconds > 0 else remaining
+    by_balance = math.ceil(remaining / (workers * 4))
+    return max(1, min(by_cost, by_balance))
+
+
+def parallel_analyze(analyzer, texts: List[str], workers: int) -> List[SentimentResult]:
+    """
+    Analiza un lote de textos repartiéndolo entre procesos
+    
+    Los primeros textos se analizan en el proceso principal para medir el
+    costo por texto (sus resultados se conservan); el resto se divide en
+    bloques que se envían al grupo de procesos. `executor.map` devuelve los
+    bloques en orden, por lo que los resultados conservan el orden de entrada.
+    
+    Args:
+        analyzer: Analizador del proceso principal
+        texts: Textos a analizar
+        workers: Número de procesos
+    
+    Returns:
+        Resultados en el mismo orden que los textos
+    """
+    settings = analyzer.config.batch_processing
+    sample_size = min(len(texts), max(1, int(settings.get('sample_size', 8))))
+    
+    # Medir el costo por texto con una muestra analizada localmente
+    start_time = time.perf_counter()
+    results = [analyzer.analyze_or_error(text, persistent=False) for text in texts[:sample_size]]
+    per_item_seconds = (time.perf_counter() - start_time) / sample_size
+    
+    remaining = texts[sample_size:]
+    if not remaining:
+        return results
+    
+    chunk_size = int(settings.get('chunk_size') or 0)
+    if chunk_size <= 0:
+        chunk_size = tune_chunk_size(per_item_seconds, len(remaining), workers,
+                                     settings.get('target_chunk_ms', 50) / 1000.0)
+    
+    chunks = [remaining[i:i + chunk_size] for i in range(0, len(remaining), chunk_size)]
+    analyzer.logger.debug("Lote paralelo: %d procesos, %d bloques de %d textos (%.2f ms/texto)",
+                          workers, len(chunks), chunk_size, per_item_seconds * 1000)
+    
+    with worker_pool(analyzer, min(workers, len(chunks))) as executor:
+        for chunk_results in executor.map(_analyze_chunk, chunks):
+            results.extend(chunk_results)
+    
+    return results
+
+
+def pool_analyze(executor: ProcessPoolExecutor, texts: List[str], workers: int) -> List[SentimentResult]:
+    """
+    Analiza un lote con un grupo de procesos ya creado (un bloque por proceso)
+    
+    Args:
+        executor: Grupo de procesos de `worker_pool`
+        texts: Textos a analizar
+        workers: Número de procesos del grupo
+    
+    Returns:
+        Resultados en el mismo orden que los textos
+    """
+    chunk_size = max(1, math.ceil(len(texts) / workers))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    results = []
+    for chunk_results in executor.map(_analyze_chunk, chunks):
+        results.extend(chunk_results)
+    return results
+
+
+def iter_chunks(texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Divide un iterable de textos en bloques consumiéndolo bajo demanda
+    
+    Args:
+        texts: Textos de entrada (cualquier iterable)
+        chunk_size: Textos por bloque
+    
+    Returns:
+        Iterador de bloques (el último puede ser más corto)
+    """
+    iterator = iter(texts)
+    return iter(lambda: list(islice(iterator, chunk_size)), [])
+
+
+def parallel_stream(analyzer, texts: Iterable[str], workers: int, chunk_size: int,
+                    max_pending: int) -> Iterator[SentimentResult]:
+    """
+    Analiza un flujo de textos repartiendo bloques entre procesos
+    
+    A diferencia de `parallel_analyze`, la entrada se lee por bloques y nunca
+    hay más de `max_pending` bloques leídos sin entregar: un nuevo bloque se
+    envía al grupo solo después de entregar los resultados del más antiguo,
+    de modo que la memoria no depende del tamaño de la entrada.
+    
+    Args:
+        analyzer: Analizador del proceso principal
+        texts: Textos de entrada (cualquier iterable)
+        workers: Número de procesos
+        chunk_size: Textos por bloque
+        max_pending: Bloques enviados y aún no entregados
+    
+    Returns:
+        Iterador de resultados en el orden de los textos
+    """
+    pending = deque()
+    with worker_pool(analyzer, workers) as executor:
+        for chunk in iter_chunks(texts, chunk_size):
+            pending.append(executor.submit(_analyze_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,413 @@
+"""
+Pipeline de Análisis Especializado
+==================================
+
+Módulo que arma, al construir el analizador, la secuencia de etapas del
+análisis a partir de la configuración. Las etapas deshabilitadas (lógica
+difusa, alcance de modificadores, ruta rápida, cache compartido) no forman
+parte del pipeline y los campos de salida excluidos en `output_format` no se
+calculan, de modo que cada solicitud solo ejecuta el trabajo necesario.
+
+Perfiles predefinidos:
+- throughput: solo puntuaciones, confianza y ranking de sentimientos
+- explain: todos los campos de explicación (palabras clave, ruta y modificadores)
+"""
+
+from typing import Any, Dict, List, Optional
+from .sentiment_result import SystemConfig
+from .sentiment_vector import SentimentVector
+from .exceptions import ConfigurationError
+
+
+# Campos de explicación de cada perfil en `output_format`
+PROFILES = {
+    'throughput': {
+        'include_processing_time': False,
+        'include_matched_keywords': False,
+        'include_tree_path': False,
+        'include_modifiers': False
+    },
+    'explain': {
+        'include_processing_time': True,
+        'include_matched_keywords': True,
+        'include_tree_path': True,
+        'include_modifiers': True
+    }
+}
+
+
+def apply_profile(config: SystemConfig, profile: str) -> SystemConfig:
+    """
+    Aplica un perfil predefinido a los campos de salida de la configuración
+    
+    Args:
+        config: Configuración a modificar
+        profile: Nombre del perfil ('throughput' o 'explain')
+    
+    Returns:
+        La misma configuración
+    
+    Raises:
+        ConfigurationError: Si el perfil no existe
+    """
+    if profile not in PROFILES:
+        raise ConfigurationError(f"Perfil de pipeline desconocido: {profile}")
+    config.output_format.update(PROFILES[profile])
+    return config
+
+
+class AnalysisContext:
+    """Estado de una solicitud a lo largo de las etapas"""
+    
+    __slots__ = ('text', 'preprocessed', 'keyword_total', 'modifiers',
+                 'neutral', 'scores', 'summary', 'tree_path')
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.preprocessed = None
+        self.keyword_total = 0         # Número de coincidencias (para la confianza)
+        self.modifiers = None
+        self.neutral = False
+        self.scores = None
+        self.summary = None
+        self.tree_path = None
+
+
+class Stage:
+    """Etapa del pipeline"""
+    
+    name = 'stage'
+    
+    # Mensaje de depuración con el valor producido por la etapa (None = sin mensaje)
+    debug_message: Optional[str] = None
+    
+    def run(self, context: AnalysisContext):
+        """
+        Ejecuta la etapa sobre el contexto de la solicitud
+        
+        Args:
+            context: Estado de la solicitud (se modifica)
+        """
+        raise NotImplementedError
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        """Valor registrado en el mensaje de depuración"""
+        return None
+
+
+class PreprocessStage(Stage):
+    """1. Preprocesamiento"""
+    
+    name = 'preprocess'
+    debug_message = "Datos preprocesados: %s"
+    
+    def __init__(self, preprocessor):
+        self.preprocessor = preprocessor
+    
+    def run(self, context: AnalysisContext):
+        context.preprocessed = self.preprocessor.preprocess(context.text)
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.preprocessed
+
+
+class NeutralCheckStage(Stage):
+    """Detección de textos sin coincidencias, modificadores ni emoticones"""
+    
+    name = 'neutral_check'
+    
+    def __init__(self, fast_path):
+        self.fast_path = fast_path
+    
+    def run(self, context: AnalysisContext):
+        context.neutral = self.fast_path.is_eligible(context.preprocessed)
+
+
+class KeywordStage(Stage):
+    """2. Coincidencia de palabras clave"""
+    
+    name = 'keywords'
+    debug_message = "Coincidencias de palabras clave: %s"
+    
+    def __init__(self, keyword_matcher):
+        """
+        Args:
+            keyword_matcher: Coincidencia de palabras clave (las palabras solo se
+                cuentan; el resultado las obtiene al consultar su explicación)
+        """
+        self.keyword_matcher = keyword_matcher
+    
+    def run(self, context: AnalysisContext):
+        if not context.neutral:
+            context.keyword_total = self.keyword_matcher.count_matches_by_ids(context.preprocessed['token_ids'])
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.keyword_total
+
+
+class ModifierStage(Stage):
+    """Modificadores del texto para la lógica difusa"""
+    
+    name = 'modifiers'
+    
+    def run(self, context: AnalysisContext):
+        preprocessed = context.preprocessed
+        context.modifiers = {
+            'intensifiers': preprocessed.get('intensifiers', []),
+            'attenuators': preprocessed.get('attenuators', []),
+            'negations': preprocessed.get('negations', []),
+            'emoticons': preprocessed.get('emoticons', []),
+            'exclamation_count': preprocessed.get('exclamation_count', 0),
+            'question_count': preprocessed.get('question_count', 0)
+        }
+
+
+class TemplateLookupStage(Stage):
+    """Plantilla de la ruta rápida para textos neutrales"""
+    
+    name = 'template_lookup'
+    
+    def __init__(self, fast_path):
+        self.fast_path = fast_path
+    
+    def run(self, context: AnalysisContext):
+        if context.neutral:
+            template = self.fast_path.get(context.preprocessed)
+            if template is not None:
+                context.summary, context.tree_path = template
+
+
+class SharedLookupStage(Stage):
+    """Resultado ya calculado por otro proceso del grupo"""
+    
+    name = 'shared_lookup'
+    
+    def __init__(self, shared_cache):
+        self.shared_cache = shared_cache
+    
+    def run(self, context: AnalysisContext):
+        shared = self.shared_cache.get(context.text)
+        if shared is not None:
+            context.summary, context.tree_path = shared
+
+
+class TreeStage(Stage):
+    """3. Búsqueda en árbol de decisión"""
+    
+    name = 'tree'
+    debug_message = "Ruta del árbol: %s"
+    
+    def __init__(self, tree_searcher):
+        self.tree_searcher = tree_searcher
+    
+    def run(self, context: AnalysisContext):
+        tree_results = self.tree_searcher.search(context.preprocessed)
+        # Copia del vector de la hoja (las etapas siguientes lo modifican)
+        context.scores = tree_results['score_vector'].copy()
+        context.tree_path = tree_results.get('path', [])
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.tree_path
+
+
+class TreeScoresStage(Stage):
+    """3. Búsqueda en árbol de decisión (solo puntuaciones, sin ruta)"""
+    
+    name = 'tree_scores'
+    debug_message = "Puntuaciones de la hoja: %s"
+    
+    def __init__(self, tree_searcher):
+        self.tree_searcher = tree_searcher
+    
+    def run(self, context: AnalysisContext):
+        # Copia del vector de la hoja (las etapas siguientes lo modifican)
+        context.scores = self.tree_searcher.search_scores(context.preprocessed).copy()
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.scores
+
+
+class FuzzyStage(Stage):
+    """4. Lógica difusa"""
+    
+    name = 'fuzzy'
+    debug_message = "Puntuaciones ajustadas por lógica difusa: %s"
+    
+    def __init__(self, fuzzy_processor, scope_engine=None):
+        self.fuzzy_processor = fuzzy_processor
+        self.scope_engine = scope_engine
+    
+    def run(self, context: AnalysisContext):
+        # Alcance posicional: cada modificador afecta solo a las siguientes coincidencias
+        scoped = (self.scope_engine.scope(context.preprocessed['token_ids'])
+                  if self.scope_engine is not None else None)
+        self.fuzzy_processor.apply_fuzzy_rules_vector(context.scores, context.modifiers, scoped)
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.scores
+
+
+class SummaryStage(Stage):
+    """5-6. Normalización, confianza y ranking de sentimientos"""
+    
+    name = 'summary'
+    debug_message = "Puntuaciones normalizadas: %s"
+    
+    def __init__(self, normalizer):
+        self.normalizer = normalizer
+    
+    def run(self, context: AnalysisContext):
+        # El resultado recibe el vector y construye el diccionario al consultarlo
+        context.summary = self.normalizer.summarize(context.scores, {},
+                                                    keyword_total=context.keyword_total,
+                                                    as_vector=True)
+    
+    def debug_value(self, context: AnalysisContext) -> Any:
+        return context.summary['sentiments']
+
+
+def _with_sentiment_dict(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Resumen con las puntuaciones como diccionario (formato de los caches)"""
+    sentiments = summary['sentiments']
+    if isinstance(sentiments, SentimentVector):
+        return dict(summary, sentiments=sentiments.to_dict())
+    return summary
+
+
+class SharedStoreStage(Stage):
+    """Publicación del resultado para los demás procesos del grupo"""
+    
+    name = 'shared_store'
+    
+    def __init__(self, shared_cache):
+        self.shared_cache = shared_cache
+    
+    def run(self, context: AnalysisContext):
+        self.shared_cache.put(context.text, _with_sentiment_dict(context.summary), context.tree_path)
+
+
+class TemplateStoreStage(Stage):
+    """Registro de la plantilla de un texto neutral"""
+    
+    name = 'template_store'
+    
+    def __init__(self, fast_path):
+        self.fast_path = fast_path
+    
+    def run(self, context: AnalysisContext):
+        if context.neutral:
+            self.fast_path.put(context.preprocessed, _with_sentiment_dict(context.summary),
+                               context.tree_path or [])
+
+
+class AnalysisPipeline:
+    """Secuencia de etapas especializada para una configuración"""
+    
+    def __init__(self, prepare: List[Stage], lookup: List[Stage], score: List[Stage],
+                 store: List[Stage], output_format: Dict[str, Any]):
+        """
+        Args:
+            prepare: Etapas que se ejecutan siempre
+            lookup: Consultas de resultados ya calculados (se detienen en el primer acierto)
+            score: Etapas de puntuación (solo si ninguna consulta acertó)
+            store: Etapas que publican un resultado recién calculado
+            output_format: Campos de salida incluidos
+        """
+        self.prepare = tuple(prepare)
+        self.lookup = tuple(lookup)
+        self.score = tuple(score)
+        self.store = tuple(store)
+        self.include_processing_time = output_format.get('include_processing_time', True)
+        self.include_matched_keywords = output_format.get('include_matched_keywords', True)
+        self.include_tree_path = output_format.get('include_tree_path', True)
+        self.include_modifiers = output_format.get('include_modifiers', True)
+        self.include_explanation = (self.include_matched_keywords or self.include_tree_path
+                                    or self.include_modifiers)
+    
+    @property
+    def stage_names(self) -> List[str]:
+        """Nombres de las etapas en orden de ejecución"""
+        return [stage.name for stage in self.prepare + self.lookup + self.score + self.store]
+    
+    def run(self, text: str, logger=None) -> AnalysisContext:
+        """
+        Ejecuta las etapas sobre un texto
+        
+        Args:
+            text: Texto a analizar
+            logger: Logger para los mensajes de depuración (None = sin mensajes)
+        
+        Returns:
+            Contexto con el resumen, la ruta y los datos de explicación
+        """
+        context = AnalysisContext(text)
+        for stage in self.prepare:
+            stage.run(context)
+            if logger is not None and stage.debug_message:
+                logger.debug(stage.debug_message, stage.debug_value(context))
+        
+        for stage in self.lookup:
+            stage.run(context)
+            if context.summary is not None:
+                return context
+        
+        for stage in self.score:
+            stage.run(context)
+            if logger is not None and stage.debug_message:
+                logger.debug(stage.debug_message, stage.debug_value(context))
+        for stage in self.store:
+            stage.run(context)
+        return context
+
+
+def build_pipeline(config: SystemConfig, preprocessor, keyword_matcher, tree_searcher,
+                   fuzzy_processor, normalizer, scope_engine=None, fast_path=None,
+                   shared_cache=None) -> AnalysisPipeline:
+    """
+    Arma el pipeline con las etapas habilitadas en la configuración
+    
+    Args:
+        config: Configuración del sistema
+        preprocessor: Preprocesador de texto
+        keyword_matcher: Coincidencia de palabras clave
+        tree_searcher: Buscador en el árbol de decisión
+        fuzzy_processor: Procesador de lógica difusa
+        normalizer: Normalizador de puntuaciones
+        scope_engine: Motor de alcance de modificadores (opcional)
+        fast_path: Ruta rápida para textos neutrales (opcional)
+        shared_cache: Cache compartido entre procesos (opcional)
+    
+    Returns:
+        Pipeline especializado
+    """
+    output_format = config.output_format
+    use_fast_path = fast_path is not None and fast_path.enabled
+    
+    prepare: List[Stage] = [PreprocessStage(preprocessor)]
+    if use_fast_path:
+        prepare.append(NeutralCheckStage(fast_path))
+    prepare.append(KeywordStage(keyword_matcher))
+    if config.enable_fuzzy_logic:
+        prepare.append(ModifierStage())
+    
+    lookup: List[Stage] = []
+    store: List[Stage] = []
+    if use_fast_path:
+        lookup.append(TemplateLookupStage(fast_path))
+    if shared_cache is not None:
+        lookup.append(SharedLookupStage(shared_cache))
+        store.append(SharedStoreStage(shared_cache))
+    if use_fast_path:
+        store.append(TemplateStoreStage(fast_path))
+    
+    # La ruta solo se obtiene si se incluye en la salida o la necesita el
+    # cache compartido (que la guarda como identificador de hoja)
+    if output_format.get('include_tree_path', True) or shared_cache is not None:
+        score: List[Stage] = [TreeStage(tree_searcher)]
+    else:
+        score = [TreeScoresStage(tree_searcher)]
+    if config.enable_fuzzy_logic:
+        score.append(FuzzyStage(fuzzy_processor, scope_engine))
+    score.append(SummaryStage(normalizer))
+    
+    return AnalysisPipeline(prepare, lookup, score, store, output_format)
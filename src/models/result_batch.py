@@ -0,0 +1,285 @@
+"""
+Lote Columnar de Resultados
+===========================
+
+Módulo con una representación columnar de los resultados de un lote. En
+lugar de un objeto `SentimentResult` (con sus diccionarios y listas) por
+texto, cada campo se guarda en un arreglo compacto:
+
+- puntuaciones: array('f') (float32), una columna por sentimiento; como la
+  salida las redondea a `round_decimals`, al reconstruir una fila se
+  redondean de nuevo y se recuperan exactas
+- confianza y tiempo: array('d'), porque la salida no los redondea
+- sentimiento dominante, secundarios y calidad: array('b') con índices
+- ruta del árbol: array('i') con el índice de la ruta en una tabla del lote
+  (en un árbol la ruta queda determinada por la hoja)
+- palabras clave y modificadores: desplazamientos y valores (array('I')) con
+  índices a una tabla de palabras del lote
+
+Las filas se reconstruyen como `SentimentResult` solo cuando se consultan.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .sentiment_result import SentimentResult
+from .sentiment_vector import SENTIMENTS, SENTIMENT_INDEX
+
+
+# Calidades del análisis (el índice se guarda en la columna de calidad)
+QUALITIES = ('low', 'medium', 'high')
+
+# Listas de palabras de los modificadores aplicados
+MODIFIER_LISTS = ('intensifiers', 'attenuators', 'negations', 'emoticons')
+
+# Contadores de los modificadores aplicados
+MODIFIER_COUNTS = ('exclamation_count', 'question_count')
+
+# Sentimientos secundarios guardados por fila
+MAX_SECONDARY = 2
+
+# Decimales que float32 conserva sin pérdida (con más, las puntuaciones usan float64)
+FLOAT32_DECIMALS = 6
+
+# Marcas de cada fila: campos presentes (un resultado de error no tiene
+# puntuaciones; los campos excluidos de la salida quedan vacíos)
+_HAS_SCORES = 1
+_HAS_KEYWORDS = 2
+_HAS_MODIFIERS = 4
+
+_QUALITY_INDEX = {quality: i for i, quality in enumerate(QUALITIES)}
+_MODIFIER_INDEX = {name: i for i, name in enumerate(MODIFIER_LISTS)}
+
+
+class ResultBatch:
+    """Resultados de un lote en columnas compactas"""
+    
+    def __init__(self, decimals: int = 3):
+        """
+        Args:
+            decimals: Decimales de las puntuaciones (`output_format.round_decimals`)
+        """
+        self.decimals = decimals
+        typecode = 'f' if decimals <= FLOAT32_DECIMALS else 'd'
+        self.texts: List[str] = []
+        self.scores: Dict[str, array] = {sentiment: array(typecode) for sentiment in SENTIMENTS}
+        self.confidence = array('d')
+        self.processing_time = array('d')
+        self.dominant = array('b')          # Índice en SENTIMENTS (-1 = ninguno)
+        self.secondary = array('b')         # MAX_SECONDARY índices por fila (-1 = ninguno)
+        self.quality = array('b')           # Índice en QUALITIES
+        self.leaf = array('i')              # Índice en `paths` (-1 = sin ruta)
+        self.flags = array('B')
+        self.counts: Dict[str, array] = {name: array('I') for name in MODIFIER_COUNTS}
+        
+        # Palabras clave: pares (sentimiento, palabra) de la fila i entre
+        # keyword_offsets[i] y keyword_offsets[i + 1]
+        self.keyword_offsets = array('I', [0])
+        self.keyword_labels = array('b')
+        self.keyword_values = array('I')
+        
+        # Modificadores: pares (lista, palabra) con la misma codificación
+        self.modifier_offsets = array('I', [0])
+        self.modifier_labels = array('b')
+        self.modifier_values = array('I')
+        
+        # Tablas del lote
+        self.words: List[str] = []
+        self.paths: List[Tuple[str, ...]] = []
+        self._word_ids: Dict[str, int] = {}
+        self._path_ids: Dict[Tuple[str, ...], int] = {}
+    
+    @classmethod
+    def from_results(cls, results: Iterable[SentimentResult], decimals: int = 3) -> 'ResultBatch':
+        """
+        Construye un lote a partir de resultados
+        
+        Args:
+            results: Resultados del análisis
+            decimals: Decimales de las puntuaciones (`output_format.round_decimals`)
+        
+        Returns:
+            Lote con una fila por resultado
+        """
+        batch = cls(decimals)
+        for result in results:
+            batch.append(result)
+        return batch
+    
+    def _word_id(self, word: str) -> int:
+        """Índice de una palabra en la tabla del lote (la agrega si falta)"""
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = self._word_ids[word] = len(self.words)
+            self.words.append(word)
+        return word_id
+    
+    def _path_id(self, path: List[str]) -> int:
+        """Índice de una ruta en la tabla del lote (la agrega si falta)"""
+        key = tuple(path)
+        path_id = self._path_ids.get(key)
+        if path_id is None:
+            path_id = self._path_ids[key] = len(self.paths)
+            self.paths.append(key)
+        return path_id
+    
+    def append(self, result: SentimentResult):
+        """
+        Agrega un resultado como nueva fila
+        
+        Args:
+            result: Resultado del análisis
+        
+        Raises:
+            ValueError: Si las puntuaciones no usan los sentimientos del sistema
+        """
+        sentiments = result.sentiments
+        if sentiments and sentiments.keys() != SENTIMENT_INDEX.keys():
+            raise ValueError(f"Sentimientos fuera del esquema del sistema: {sorted(sentiments)}")
+        
+        flags = 0
+        
+        # 1. Puntuaciones, confianza y ranking
+        if sentiments:
+            flags |= _HAS_SCORES
+            for sentiment, column in self.scores.items():
+                column.append(sentiments[sentiment])
+        else:
+            for column in self.scores.values():
+                column.append(0.0)
+        self.confidence.append(result.confidence)
+        self.processing_time.append(result.processing_time)
+        self.dominant.append(SENTIMENT_INDEX.get(result.dominant_sentiment, -1))
+        secondary = [SENTIMENT_INDEX[sentiment] for sentiment in result.secondary_sentiments[:MAX_SECONDARY]]
+        self.secondary.extend(secondary + [-1] * (MAX_SECONDARY - len(secondary)))
+        self.quality.append(_QUALITY_INDEX[result.analysis_quality])
+        
+        # 2. Ruta del árbol
+        self.leaf.append(self._path_id(result.tree_path) if result.tree_path else -1)
+        
+        # 3. Palabras clave por sentimiento
+        matched_keywords = result.matched_keywords
+        if matched_keywords:
+            flags |= _HAS_KEYWORDS
+            for sentiment, words in matched_keywords.items():
+                label = SENTIMENT_INDEX[sentiment]
+                for word in words:
+                    self.keyword_labels.append(label)
+                    self.keyword_values.append(self._word_id(word))
+        self.keyword_offsets.append(len(self.keyword_values))
+        
+        # 4. Modificadores aplicados
+        modifiers = result.modifiers_applied
+        if modifiers:
+            flags |= _HAS_MODIFIERS
+            for name in MODIFIER_LISTS:
+                label = _MODIFIER_INDEX[name]
+                for word in modifiers.get(name, ()):
+                    self.modifier_labels.append(label)
+                    self.modifier_values.append(self._word_id(word))
+        for name, column in self.counts.items():
+            column.append(modifiers.get(name, 0) if modifiers else 0)
+        self.modifier_offsets.append(len(self.modifier_values))
+        
+        self.texts.append(result.text)
+        self.flags.append(flags)
+    
+    def extend(self, results: Iterable[SentimentResult]):
+        """
+        Agrega varios resultados
+        
+        Args:
+            results: Resultados del análisis
+        """
+        for result in results:
+            self.append(result)
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __getitem__(self, index: int) -> SentimentResult:
+        return self.row(index)
+    
+    def __iter__(self) -> Iterator[SentimentResult]:
+        for index in range(len(self.texts)):
+            yield self.row(index)
+    
+    def _fields(self, index: int) -> Dict[str, Any]:
+        """Campos de una fila reconstruidos desde las columnas"""
+        flags = self.flags[index]
+        words = self.words
+        
+        decimals = self.decimals
+        sentiments = ({sentiment: round(column[index], decimals) for sentiment, column in self.scores.items()}
+                      if flags & _HAS_SCORES else {})
+        
+        matched_keywords = {}
+        if flags & _HAS_KEYWORDS:
+            matched_keywords = {sentiment: [] for sentiment in SENTIMENTS}
+            for position in range(self.keyword_offsets[index], self.keyword_offsets[index + 1]):
+                matched_keywords[SENTIMENTS[self.keyword_labels[position]]].append(
+                    words[self.keyword_values[position]])
+        
+        modifiers = {}
+        if flags & _HAS_MODIFIERS:
+            modifiers = {name: [] for name in MODIFIER_LISTS}
+            for position in range(self.modifier_offsets[index], self.modifier_offsets[index + 1]):
+                modifiers[MODIFIER_LISTS[self.modifier_labels[position]]].append(
+                    words[self.modifier_values[position]])
+            for name, column in self.counts.items():
+                modifiers[name] = column[index]
+        
+        dominant = self.dominant[index]
+        leaf = self.leaf[index]
+        start = index * MAX_SECONDARY
+        return {
+            'text': self.texts[index],
+            'sentiments': sentiments,
+            'confidence': self.confidence[index],
+            'processing_time': self.processing_time[index],
+            'matched_keywords': matched_keywords,
+            'tree_path': list(self.paths[leaf]) if leaf >= 0 else [],
+            'modifiers_applied': modifiers,
+            'dominant_sentiment': SENTIMENTS[dominant] if dominant >= 0 else None,
+            'secondary_sentiments': [SENTIMENTS[i] for i in self.secondary[start:start + MAX_SECONDARY]
+                                     if i >= 0],
+            'analysis_quality': QUALITIES[self.quality[index]]
+        }
+    
+    def row(self, index: int) -> SentimentResult:
+        """
+        Reconstruye una fila como resultado
+        
+        Args:
+            index: Posición de la fila (admite índices negativos)
+        
+        Returns:
+            Resultado nuevo con los valores de las columnas
+        
+        Raises:
+            IndexError: Si la posición está fuera del lote
+        """
+        return SentimentResult(**self._fields(range(len(self.texts))[index]))
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convierte el lote a diccionarios (como `SentimentResult.to_dict`)
+        
+        Returns:
+            Lista con un diccionario por fila
+        """
+        return [self._fields(index) for index in range(len(self.texts))]
+    
+    def column(self, name: str) -> Optional[array]:
+        """
+        Obtiene la columna de puntuaciones de un sentimiento o la de confianza
+        
+        Args:
+            name: Sentimiento o 'confidence'
+        
+        Returns:
+            Arreglo con un valor por fila (las puntuaciones en float32, sin
+            redondear), o None si no existe
+        """
+        if name == 'confidence':
+            return self.confidence
+        return self.scores.get(name)
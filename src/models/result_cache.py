@@ -0,0 +1,407 @@
+"""
+Cache de Resultados
+===================
+
+Módulo con el cache de resultados completos del análisis. Las entradas se
+indexan por el texto normalizado (espacios colapsados y, si el
+preprocesamiento convierte a minúsculas, en minúsculas) junto con una huella
+de la configuración y los recursos, de modo que los textos repetidos o que
+solo difieren en mayúsculas y espacios no recorren de nuevo el pipeline.
+
+El cache persistente guarda los resultados en una base SQLite local (modo
+WAL) para conservarlos entre ejecuciones; si la huella cambia (otro léxico,
+árbol o configuración) las entradas anteriores se eliminan al abrirla.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from .sentiment_result import SentimentResult, SystemConfig, detached_copy
+from ..utils.cache import StripedLRUCache
+
+
+# Secciones de la configuración que no afectan el resultado del análisis
+NON_SEMANTIC_SECTIONS = ('logging', 'batch_processing', 'result_cache', 'enable_fast_path')
+
+# Parámetros máximos por consulta IN (límite de SQLite)
+SQLITE_BATCH_SIZE = 500
+
+
+def normalize_text(text: str, fold_case: bool = True) -> str:
+    """
+    Normaliza un texto para usarlo como clave de cache
+    
+    Args:
+        text: Texto original
+        fold_case: Si se convierte a minúsculas
+    
+    Returns:
+        Texto con los espacios colapsados (y en minúsculas si corresponde)
+    """
+    normalized = ' '.join(text.split())
+    return normalized.lower() if fold_case else normalized
+
+
+def compute_fingerprint(config: SystemConfig, resources: Dict[str, Any]) -> str:
+    """
+    Calcula la huella de la configuración y los recursos del análisis
+    
+    Args:
+        config: Configuración del sistema
+        resources: Recursos del analizador (árbol, palabras clave, reglas)
+    
+    Returns:
+        Huella hexadecimal (cambia si cambia cualquier dato que afecte al resultado)
+    """
+    settings = {name: value for name, value in asdict(config).items()
+                if name not in NON_SEMANTIC_SECTIONS}
+    payload = {
+        'config': settings,
+        'tree_data': resources.get('tree_data'),
+        'keywords_data': resources.get('keywords_data'),
+        'fuzzy_rules_data': resources.get('fuzzy_rules_data')
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False,
+                           separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+def result_to_payload(result: SentimentResult) -> Dict[str, Any]:
+    """
+    Convierte un resultado a datos serializables sin el texto ni el tiempo
+    
+    Args:
+        result: Resultado del análisis
+    
+    Returns:
+        Dict con los demás campos del resultado
+    """
+    payload = result.to_dict()
+    del payload['text'], payload['processing_time']
+    return payload
+
+
+def result_from_payload(text: str, payload: Dict[str, Any], processing_time: float = 0.0) -> SentimentResult:
+    """
+    Reconstruye un resultado desde los datos de `result_to_payload`
+    
+    Args:
+        text: Texto del resultado
+        payload: Campos serializados
+        processing_time: Tiempo de procesamiento a informar
+    
+    Returns:
+        Resultado del análisis
+    """
+    return SentimentResult(text=text, processing_time=processing_time, **payload)
+
+
+class ResultCache:
+    """Cache LRU de resultados completos del análisis"""
+    
+    def __init__(self, capacity: int, fingerprint: str, fold_case: bool = True,
+                 stripes: int = 16, max_bytes: int = 0):
+        """
+        Args:
+            capacity: Número máximo de resultados (0 = sin límite)
+            fingerprint: Huella de la configuración y los recursos
+            fold_case: Si las mayúsculas se ignoran en la clave
+            stripes: Segmentos del cache (un candado por segmento)
+            max_bytes: Tamaño máximo aproximado en bytes (0 = sin límite)
+        """
+        self.fingerprint = fingerprint
+        self.fold_case = fold_case
+        self._cache = StripedLRUCache(capacity, stripes, max_bytes)
+    
+    def key(self, text: str) -> Hashable:
+        """
+        Calcula la clave de un texto
+        
+        Args:
+            text: Texto original
+        
+        Returns:
+            Tupla (huella, texto normalizado)
+        """
+        return (self.fingerprint, normalize_text(text, self.fold_case))
+    
+    def get(self, text: str, processing_time: float = 0.0) -> Optional[SentimentResult]:
+        """
+        Obtiene el resultado almacenado para un texto
+        
+        El resultado devuelto es una copia con el texto original, el tiempo de
+        la consulta y diccionarios y listas propios (modificarlo no altera la
+        entrada del cache).
+        
+        Args:
+            text: Texto original
+            processing_time: Tiempo de procesamiento a informar
+        
+        Returns:
+            Resultado o None si no está en el cache
+        """
+        cached = self._cache.get(self.key(text))
+        if cached is None:
+            return None
+        
+        result = detached_copy(cached)
+        result.text = text
+        result.processing_time = processing_time
+        return result
+    
+    def put(self, text: str, result: SentimentResult):
+        """
+        Almacena el resultado de un texto
+        
+        Args:
+            text: Texto original
+            result: Resultado del análisis
+        """
+        # Copia propia: los cambios posteriores del llamador no alcanzan al cache
+        self._cache.put(self.key(text), detached_copy(result))
+    
+    def clear(self):
+        """Elimina todos los resultados y reinicia las estadísticas"""
+        self._cache.clear()
+    
+    def export_entries(self) -> List[List[Any]]:
+        """
+        Exporta los resultados almacenados
+        
+        Returns:
+            Lista de pares [texto normalizado, datos del resultado]
+        """
+        return [[normalized, result_to_payload(result)]
+                for (_, normalized), result in self._cache.items()]
+    
+    def import_entries(self, entries: Iterable[List[Any]]) -> int:
+        """
+        Importa resultados exportados con `export_entries` (misma huella)
+        
+        Args:
+            entries: Pares [texto normalizado, datos del resultado]
+        
+        Returns:
+            Número de resultados importados
+        """
+        count = 0
+        for normalized, payload in entries:
+            self._cache.put((self.fingerprint, normalized), result_from_payload(normalized, payload))
+            count += 1
+        return count
+    
+    def memory_usage(self) -> int:
+        """
+        Estima los bytes ocupados por los resultados almacenados
+        
+        Returns:
+            Tamaño aproximado en bytes
+        """
+        return self._cache.memory_usage()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas del cache
+        
+        Returns:
+            Dict con tamaño, capacidad, aciertos, fallos y tasa de aciertos
+        """
+        stats = self._cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class PersistentResultCache:
+    """Cache de resultados persistido en SQLite"""
+    
+    def __init__(self, path: str, fingerprint: str, fold_case: bool = True):
+        """
+        Args:
+            path: Ruta de la base de datos
+            fingerprint: Huella de la configuración y los recursos
+            fold_case: Si las mayúsculas se ignoran en la clave
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.fold_case = fold_case
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._initialize()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (se reabre tras un fork)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    def _initialize(self):
+        """Crea las tablas y elimina las entradas de una huella anterior"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        connection = self._connect()
+        with connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS meta '
+                               '(name TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            connection.execute('CREATE TABLE IF NOT EXISTS results '
+                               '(key BLOB PRIMARY KEY, payload TEXT NOT NULL) WITHOUT ROWID')
+            row = connection.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+            if row is None or row[0] != self.fingerprint:
+                connection.execute('DELETE FROM results')
+                connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('fingerprint', ?)",
+                                   (self.fingerprint,))
+    
+    def key(self, text: str) -> bytes:
+        """
+        Calcula la clave de un texto
+        
+        Args:
+            text: Texto original
+        
+        Returns:
+            Hash de 16 bytes del texto normalizado
+        """
+        normalized = normalize_text(text, self.fold_case)
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+    
+    @staticmethod
+    def _encode(result: SentimentResult) -> str:
+        """Serializa un resultado sin el texto ni el tiempo de procesamiento"""
+        return json.dumps(result_to_payload(result), ensure_ascii=False, separators=(',', ':'))
+    
+    @staticmethod
+    def _decode(text: str, payload: str, processing_time: float) -> SentimentResult:
+        """Reconstruye un resultado serializado"""
+        return result_from_payload(text, json.loads(payload), processing_time)
+    
+    def get(self, text: str, processing_time: float = 0.0) -> Optional[SentimentResult]:
+        """
+        Obtiene el resultado almacenado para un texto
+        
+        Args:
+            text: Texto original
+            processing_time: Tiempo de procesamiento a informar
+        
+        Returns:
+            Resultado o None si no está en el cache
+        """
+        return self.get_many([text], processing_time)[0]
+    
+    def get_many(self, texts: List[str], processing_time: float = 0.0) -> List[Optional[SentimentResult]]:
+        """
+        Obtiene los resultados de varios textos con consultas por lotes
+        
+        Args:
+            texts: Textos originales
+            processing_time: Tiempo de procesamiento a informar
+        
+        Returns:
+            Resultados en el orden de los textos (None para los ausentes)
+        """
+        keys = [self.key(text) for text in texts]
+        payloads = {}
+        connection = self._connect()
+        
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), SQLITE_BATCH_SIZE):
+            chunk = unique_keys[start:start + SQLITE_BATCH_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = connection.execute(f'SELECT key, payload FROM results WHERE key IN ({placeholders})',
+                                      chunk)
+            payloads.update(rows)
+        
+        results = []
+        for text, key in zip(texts, keys):
+            payload = payloads.get(key)
+            results.append(self._decode(text, payload, processing_time) if payload is not None else None)
+        
+        found = len(results) - results.count(None)
+        with self._lock:
+            self._hits += found
+            self._misses += len(results) - found
+        return results
+    
+    def put(self, text: str, result: SentimentResult):
+        """
+        Almacena el resultado de un texto
+        
+        Args:
+            text: Texto original
+            result: Resultado del análisis
+        """
+        self.put_many([(text, result)])
+    
+    def put_many(self, items: Iterable[Tuple[str, SentimentResult]]):
+        """
+        Almacena varios resultados en una sola transacción
+        
+        Args:
+            items: Pares (texto, resultado)
+        """
+        rows = [(self.key(text), self._encode(result)) for text, result in items]
+        if not rows:
+            return
+        
+        connection = self._connect()
+        with connection:
+            connection.executemany('INSERT OR REPLACE INTO results (key, payload) VALUES (?, ?)', rows)
+    
+    def clear(self):
+        """Elimina todos los resultados y reinicia las estadísticas"""
+        connection = self._connect()
+        with connection:
+            connection.execute('DELETE FROM results')
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+    
+    def close(self):
+        """Cierra la conexión del hilo actual"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.connection = None
+    
+    def disk_usage(self) -> int:
+        """
+        Obtiene el tamaño en disco de la base
+        
+        Returns:
+            Bytes de la base y de sus archivos de modo WAL (`-wal`, `-shm`)
+        """
+        return sum(os.path.getsize(path) for path in
+                   (self.path, self.path + '-wal', self.path + '-shm')
+                   if os.path.exists(path))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas del cache
+        
+        Returns:
+            Dict con ruta, tamaño, aciertos, fallos y tasa de aciertos
+        """
+        size = self._connect().execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        lookups = self._hits + self._misses
+        return {
+            'path': self.path,
+            'size': size,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / lookups if lookups else 0.0
+        }
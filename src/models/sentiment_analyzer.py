@@ -6,106 +6,135 @@ Módulo principal que orquesta el análisis de sentimientos,
 integrando todos los componentes del sistema.
 """
 
+import os
 import time
 import json
+import asyncio
 import logging
-from typing import Dict, Any
-from .sentiment_result import SentimentResult, SystemConfig
+import weakref
+from typing import Dict, Any, Iterable, Iterator, List
+from .sentiment_result import Explanation, SentimentResult, SystemConfig
 from .exceptions import SentimentAnalysisError, ConfigurationError
 from ..core.text_preprocessor import TextPreprocessor
 from ..core.tree_searcher import TreeSearcher
 from ..core.fuzzy_logic import FuzzyLogicProcessor
+from ..core.fuzzy_inference import FuzzyRuleBase
+from ..core.modifier_scope import ModifierScopeEngine
+from ..core.neutral_fast_path import NeutralFastPath
 from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.bloom_filter import BloomFilter
 from ..utils.normalizer import ScoreNormalizer
+from ..utils.vocabulary import Vocabulary
+from ..utils.log_queue import pending_bytes, start_queue_logging
+from ..utils.memory import deep_sizeof
+from .parallel_batch import (iter_chunks, parallel_analyze, parallel_stream, pool_analyze,
+                             resolve_workers, worker_pool)
+from .async_batching import MicroBatcher
+from .result_cache import PersistentResultCache, ResultCache, compute_fingerprint
+from .shared_cache import SLOT_SIZE, SharedResultCache
+from .pipeline import AnalysisPipeline, build_pipeline
+from .result_batch import ResultBatch
+from .cache_snapshot import read_snapshot, read_top_texts, write_snapshot
 
 
 class SentimentAnalyzer:
     """Analizador principal de sentimientos"""
     
-    def __init__(self, config: SystemConfig = None):
+    def __init__(self, config: SystemConfig = None, resources: Dict[str, Any] = None):
+        """
+        Args:
+            config: Configuración del sistema
+            resources: Recursos ya cargados (ver `get_resources`); si se
+                indican no se leen los archivos de recursos
+        """
         self.config = config or SystemConfig()
         self._setup_logging()
-        self._load_resources()
+        self._load_resources(resources)
         self._initialize_components()
+        # Agrupadores de micro-lotes por bucle de eventos
+        self._batchers = weakref.WeakKeyDictionary()
+        
+        # Precargar los caches desde la instantánea configurada
+        snapshot_file = self.config.result_cache.get('snapshot_file')
+        if snapshot_file and os.path.exists(snapshot_file):
+            self.import_cache_snapshot(snapshot_file)
     
-    def analyze(self, text: str) -> SentimentResult:
+    def analyze(self, text: str, persistent: bool = True) -> SentimentResult:
         """
         Analiza el sentimiento de un texto
         
         Args:
             text: Texto a analizar
+            persistent: Si se consulta y actualiza el cache persistente
+                (`batch_analyze` lo hace por lotes)
             
         Returns:
             Resultado del análisis de sentimientos
         """
         start_time = time.time()
+        logger = self.logger
+        # Los mensajes solo se formatean si el nivel está habilitado
+        log_requests = self._log_requests and logger.isEnabledFor(logging.INFO)
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         try:
-            self.logger.info(f"Iniciando análisis de texto: '{text[:50]}...'")
-            
-            # 1. Preprocesamiento
-            preprocessed_data = self.preprocessor.preprocess(text)
-            self.logger.debug(f"Datos preprocesados: {preprocessed_data}")
-            
-            # 2. Coincidencia de palabras clave
-            matched_keywords = self.keyword_matcher.find_matches(preprocessed_data['words'])
-            self.logger.debug(f"Palabras clave encontradas: {matched_keywords}")
-            
-            # 3. Búsqueda en árbol de decisión
-            tree_results = self.tree_searcher.search(preprocessed_data)
-            self.logger.debug(f"Resultados del árbol: {tree_results}")
-            
-            # 4. Aplicar lógica difusa si está habilitada
-            if self.config.enable_fuzzy_logic:
-                modifiers = {
-                    'intensifiers': preprocessed_data.get('intensifiers', []),
-                    'attenuators': preprocessed_data.get('attenuators', []),
-                    'negations': preprocessed_data.get('negations', []),
-                    'emoticons': preprocessed_data.get('emoticons', []),
-                    'exclamation_count': preprocessed_data.get('exclamation_count', 0),
-                    'question_count': preprocessed_data.get('question_count', 0)
-                }
-                
-                adjusted_scores = self.fuzzy_processor.apply_fuzzy_rules(
-                    tree_results['final_scores'], 
-                    modifiers
-                )
-                self.logger.debug(f"Puntuaciones ajustadas por lógica difusa: {adjusted_scores}")
-            else:
-                adjusted_scores = tree_results['final_scores']
+            if log_requests:
+                logger.info("Iniciando análisis de texto: '%.50s...'", text)
             
-            # 5. Normalización de puntuaciones
-            normalized_scores = self.normalizer.normalize_scores(adjusted_scores)
-            self.logger.debug(f"Puntuaciones normalizadas: {normalized_scores}")
+            # 0. Resultado completo ya calculado para el mismo texto normalizado
+            result_cache = self.result_cache
+            persistent_cache = self.persistent_cache if persistent else None
+            cacheable = ((result_cache is not None or persistent_cache is not None)
+                         and self.preprocessor.validate_input(text))
+            if cacheable:
+                result = self._get_cached_result(text, start_time, persistent_cache)
+                if result is not None:
+                    return result
             
-            # 6. Cálculo de confianza
-            confidence = self.normalizer.calculate_confidence(normalized_scores, matched_keywords)
+            # 1-6. Etapas del pipeline especializado para la configuración
+            pipeline = self.pipeline
+            context = pipeline.run(text, logger if debug else None)
+            summary = context.summary
+            confidence = summary['confidence']
             
-            # 7. Crear resultado
-            processing_time = time.time() - start_time
+            # 7. Crear resultado con el vector de puntuaciones: el diccionario y
+            # los campos de explicación incluidos se construyen en el primer
+            # acceso; los excluidos quedan vacíos
+            processing_time = time.time() - start_time if pipeline.include_processing_time else 0.0
+            explanation = None
+            if pipeline.include_explanation:
+                explanation = Explanation(
+                    self.keyword_matcher if pipeline.include_matched_keywords else None,
+                    context.preprocessed['token_ids'] if pipeline.include_matched_keywords else None,
+                    context.tree_path if pipeline.include_tree_path else None,
+                    context.modifiers if pipeline.include_modifiers else None
+                )
             
             result = SentimentResult(
                 text=text,
-                sentiments=normalized_scores,
+                sentiments=summary['sentiments'],
                 confidence=confidence,
                 processing_time=processing_time,
-                matched_keywords=matched_keywords,
-                tree_path=tree_results.get('path', []),
-                modifiers_applied=modifiers if self.config.enable_fuzzy_logic else {},
-                dominant_sentiment=self.normalizer.get_dominant_sentiment(normalized_scores),
-                secondary_sentiments=self.normalizer.get_secondary_sentiments(normalized_scores),
-                analysis_quality=self._determine_analysis_quality(confidence, processing_time)
+                dominant_sentiment=summary['dominant_sentiment'],
+                secondary_sentiments=summary['secondary_sentiments'],
+                explanation=explanation
             )
             
-            self.logger.info(f"Análisis completado en {processing_time:.3f}s. "
-                           f"Sentimiento dominante: {result.dominant_sentiment}, "
-                           f"Confianza: {confidence:.3f}")
+            if cacheable:
+                if result_cache is not None:
+                    result_cache.put(text, result)
+                if persistent_cache is not None:
+                    persistent_cache.put(text, result)
+            
+            if log_requests:
+                logger.info("Análisis completado en %.3fs. Sentimiento dominante: %s, "
+                            "Confianza: %.3f", processing_time, result.dominant_sentiment, confidence)
             
             return result
             
         except Exception as e:
             processing_time = time.time() - start_time
-            self.logger.error(f"Error en análisis: {str(e)}")
+            logger.error("Error en análisis: %s", e)
             raise SentimentAnalysisError(f"Error durante el análisis: {str(e)}")
     
     def _setup_logging(self):
@@ -123,14 +152,17 @@ class SentimentAnalyzer:
         # Configurar logger principal
         self.logger = logging.getLogger('SentimentAnalyzer')
         self.logger.setLevel(log_level)
+        self._log_requests = log_config.get('log_requests', False)
         
         # Evitar duplicación de handlers
         if not self.logger.handlers:
+            handlers = []
+            
             # Handler para consola
             if log_config.get('enable_console_logging', True):
                 console_handler = logging.StreamHandler()
                 console_handler.setFormatter(formatter)
-                self.logger.addHandler(console_handler)
+                handlers.append(console_handler)
             
             # Handler para archivo
             if log_config.get('enable_file_logging', True):
@@ -138,10 +170,29 @@ class SentimentAnalyzer:
                     log_config.get('log_file', 'sentiment_analysis.log')
                 )
                 file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
+            
+            # Escritura en un hilo en segundo plano o directamente en el hilo del análisis
+            if handlers and log_config.get('queue_logging', True):
+                self.logger.addHandler(start_queue_logging(handlers))
+            else:
+                for handler in handlers:
+                    self.logger.addHandler(handler)
     
-    def _load_resources(self):
+    def _load_resources(self, resources: Dict[str, Any] = None):
         """Carga los recursos necesarios"""
+        if resources is not None:
+            self.system_config = resources['system_config']
+            self.tree_data = resources['tree_data']
+            self.keywords_data = resources['keywords_data']
+            self.fuzzy_rules_data = resources['fuzzy_rules_data']
+            self.lexicon_filter_data = resources.get('lexicon_filter')
+            self.frequent_tokens = resources.get('frequent_tokens')
+            return
+        
+        self.lexicon_filter_data = None
+        self.frequent_tokens = None
+        
         try:
             # Cargar configuración del sistema
             self.system_config = self._load_system_config()
@@ -152,32 +203,287 @@ class SentimentAnalyzer:
             # Cargar palabras clave
             self.keywords_data = self._load_keywords_data()
             
+            # Cargar base de reglas difusas si se usa el motor Mamdani
+            self.fuzzy_rules_data = None
+            if self.config.fuzzy_parameters.get('inference_engine', 'heuristic') == 'mamdani':
+                self.fuzzy_rules_data = self._load_fuzzy_rules_data()
+            
         except Exception as e:
             raise ConfigurationError(f"Error al cargar recursos: {str(e)}")
     
+    def get_resources(self) -> Dict[str, Any]:
+        """
+        Obtiene los recursos cargados para construir otro analizador sin releerlos
+        
+        Returns:
+            Dict con la configuración, el árbol, las palabras clave, la base de
+            reglas, el filtro de Bloom del léxico serializado y los tokens
+            frecuentes del corpus de vocabulario
+        """
+        return {
+            'system_config': self.system_config,
+            'tree_data': self.tree_data,
+            'keywords_data': self.keywords_data,
+            'fuzzy_rules_data': self.fuzzy_rules_data,
+            'lexicon_filter': self.keyword_matcher.lexicon_filter.to_bytes(),
+            'frequent_tokens': self.frequent_tokens
+        }
+    
     def _initialize_components(self):
         """Inicializa todos los componentes del sistema"""
         try:
+            # Vocabulario compartido entre preprocesador y coincidencia de palabras
+            self.vocabulary = Vocabulary()
+            
             # Inicializar preprocesador
-            self.preprocessor = TextPreprocessor(self.config)
+            self.preprocessor = TextPreprocessor(self.config, self.vocabulary)
             
             # Inicializar buscador de árbol
             self.tree_searcher = TreeSearcher(self.tree_data, self.config)
             
-            # Inicializar procesador de lógica difusa
-            self.fuzzy_processor = FuzzyLogicProcessor(self.config)
+            # Inicializar procesador de lógica difusa (compilando la base de reglas si existe)
+            rule_base = FuzzyRuleBase(self.fuzzy_rules_data) if self.fuzzy_rules_data else None
+            self.fuzzy_processor = FuzzyLogicProcessor(self.config, rule_base)
+            
+            # Inicializar coincidencia de palabras clave con el filtro de Bloom del
+            # léxico y los modificadores (reutilizando el recibido con los recursos)
+            preprocessor = self.preprocessor
+            lexicon_filter = (BloomFilter.from_bytes(self.lexicon_filter_data)
+                              if self.lexicon_filter_data else None)
+            self.keyword_matcher = KeywordMatcher(
+                self.keywords_data, self.vocabulary,
+                extra_words=sorted(preprocessor.intensifiers | preprocessor.attenuators |
+                                   preprocessor.negations),
+                lexicon_filter=lexicon_filter
+            )
+            
+            # Tokens frecuentes del corpus de vocabulario (reutilizando los
+            # recibidos con los recursos)
+            if self.frequent_tokens is None:
+                self.frequent_tokens = self._collect_frequent_tokens()
+            self.vocabulary.add_tokens(self.frequent_tokens)
             
-            # Inicializar coincidencia de palabras clave
-            self.keyword_matcher = KeywordMatcher(self.keywords_data)
+            # Alcance posicional de modificadores (0 conserva el comportamiento global)
+            window = int(self.config.fuzzy_parameters.get('modifier_scope', 0))
+            self.scope_engine = (ModifierScopeEngine(self.preprocessor, self.keyword_matcher, window)
+                                 if window > 0 else None)
             
             # Inicializar normalizador
             self.normalizer = ScoreNormalizer(self.config)
             
+            # Plantillas para textos neutrales (con normalización de corpus el
+            # resultado depende de los textos previos)
+            self.fast_path = (NeutralFastPath(self.preprocessor, self.keyword_matcher, self.tree_searcher)
+                              if self.config.enable_fast_path and self.normalizer.method != 'streaming'
+                              else None)
+            
+            # Caches de resultados completos en memoria y en disco (opcionales)
+            self.result_cache = None
+            self.persistent_cache = None
+            self.shared_cache = None
+            self._fingerprint = None
+            self._create_result_caches()
+            
+            # Pipeline con solo las etapas habilitadas en la configuración
+            self._build_pipeline()
+            
             self.logger.info("Todos los componentes inicializados correctamente")
             
         except Exception as e:
             raise ConfigurationError(f"Error al inicializar componentes: {str(e)}")
     
+    def _create_result_caches(self):
+        """Crea los caches de resultados completos habilitados en la configuración"""
+        settings = self.config.result_cache
+        persistent_path = settings.get('persistent_path')
+        if not (settings.get('enabled', False) or persistent_path or settings.get('shared_slots', 0)):
+            return
+        
+        # Con normalización de corpus el resultado depende de los textos previos
+        if self.normalizer.method == 'streaming':
+            self.logger.warning("El cache de resultados no se usa con la normalización 'streaming'")
+            return
+        
+        fingerprint = self.get_fingerprint()
+        fold_case = self.config.preprocessing.get('convert_to_lowercase', True)
+        
+        if settings.get('enabled', False):
+            self.result_cache = ResultCache(settings.get('max_entries', 10000), fingerprint,
+                                            fold_case=fold_case, stripes=settings.get('stripes', 16),
+                                            max_bytes=settings.get('max_bytes', 0))
+        if persistent_path:
+            self.persistent_cache = PersistentResultCache(persistent_path, fingerprint,
+                                                          fold_case=fold_case)
+    
+    def _build_pipeline(self) -> AnalysisPipeline:
+        """
+        Arma el pipeline especializado con los componentes actuales
+        
+        Returns:
+            Pipeline asignado al analizador
+        """
+        self.pipeline = build_pipeline(
+            self.config, self.preprocessor, self.keyword_matcher, self.tree_searcher,
+            self.fuzzy_processor, self.normalizer, scope_engine=self.scope_engine,
+            fast_path=self.fast_path, shared_cache=self.shared_cache
+        )
+        return self.pipeline
+    
+    def get_fingerprint(self) -> str:
+        """
+        Obtiene la huella de la configuración y los recursos del análisis
+        
+        Returns:
+            Huella hexadecimal (se calcula una vez por analizador)
+        """
+        if self._fingerprint is None:
+            self._fingerprint = compute_fingerprint(self.config, self.get_resources())
+        return self._fingerprint
+    
+    def export_cache_snapshot(self, path: str) -> Dict[str, int]:
+        """
+        Exporta los caches del árbol y de resultados a una instantánea gzip
+        
+        Args:
+            path: Ruta del archivo
+            
+        Returns:
+            Dict con el número de entradas exportadas por cache
+        """
+        tree_entries = self.tree_searcher.export_cache()
+        result_entries = self.result_cache.export_entries() if self.result_cache is not None else []
+        write_snapshot(path, self.get_fingerprint(), tree_entries, result_entries)
+        
+        self.logger.info("Instantánea de cache exportada: %d entradas del árbol, %d resultados",
+                         len(tree_entries), len(result_entries))
+        return {'tree_cache': len(tree_entries), 'result_cache': len(result_entries)}
+    
+    def import_cache_snapshot(self, path: str) -> Dict[str, int]:
+        """
+        Importa una instantánea de caches generada con la misma huella
+        
+        Args:
+            path: Ruta del archivo
+            
+        Returns:
+            Dict con el número de entradas importadas por cache (ceros si la
+            instantánea no es válida o corresponde a otros recursos)
+        """
+        try:
+            snapshot = read_snapshot(path, self.get_fingerprint())
+        except ConfigurationError as e:
+            self.logger.warning("Instantánea de cache rechazada (%s): %s", path, e)
+            return {'tree_cache': 0, 'result_cache': 0}
+        
+        counts = {
+            'tree_cache': self.tree_searcher.import_cache(snapshot['tree_cache']),
+            'result_cache': (self.result_cache.import_entries(snapshot['result_cache'])
+                             if self.result_cache is not None else 0)
+        }
+        self.logger.info("Instantánea de cache importada: %d entradas del árbol, %d resultados",
+                         counts['tree_cache'], counts['result_cache'])
+        return counts
+    
+    def _collect_frequent_tokens(self) -> List[str]:
+        """
+        Agrega al vocabulario los tokens frecuentes del corpus configurado
+        
+        Returns:
+            Tokens agregados, en orden de identificador (vacío sin corpus)
+            
+        Raises:
+            ConfigurationError: Si el corpus configurado no existe
+        """
+        settings = self.config.preprocessing
+        path = settings.get('vocabulary_corpus')
+        if not path:
+            return []
+        
+        first_id = len(self.vocabulary) + 1
+        preprocessor = self.preprocessor
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                added = self.vocabulary.add_frequent_tokens(
+                    (preprocessor.vocabulary_tokens(line) for line in f if line.strip()),
+                    min_count=settings.get('vocabulary_min_count', 2),
+                    max_tokens=settings.get('vocabulary_max_tokens')
+                )
+        except FileNotFoundError:
+            raise ConfigurationError(f"Corpus de vocabulario no encontrado: {path}")
+        
+        self.logger.info("Vocabulario: %d tokens frecuentes agregados desde '%s'", added, path)
+        return self.vocabulary.decode(range(first_id, first_id + added))
+    
+    def warmup(self, path: str, top_n: int = 1000) -> int:
+        """
+        Precarga los caches analizando los textos más frecuentes de un archivo
+        
+        Args:
+            path: Archivo con textos (uno por línea)
+            top_n: Número de textos distintos a analizar
+            
+        Returns:
+            Número de textos analizados
+        """
+        # Analizar textos de precarga alteraría las estadísticas de corpus
+        if self.normalizer.streaming is not None:
+            self.logger.warning("La precarga de caches no se usa con la normalización 'streaming'")
+            return 0
+        
+        texts = read_top_texts(path, top_n)
+        for text in texts:
+            self.analyze_or_error(text)
+        
+        self.logger.info("Caches precargados con %d textos", len(texts))
+        return len(texts)
+    
+    def enable_shared_cache(self) -> bool:
+        """
+        Crea el cache en memoria compartida (si está configurado)
+        
+        Se llama en el proceso principal antes de crear un grupo de procesos
+        con `fork`, para que los trabajadores hereden el mismo segmento.
+        
+        Returns:
+            True si el analizador tiene cache compartido
+        """
+        slots = int(self.config.result_cache.get('shared_slots', 0) or 0)
+        if self.shared_cache is None and slots > 0 and self.normalizer.method != 'streaming':
+            self.shared_cache = SharedResultCache(
+                slots, self.get_fingerprint(), self.tree_searcher.get_leaf_paths(),
+                decimals=self.config.output_format.get('round_decimals', 3),
+                fold_case=self.config.preprocessing.get('convert_to_lowercase', True),
+                stripes=self.config.result_cache.get('shared_stripes', 64)
+            )
+            self._build_pipeline()
+        return self.shared_cache is not None
+    
+    def _get_cached_result(self, text: str, start_time: float,
+                           persistent_cache: PersistentResultCache = None) -> SentimentResult:
+        """
+        Busca un resultado en el cache en memoria y después en el persistente
+        
+        Args:
+            text: Texto (ya validado)
+            start_time: Inicio del análisis
+            persistent_cache: Cache persistente a consultar (o None)
+            
+        Returns:
+            Resultado cacheado o None
+        """
+        if self.result_cache is not None:
+            result = self.result_cache.get(text, time.time() - start_time)
+            if result is not None:
+                return result
+        
+        if persistent_cache is not None:
+            result = persistent_cache.get(text, time.time() - start_time)
+            if result is not None and self.result_cache is not None:
+                self.result_cache.put(text, result)
+            return result
+        
+        return None
+    
     def _load_system_config(self) -> Dict[str, Any]:
         """Carga la configuración del sistema"""
         try:
@@ -209,32 +515,15 @@ class SentimentAnalyzer:
         except json.JSONDecodeError as e:
             raise ConfigurationError(f"Error al parsear palabras clave: {str(e)}")
     
-    def _determine_analysis_quality(self, confidence: float, processing_time: float) -> str:
-        """
-        Determina la calidad del análisis basado en confianza y tiempo
-        
-        Args:
-            confidence: Confianza del análisis
-            processing_time: Tiempo de procesamiento
-            
-        Returns:
-            Calidad del análisis ('high', 'medium', 'low')
-        """
-        # Factor de confianza
-        confidence_factor = confidence
-        
-        # Factor de tiempo (menor tiempo = mejor calidad)
-        time_factor = max(0.0, 1.0 - (processing_time / 1.0))  # Normalizar a 1 segundo
-        
-        # Calcular calidad combinada
-        quality_score = (confidence_factor * 0.7) + (time_factor * 0.3)
-        
-        if quality_score >= 0.8:
-            return 'high'
-        elif quality_score >= 0.6:
-            return 'medium'
-        else:
-            return 'low'
+    def _load_fuzzy_rules_data(self) -> Dict[str, Any]:
+        """Carga la base de reglas difusas"""
+        try:
+            with open('resources/fuzzy_rules.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ConfigurationError("Archivo de reglas difusas no encontrado")
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Error al parsear reglas difusas: {str(e)}")
     
     def get_system_info(self) -> Dict[str, Any]:
         """
@@ -255,7 +544,15 @@ class SentimentAnalyzer:
             'tree_info': tree_info,
             'cache_info': {
                 'enabled': self.config.enable_memoization,
-                'size': tree_info.get('cache_size', 0)
+                'size': tree_info.get('cache_size', 0),
+                'result_cache': (self.result_cache.stats()
+                                 if self.result_cache is not None else {'enabled': False}),
+                'persistent_cache': (self.persistent_cache.stats()
+                                     if self.persistent_cache is not None else {'enabled': False}),
+                'shared_cache': (self.shared_cache.stats()
+                                 if self.shared_cache is not None else {'enabled': False}),
+                'fast_path': (self.fast_path.stats()
+                              if self.fast_path is not None else {'enabled': False})
             },
             'components': {
                 'text_preprocessor': 'initialized',
@@ -266,12 +563,68 @@ class SentimentAnalyzer:
             }
         }
     
+    def get_memory_footprint(self) -> Dict[str, int]:
+        """
+        Estima la memoria ocupada por los componentes del analizador
+        
+        Returns:
+            Dict con los bytes aproximados de cada componente, el total y el
+            tamaño en disco del cache persistente (no incluido en el total)
+        """
+        preprocessor = self.preprocessor
+        keyword_matcher = self.keyword_matcher
+        tree_cache = self.tree_searcher.memoization_cache
+        
+        footprint = {
+            'lexicon': deep_sizeof([keyword_matcher.keywords, keyword_matcher.get_hit_index(),
+                                    preprocessor.intensifiers, preprocessor.attenuators,
+                                    preprocessor.negations, preprocessor.emoticons]),
+            'lexicon_filter': deep_sizeof(keyword_matcher.lexicon_filter),
+            'vocabulary': deep_sizeof(self.vocabulary),
+            'fuzzy_rules': deep_sizeof(self.fuzzy_processor.rule_base),
+            'tree': deep_sizeof([self.tree_searcher.tree, self.tree_searcher.score_vectors]),
+            'tree_cache': tree_cache.memory_usage() if tree_cache is not None else 0,
+            'result_cache': (self.result_cache.memory_usage()
+                             if self.result_cache is not None else 0),
+            'shared_cache': (self.shared_cache.slots * SLOT_SIZE
+                             if self.shared_cache is not None else 0),
+            'fast_path': self.fast_path.memory_usage() if self.fast_path is not None else 0,
+            'logger_buffers': pending_bytes()
+        }
+        footprint['total'] = sum(footprint.values())
+        footprint['persistent_cache_disk'] = (self.persistent_cache.disk_usage()
+                                              if self.persistent_cache is not None else 0)
+        return footprint
+    
     def clear_cache(self):
         """Limpia el cache del sistema"""
-        if hasattr(self, 'tree_searcher') and self.tree_searcher.memoization_cache:
+        if getattr(self, 'result_cache', None) is not None:
+            self.result_cache.clear()
+        if getattr(self, 'persistent_cache', None) is not None:
+            self.persistent_cache.clear()
+        if getattr(self, 'shared_cache', None) is not None:
+            self.shared_cache.clear()
+        if getattr(self, 'fast_path', None) is not None:
+            self.fast_path.clear()
+        if hasattr(self, 'tree_searcher') and self.tree_searcher.memoization_cache is not None:
             self.tree_searcher.memoization_cache.clear()
             self.logger.info("Cache limpiado")
     
+    def save_normalization_state(self, path: str = None) -> bool:
+        """
+        Persiste las estadísticas de la normalización de corpus
+        
+        Args:
+            path: Ruta del archivo (por defecto, `normalization.state_file`)
+            
+        Returns:
+            True si se guardó el estado
+        """
+        saved = self.normalizer.save_state(path)
+        if saved:
+            self.logger.info("Estado de normalización guardado")
+        return saved
+    
     def validate_text(self, text: str) -> bool:
         """
         Valida si un texto puede ser analizado
@@ -284,38 +637,264 @@ class SentimentAnalyzer:
         """
         return self.preprocessor.validate_input(text)
     
-    def batch_analyze(self, texts: list) -> list:
+    def batch_analyze(self, texts: list, workers: int = None, columnar: bool = None):
         """
         Analiza múltiples textos en lote
         
         Args:
             texts: Lista de textos a analizar
+            workers: Número de procesos (por defecto, `batch_processing.workers`;
+                0 usa todos los núcleos y 1 procesa en serie)
+            columnar: Si se devuelve un `ResultBatch` columnar en lugar de una
+                lista (por defecto, `batch_processing.columnar_results`)
             
         Returns:
-            Lista de resultados de análisis
+            Lista de resultados (o `ResultBatch`), en el orden de los textos
         """
-        results = []
+        workers = self._resolve_batch_workers(workers)
+        if columnar is None:
+            columnar = self.config.batch_processing.get('columnar_results', False)
+        decimals = self.config.output_format.get('round_decimals', 3)
+        
+        if self.persistent_cache is not None:
+            results = self._batch_analyze_persistent(list(texts), workers)
+        elif workers > 1 and len(texts) > 1:
+            results = parallel_analyze(self, list(texts), workers)
+        elif columnar:
+            # Cada resultado pasa a las columnas apenas se calcula
+            results = ResultBatch(decimals)
+            for text in texts:
+                results.append(self.analyze_or_error(text))
+        else:
+            results = [self.analyze_or_error(text) for text in texts]
+        
+        if columnar and not isinstance(results, ResultBatch):
+            results = ResultBatch.from_results(results, decimals)
+        
+        self.logger.info("Lote procesado: %d textos", len(results))
+        return results
+    
+    def analyze_stream(self, texts: Iterable[str], batch_size: int = None,
+                       workers: int = None) -> Iterator[SentimentResult]:
+        """
+        Analiza un flujo de textos entregando los resultados a medida que se calculan
+        
+        La entrada se consume por bloques de `batch_size` textos y solo se lee
+        un bloque nuevo cuando se entregaron los resultados anteriores (con
+        varios procesos, hasta `batch_processing.stream_max_pending` bloques
+        en curso), de modo que la memoria no depende del tamaño de la entrada.
+        Los textos que fallan producen un resultado vacío, como en
+        `batch_analyze`.
+        
+        Args:
+            texts: Textos a analizar (cualquier iterable, por ejemplo un archivo)
+            batch_size: Textos por bloque (por defecto, `batch_processing.stream_batch_size`)
+            workers: Número de procesos (por defecto, `batch_processing.workers`)
+            
+        Returns:
+            Iterador de resultados en el orden de los textos
+        """
+        settings = self.config.batch_processing
+        if batch_size is None:
+            batch_size = settings.get('stream_batch_size', 256)
+        batch_size = max(1, int(batch_size))
+        workers = self._resolve_batch_workers(workers)
+        
+        count = 0
+        if workers > 1 and self.persistent_cache is None:
+            # Un solo grupo de procesos para todo el flujo
+            max_pending = int(settings.get('stream_max_pending', 0)) or 2 * workers
+            for result in parallel_stream(self, texts, workers, batch_size, max_pending):
+                count += 1
+                yield result
+        elif workers > 1:
+            # Un solo grupo de procesos; por bloque, una consulta y una
+            # transacción del cache persistente
+            with worker_pool(self, workers) as executor:
+                for chunk in iter_chunks(texts, batch_size):
+                    results = self._batch_analyze_persistent(chunk, workers, executor)
+                    count += len(results)
+                    yield from results
+        else:
+            for chunk in iter_chunks(texts, batch_size):
+                if self.persistent_cache is not None:
+                    results = self._batch_analyze_persistent(chunk, workers)
+                else:
+                    results = [self.analyze_or_error(text) for text in chunk]
+                count += len(results)
+                yield from results
+        
+        self.logger.info("Flujo procesado: %d textos", count)
+    
+    def _resolve_batch_workers(self, workers: int = None) -> int:
+        """
+        Determina el número de procesos de un lote
+        
+        Args:
+            workers: Número pedido (None = `batch_processing.workers`)
+            
+        Returns:
+            Número de procesos (1 si la normalización es 'streaming')
+        """
+        if workers is None:
+            workers = self.config.batch_processing.get('workers', 1)
+        workers = resolve_workers(workers)
+        
+        # La normalización de corpus depende del orden de los documentos
+        if workers > 1 and self.normalizer.streaming is not None:
+            self.logger.warning("La normalización 'streaming' requiere procesamiento en serie")
+            workers = 1
+        return workers
+    
+    def _batch_analyze_persistent(self, texts: List[str], workers: int,
+                                  executor=None) -> List[SentimentResult]:
+        """
+        Analiza un lote consultando y actualizando el cache persistente por lotes
         
-        for i, text in enumerate(texts):
+        Args:
+            texts: Textos a analizar
+            workers: Número de procesos
+            executor: Grupo de procesos ya creado (si no se indica y hay varios
+                procesos, se crea uno para el lote)
+            
+        Returns:
+            Lista de resultados, en el orden de los textos
+        """
+        # 1. Una consulta por lote para los textos válidos
+        valid = [i for i, text in enumerate(texts) if self.preprocessor.validate_input(text)]
+        results = [None] * len(texts)
+        for i, result in zip(valid, self.persistent_cache.get_many([texts[i] for i in valid])):
+            results[i] = result
+        
+        # 2. Analizar solo los textos ausentes, sin consultas individuales al disco
+        missing = [i for i, result in enumerate(results) if result is None]
+        missing_texts = [texts[i] for i in missing]
+        if executor is not None and missing_texts:
+            computed = pool_analyze(executor, missing_texts, workers)
+        elif workers > 1 and len(missing_texts) > 1:
+            computed = parallel_analyze(self, missing_texts, workers)
+        else:
+            computed = [self.analyze_or_error(text, persistent=False) for text in missing_texts]
+        
+        # 3. Una transacción para todos los resultados nuevos
+        valid_set = set(valid)
+        new_entries = []
+        for i, result in zip(missing, computed):
+            results[i] = result
+            if i in valid_set and result.sentiments:
+                new_entries.append((texts[i], result))
+        self.persistent_cache.put_many(new_entries)
+        
+        return results
+    
+    def analyze_or_error(self, text: str, persistent: bool = True) -> SentimentResult:
+        """
+        Analiza un texto devolviendo un resultado de error en lugar de lanzar excepciones
+        
+        Args:
+            text: Texto a analizar
+            persistent: Si se consulta y actualiza el cache persistente
+            
+        Returns:
+            Resultado del análisis o resultado de error vacío
+        """
+        try:
+            return self.analyze(text, persistent)
+        except Exception as e:
+            self.logger.error("Error al procesar texto '%.50s': %s", text, e)
+            return self._error_result(text)
+    
+    def _error_result(self, text: str) -> SentimentResult:
+        """Crea el resultado vacío usado para los textos que no se pudieron analizar"""
+        return SentimentResult(
+            text=text,
+            sentiments={},
+            confidence=0.0,
+            processing_time=0.0,
+            matched_keywords={},
+            tree_path=[],
+            modifiers_applied={},
+            dominant_sentiment=None,
+            secondary_sentiments=[],
+            analysis_quality='low'
+        )
+    
+    def _analyze_outcomes(self, texts: List[str]) -> List[tuple]:
+        """
+        Analiza un micro-lote conservando la excepción de cada texto fallido
+        
+        Args:
+            texts: Textos del micro-lote
+            
+        Returns:
+            Lista de tuplas (éxito, resultado o excepción)
+        """
+        outcomes = []
+        for text in texts:
             try:
-                result = self.analyze(text)
-                results.append(result)
-                self.logger.info(f"Procesado texto {i+1}/{len(texts)}")
+                outcomes.append((True, self.analyze(text)))
             except Exception as e:
-                self.logger.error(f"Error al procesar texto {i+1}: {str(e)}")
-                # Crear resultado de error
-                error_result = SentimentResult(
-                    text=text,
-                    sentiments={},
-                    confidence=0.0,
-                    processing_time=0.0,
-                    matched_keywords={},
-                    tree_path=[],
-                    modifiers_applied={},
-                    dominant_sentiment=None,
-                    secondary_sentiments=[],
-                    analysis_quality='low'
-                )
-                results.append(error_result)
+                outcomes.append((False, e))
+        return outcomes
+    
+    def _get_batcher(self) -> MicroBatcher:
+        """Obtiene (o crea) el agrupador de micro-lotes del bucle de eventos actual"""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            settings = self.config.batch_processing
+            batcher = MicroBatcher(
+                self._analyze_outcomes,
+                max_batch_size=settings.get('max_batch_size', 32),
+                flush_interval_ms=settings.get('flush_interval_ms', 5),
+                max_in_flight=settings.get('max_in_flight', 256)
+            )
+            self._batchers[loop] = batcher
+        return batcher
+    
+    async def analyze_async(self, text: str) -> SentimentResult:
+        """
+        Analiza un texto sin bloquear el bucle de eventos
+        
+        La solicitud se agrupa con otras en un micro-lote que se ejecuta en
+        el ejecutor del bucle de eventos.
         
-        return results 
\ No newline at end of file
+        Args:
+            text: Texto a analizar
+            
+        Returns:
+            Resultado del análisis de sentimientos
+            
+        Raises:
+            SentimentAnalysisError: Si el análisis falla
+        """
+        return await self._get_batcher().submit(text)
+    
+    async def analyze_many_async(self, texts: list) -> list:
+        """
+        Analiza múltiples textos sin bloquear el bucle de eventos
+        
+        Args:
+            texts: Lista de textos a analizar
+            
+        Returns:
+            Lista de resultados en el orden de los textos (resultado de error
+            vacío para los textos que fallan, como en `batch_analyze`)
+        """
+        batcher = self._get_batcher()
+        outcomes = await asyncio.gather(*(batcher.submit(text) for text in texts),
+                                        return_exceptions=True)
+        
+        results = []
+        for text, outcome in zip(texts, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error("Error al procesar texto '%.50s': %s", text, outcome)
+                outcome = self._error_result(text)
+            results.append(outcome)
+        return results
+    
+    async def aclose(self):
+        """Cierra el agrupador de micro-lotes del bucle de eventos actual"""
+        batcher = self._batchers.pop(asyncio.get_running_loop(), None)
+        if batcher is not None:
+            await batcher.close() 
\ No newline at end of file
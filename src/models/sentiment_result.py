@@ -3,40 +3,104 @@ Modelos de Resultados de Análisis de Sentimientos
 ================================================
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import copy
 import time
+from .sentiment_vector import SentimentVector
+
+
+class Explanation:
+    """
+    Datos mínimos para construir los campos de explicación de un resultado
+    
+    Las palabras clave encontradas se calculan a partir de los identificadores
+    de tokens solo cuando se consultan; la ruta y los modificadores se copian
+    en cada consulta, de modo que cada resultado que comparte el manejador
+    recibe contenedores propios.
+    """
+    
+    __slots__ = ('keyword_matcher', 'token_ids', 'path', 'modifiers')
+    
+    def __init__(self, keyword_matcher: Any = None, token_ids: Any = None,
+                 path: List[str] = None, modifiers: Dict[str, Any] = None):
+        """
+        Args:
+            keyword_matcher: Coincidencia de palabras clave (con `find_matches_by_ids`)
+            token_ids: Identificadores de tokens del texto
+            path: Ruta recorrida en el árbol de decisión
+            modifiers: Modificadores aplicados
+        """
+        self.keyword_matcher = keyword_matcher
+        self.token_ids = token_ids
+        self.path = path
+        self.modifiers = modifiers
+    
+    def matched_keywords(self) -> Dict[str, List[str]]:
+        """Palabras clave encontradas por sentimiento"""
+        if self.keyword_matcher is None or self.token_ids is None:
+            return {}
+        return self.keyword_matcher.find_matches_by_ids(self.token_ids)
+    
+    def tree_path(self) -> List[str]:
+        """Ruta recorrida en el árbol de decisión"""
+        return list(self.path) if self.path is not None else []
+    
+    def modifiers_applied(self) -> Dict[str, Any]:
+        """Modificadores aplicados"""
+        if self.modifiers is None:
+            return {}
+        return {name: list(value) if isinstance(value, list) else value
+                for name, value in self.modifiers.items()}
+    
+    def __deepcopy__(self, memo):
+        # Los datos del manejador no se modifican; la copia profunda lo comparte
+        return self
 
 
 @dataclass
 class SentimentResult:
     """Resultado del análisis de sentimientos"""
     text: str
-    sentiments: Dict[str, float]  # {'alegria': 0.75, 'tristeza': 0.2, ...}
+    sentiments: Dict[str, float]  # {'alegria': 0.75, ...} (o SentimentVector, convertido al consultarlo)
     confidence: float             # Confianza general del análisis (0-1)
     processing_time: float        # Tiempo de procesamiento en segundos
-    matched_keywords: Dict[str, List[str]]  # Palabras clave encontradas por sentimiento
-    tree_path: List[str]          # Ruta recorrida en el árbol de decisión
-    modifiers_applied: Dict[str, List[str]]  # Modificadores aplicados
+    matched_keywords: Dict[str, List[str]] = None  # Palabras clave encontradas por sentimiento
+    tree_path: List[str] = None   # Ruta recorrida en el árbol de decisión
+    modifiers_applied: Dict[str, List[str]] = None  # Modificadores aplicados
     dominant_sentiment: Optional[str] = None  # Sentimiento dominante
     secondary_sentiments: List[str] = None    # Sentimientos secundarios
-    analysis_quality: str = "medium"          # 'high', 'medium', 'low'
+    analysis_quality: Optional[str] = None    # 'high', 'medium', 'low'
+    # Campos de explicación no indicados, construidos en el primer acceso
+    explanation: Optional[Explanation] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validaciones post-inicialización"""
-        if self.secondary_sentiments is None:
-            self.secondary_sentiments = []
-        
+        """Completa solo los campos que no se indicaron"""
         # Determinar sentimiento dominante si no se especifica
         if self.dominant_sentiment is None:
             self._determine_dominant_sentiment()
         
-        # Determinar sentimientos secundarios
-        if not self.secondary_sentiments:
+        # Determinar sentimientos secundarios si no se especifican
+        if self.secondary_sentiments is None:
             self._determine_secondary_sentiments()
         
-        # Determinar calidad del análisis
-        self._determine_analysis_quality()
+        # Determinar calidad del análisis si no se especifica
+        if self.analysis_quality is None:
+            self._determine_analysis_quality()
+    
+    def __copy__(self) -> 'SentimentResult':
+        """Copia superficial que conserva el manejador (la explicación sigue diferida)"""
+        copied = object.__new__(type(self))
+        copied.__dict__.update(self.__dict__)
+        return copied
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Estado para serializar (con la explicación ya construida, sin el manejador)"""
+        for name in EXPLANATION_FIELDS:
+            getattr(self, name)
+        state = dict(self.__dict__)
+        state['explanation'] = None
+        return state
     
     def _determine_dominant_sentiment(self):
         """Determina el sentimiento dominante basado en las puntuaciones"""
@@ -99,6 +163,89 @@ class SentimentResult:
         return f"SentimentResult(dominant='{self.dominant_sentiment}', confidence={self.confidence:.3f})"
 
 
+# Campos de SentimentResult que pueden construirse bajo demanda
+EXPLANATION_FIELDS = ('matched_keywords', 'tree_path', 'modifiers_applied')
+
+# Manejador de los resultados sin explicación (campos vacíos)
+_NO_EXPLANATION = Explanation()
+
+
+def detached_copy(result: SentimentResult) -> SentimentResult:
+    """
+    Copia superficial de un resultado con diccionarios y listas propios
+    
+    Modificar la copia no afecta al original ni al revés; los campos de
+    explicación aún no construidos se construyen por separado en cada uno.
+    
+    Args:
+        result: Resultado a copiar
+    
+    Returns:
+        Resultado nuevo con los mismos valores
+    """
+    copied = copy.copy(result)
+    state = copied.__dict__
+    if isinstance(state.get('_sentiments'), dict):
+        state['_sentiments'] = dict(state['_sentiments'])
+    if copied.secondary_sentiments is not None:
+        copied.secondary_sentiments = list(copied.secondary_sentiments)
+    if state.get('_matched_keywords') is not None:
+        state['_matched_keywords'] = {sentiment: list(words)
+                                      for sentiment, words in state['_matched_keywords'].items()}
+    if state.get('_tree_path') is not None:
+        state['_tree_path'] = list(state['_tree_path'])
+    if state.get('_modifiers_applied') is not None:
+        state['_modifiers_applied'] = {name: list(value) if isinstance(value, list) else value
+                                       for name, value in state['_modifiers_applied'].items()}
+    return copied
+
+
+def _sentiments_getter(self) -> Dict[str, float]:
+    """Puntuaciones por sentimiento (el vector recibido se convierte en el primer acceso)"""
+    value = self.__dict__['_sentiments']
+    if isinstance(value, SentimentVector):
+        value = self.__dict__['_sentiments'] = value.to_dict()
+    return value
+
+
+def _sentiments_setter(self, value):
+    self.__dict__['_sentiments'] = value
+
+
+def _explanation_property(name: str) -> property:
+    """
+    Crea la propiedad de un campo de explicación
+    
+    Un valor indicado al construir el resultado se usa tal cual; si no se
+    indicó, se obtiene del manejador `explanation` en el primer acceso.
+    
+    Args:
+        name: Nombre del campo
+    
+    Returns:
+        Propiedad con lectura diferida y escritura directa
+    """
+    attribute = '_' + name
+    
+    def getter(self):
+        value = self.__dict__.get(attribute)
+        if value is None:
+            explanation = self.__dict__.get('explanation')
+            value = getattr(explanation if explanation is not None else _NO_EXPLANATION, name)()
+            self.__dict__[attribute] = value
+        return value
+    
+    def setter(self, value):
+        self.__dict__[attribute] = value
+    
+    return property(getter, setter)
+
+
+for _name in EXPLANATION_FIELDS:
+    setattr(SentimentResult, _name, _explanation_property(_name))
+SentimentResult.sentiments = property(_sentiments_getter, _sentiments_setter)
+
+
 @dataclass
 class DecisionTreeNode:
     """Nodo del árbol de decisión"""
@@ -136,12 +283,16 @@ class SystemConfig:
     min_confidence: float = 0.3
     enable_fuzzy_logic: bool = True
     enable_memoization: bool = True
+    enable_fast_path: bool = True  # Resolver textos sin coincidencias ni modificadores con plantillas
     sentiment_thresholds: Dict[str, float] = None
     fuzzy_parameters: Dict[str, float] = None
     preprocessing: Dict[str, any] = None
     tree_search: Dict[str, any] = None
     output_format: Dict[str, any] = None
     logging: Dict[str, any] = None
+    normalization: Dict[str, any] = None
+    batch_processing: Dict[str, any] = None
+    result_cache: Dict[str, any] = None
     
     def __post_init__(self):
         """Inicializar valores por defecto"""
@@ -161,7 +312,9 @@ class SystemConfig:
                 'attenuation_factor': 0.7,
                 'negation_factor': 0.3,
                 'mixed_emotion_threshold': 0.6,
-                'context_weight': 0.3
+                'context_weight': 0.3,
+                'inference_engine': 'heuristic',  # 'heuristic' o 'mamdani'
+                'modifier_scope': 0  # Coincidencias alcanzadas por cada modificador (0 = texto completo)
             }
         
         if self.preprocessing is None:
@@ -170,7 +323,10 @@ class SystemConfig:
                 'convert_to_lowercase': True,
                 'remove_stopwords': False,
                 'stemming': False,
-                'max_word_length': 20
+                'max_word_length': 20,
+                'vocabulary_corpus': None,  # Textos (uno por línea) cuyos tokens frecuentes reciben identificador
+                'vocabulary_min_count': 2,  # Frecuencia mínima de un token del corpus
+                'vocabulary_max_tokens': 10000  # Tokens del corpus agregados como máximo
             }
         
         if self.tree_search is None:
@@ -178,7 +334,9 @@ class SystemConfig:
                 'max_depth': 10,
                 'timeout_seconds': 5,
                 'enable_backtracking': True,
-                'cache_size': 1000
+                'cache_size': 1000,
+                'cache_stripes': 16,  # Segmentos del cache (un candado por segmento)
+                'cache_max_bytes': 0  # Tamaño máximo aproximado del cache (0 = sin límite)
             }
         
         if self.output_format is None:
@@ -196,5 +354,41 @@ class SystemConfig:
                 'level': 'INFO',
                 'enable_file_logging': True,
                 'log_file': 'sentiment_analysis.log',
-                'enable_console_logging': True
+                'enable_console_logging': True,
+                'log_requests': False,  # Registrar cada análisis a nivel INFO
+                'queue_logging': True  # Escribir los logs desde un hilo en segundo plano
+            }
+        
+        if self.normalization is None:
+            self.normalization = {
+                'method': 'min_max',  # 'min_max', 'z_score', 'softmax' o 'streaming'
+                'streaming_window': 0,  # Documentos de la ventana móvil (0 = todo el corpus)
+                'state_file': None  # Archivo de estado persistido del modo 'streaming'
+            }
+        
+        if self.batch_processing is None:
+            self.batch_processing = {
+                'workers': 1,  # Procesos para batch_analyze (0 = todos los núcleos)
+                'chunk_size': 0,  # Textos por bloque (0 = ajuste automático)
+                'target_chunk_ms': 50,  # Duración objetivo de un bloque en el ajuste automático
+                'sample_size': 8,  # Textos analizados localmente para medir el costo
+                'start_method': 'auto',  # 'auto', 'fork', 'spawn' o 'forkserver'
+                'max_batch_size': 32,  # Textos por micro-lote en la API asíncrona
+                'flush_interval_ms': 5,  # Espera máxima para completar un micro-lote
+                'max_in_flight': 256,  # Solicitudes asíncronas encoladas o en ejecución
+                'columnar_results': False,  # batch_analyze devuelve un ResultBatch columnar
+                'stream_batch_size': 256,  # Textos por bloque en analyze_stream
+                'stream_max_pending': 0  # Bloques en curso en analyze_stream con procesos (0 = 2 por proceso)
+            }
+        
+        if self.result_cache is None:
+            self.result_cache = {
+                'enabled': False,
+                'max_entries': 10000,  # Resultados completos en memoria
+                'max_bytes': 0,  # Tamaño máximo aproximado en memoria (0 = sin límite)
+                'stripes': 16,  # Segmentos del cache (un candado por segmento)
+                'persistent_path': None,  # Base SQLite del cache persistente (None = deshabilitado)
+                'shared_slots': 0,  # Ranuras del cache compartido entre procesos (0 = deshabilitado)
+                'shared_stripes': 64,  # Regiones del cache compartido (un candado por región)
+                'snapshot_file': None  # Instantánea de caches importada al iniciar
             } 
\ No newline at end of file
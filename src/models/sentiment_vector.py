@@ -0,0 +1,125 @@
+"""
+Esquema y Vector de Sentimientos
+================================
+
+Define el orden fijo de los sentimientos compartido por todas las etapas
+y un vector compacto respaldado por array('d') que reemplaza a los
+diccionarios de puntuaciones dentro del pipeline.
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+
+# Orden canónico de los sentimientos del sistema
+SENTIMENTS = ('alegria', 'tristeza', 'enojo', 'preocupacion', 'informacion', 'sorpresa')
+
+# Posición de cada sentimiento en el vector
+SENTIMENT_INDEX = {sentiment: i for i, sentiment in enumerate(SENTIMENTS)}
+
+
+@lru_cache(maxsize=64)
+def _positions_for(names: Tuple[str, ...]) -> Dict[str, int]:
+    """Obtiene (y reutiliza) el mapa de posiciones para un esquema"""
+    if names == SENTIMENTS:
+        return SENTIMENT_INDEX
+    return {name: i for i, name in enumerate(names)}
+
+
+class SentimentVector:
+    """Vector de puntuaciones de sentimientos con orden fijo"""
+    
+    __slots__ = ('names', 'values', '_positions')
+    
+    def __init__(self, values: Iterable[float] = None, names: Tuple[str, ...] = SENTIMENTS):
+        self.names = names
+        self.values = array('d', values) if values is not None else array('d', bytes(8 * len(names)))
+        self._positions = _positions_for(names)
+        
+        if len(self.values) != len(names):
+            raise ValueError(f"Se esperaban {len(names)} puntuaciones, se recibieron {len(self.values)}")
+    
+    @classmethod
+    def from_dict(cls, scores: Dict[str, float]) -> 'SentimentVector':
+        """
+        Construye un vector desde un diccionario de puntuaciones
+        
+        Si el diccionario contiene exactamente los sentimientos del sistema
+        en su orden canónico se reutiliza el esquema compartido; en otro caso
+        el vector conserva las claves y el orden del diccionario.
+        
+        Args:
+            scores: Puntuaciones por sentimiento
+        
+        Returns:
+            Vector de sentimientos
+        """
+        names = tuple(scores)
+        if names == SENTIMENTS:
+            names = SENTIMENTS
+        return cls(scores.values(), names)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convierte el vector a diccionario (frontera de salida)"""
+        return dict(zip(self.names, self.values))
+    
+    def copy(self) -> 'SentimentVector':
+        """Crea una copia independiente del vector"""
+        vector = SentimentVector.__new__(SentimentVector)
+        vector.names = self.names
+        vector.values = array('d', self.values)
+        vector._positions = self._positions
+        return vector
+    
+    def index(self, sentiment: str) -> int:
+        """
+        Obtiene la posición de un sentimiento
+        
+        Args:
+            sentiment: Nombre del sentimiento
+        
+        Returns:
+            Posición en el vector o -1 si no forma parte del esquema
+        """
+        return self._positions.get(sentiment, -1)
+    
+    def argmax(self) -> int:
+        """Posición del valor máximo (el primero en caso de empate)"""
+        values = self.values
+        best = 0
+        for i in range(1, len(values)):
+            if values[i] > values[best]:
+                best = i
+        return best
+    
+    def clamp(self, low: float = 0.0, high: float = 1.0) -> 'SentimentVector':
+        """Limita los valores al rango [low, high] en el lugar"""
+        values = self.values
+        for i in range(len(values)):
+            values[i] = max(low, min(high, values[i]))
+        return self
+    
+    def items(self) -> Iterator[Tuple[str, float]]:
+        return zip(self.names, self.values)
+    
+    def __getitem__(self, key: Union[str, int]) -> float:
+        if isinstance(key, str):
+            return self.values[self._positions[key]]
+        return self.values[key]
+    
+    def __setitem__(self, key: Union[str, int], value: float):
+        if isinstance(key, str):
+            key = self._positions[key]
+        self.values[key] = value
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SentimentVector):
+            return NotImplemented
+        return self.names == other.names and self.values == other.values
+    
+    def __repr__(self) -> str:
+        return f"SentimentVector({self.to_dict()})"
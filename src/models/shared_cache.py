@@ -0,0 +1,194 @@
+"""
+Cache de Resultados en Memoria Compartida
+=========================================
+
+Módulo con un cache de resultados compartido entre los procesos de un grupo
+creado con `fork`. La tabla es un hash de direccionamiento abierto de tamaño
+fijo sobre `multiprocessing.shared_memory`: cada ranura guarda el hash del
+texto normalizado y un registro empaquetado con las seis puntuaciones
+(float32), la confianza y el identificador de la hoja del árbol. La tabla se
+divide en regiones con un candado por región; el sondeo lineal no sale de la
+región, de modo que una operación toma un solo candado.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import struct
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+from .sentiment_vector import SENTIMENTS
+from .result_cache import normalize_text
+
+
+# Ranura: hash (u64), puntuaciones (6 x float32), confianza (float64), hoja (u32)
+SLOT_FORMAT = '<Q' + 'f' * len(SENTIMENTS) + 'dI'
+SLOT_SIZE = struct.calcsize(SLOT_FORMAT)
+
+# Ranuras examinadas antes de reemplazar la ranura inicial
+MAX_PROBES = 8
+
+
+def _release(memory: shared_memory.SharedMemory, owner_pid: int):
+    """Libera el segmento (solo el proceso que lo creó lo elimina)"""
+    memory.close()
+    if os.getpid() == owner_pid:
+        memory.unlink()
+
+
+class SharedResultCache:
+    """Cache de resultados en memoria compartida entre procesos"""
+    
+    def __init__(self, slots: int, fingerprint: str, leaf_paths: Dict[str, List[str]],
+                 decimals: int = 3, fold_case: bool = True, stripes: int = 64):
+        """
+        Args:
+            slots: Número de ranuras de la tabla
+            fingerprint: Huella de la configuración y los recursos
+            leaf_paths: Ruta de cada hoja identificable (ver `TreeSearcher.get_leaf_paths`)
+            decimals: Decimales de las puntuaciones (recuperan el valor exacto del float32)
+            fold_case: Si las mayúsculas se ignoran en la clave
+            stripes: Número de regiones con candado propio
+        """
+        self.stripes = max(1, min(int(stripes), int(slots)))
+        self.region_size = max(1, int(slots) // self.stripes)
+        self.slots = self.region_size * self.stripes
+        self.decimals = decimals
+        self.fold_case = fold_case
+        self._hash_key = fingerprint.encode('utf-8')[:64]
+        
+        # Identificadores de hoja: posición en la lista ordenada de hojas
+        self._leaf_paths = [leaf_paths[leaf_id] for leaf_id in sorted(leaf_paths)]
+        self._leaf_ids = {tuple(path): i for i, path in enumerate(self._leaf_paths)}
+        
+        self._memory = shared_memory.SharedMemory(create=True, size=self.slots * SLOT_SIZE)
+        self._memory.buf[:self.slots * SLOT_SIZE] = bytes(self.slots * SLOT_SIZE)
+        self._locks = [multiprocessing.Lock() for _ in range(self.stripes)]
+        self._finalizer = weakref.finalize(self, _release, self._memory, os.getpid())
+        self.hits = 0
+        self.misses = 0
+    
+    def _hash(self, text: str) -> int:
+        """Hash de 64 bits del texto normalizado (0 indica ranura vacía)"""
+        normalized = normalize_text(text, self.fold_case).encode('utf-8')
+        digest = hashlib.blake2b(normalized, digest_size=8, key=self._hash_key).digest()
+        return int.from_bytes(digest, 'little') or 1
+    
+    def _region(self, key_hash: int) -> Tuple[int, int]:
+        """Región (candado) y ranura inicial dentro de la región"""
+        stripe = key_hash % self.stripes
+        return stripe, (key_hash // self.stripes) % self.region_size
+    
+    def _offset(self, stripe: int, position: int) -> int:
+        """Desplazamiento en bytes de una ranura"""
+        return (stripe * self.region_size + position % self.region_size) * SLOT_SIZE
+    
+    def get(self, text: str) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+        """
+        Obtiene el resultado compartido de un texto
+        
+        Args:
+            text: Texto original
+        
+        Returns:
+            Tupla (resumen con 'sentiments', 'confidence', 'dominant_sentiment' y
+            'secondary_sentiments', ruta del árbol) o None si no está
+        """
+        key_hash = self._hash(text)
+        stripe, home = self._region(key_hash)
+        buffer = self._memory.buf
+        record = None
+        
+        with self._locks[stripe]:
+            for probe in range(min(MAX_PROBES, self.region_size)):
+                slot = struct.unpack_from(SLOT_FORMAT, buffer, self._offset(stripe, home + probe))
+                if slot[0] == key_hash:
+                    record = slot
+                    break
+                if slot[0] == 0:
+                    break
+        
+        if record is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        values = [round(value, self.decimals) for value in record[1:1 + len(SENTIMENTS)]]
+        # Orden estable: un empate queda detrás del sentimiento anterior
+        ranked = sorted(range(len(values)), key=lambda i: -values[i])
+        summary = {
+            'sentiments': dict(zip(SENTIMENTS, values)),
+            'confidence': record[-2],
+            'dominant_sentiment': SENTIMENTS[ranked[0]],
+            'secondary_sentiments': [SENTIMENTS[i] for i in ranked[1:3]]
+        }
+        return summary, list(self._leaf_paths[record[-1]])
+    
+    def put(self, text: str, summary: Dict[str, Any], tree_path: List[str]) -> bool:
+        """
+        Almacena el resultado de un texto
+        
+        Args:
+            text: Texto original
+            summary: Resumen devuelto por `ScoreNormalizer.summarize`
+            tree_path: Ruta recorrida en el árbol
+        
+        Returns:
+            True si se almacenó (la ruta debe corresponder a una hoja identificable)
+        """
+        leaf_id = self._leaf_ids.get(tuple(tree_path))
+        sentiments = summary['sentiments']
+        if leaf_id is None or list(sentiments) != list(SENTIMENTS):
+            return False
+        
+        key_hash = self._hash(text)
+        stripe, home = self._region(key_hash)
+        buffer = self._memory.buf
+        
+        with self._locks[stripe]:
+            # Ranura del mismo texto, la primera vacía o, si no hay, la inicial
+            target = self._offset(stripe, home)
+            for probe in range(min(MAX_PROBES, self.region_size)):
+                offset = self._offset(stripe, home + probe)
+                current = struct.unpack_from('<Q', buffer, offset)[0]
+                if current == key_hash or current == 0:
+                    target = offset
+                    break
+            struct.pack_into(SLOT_FORMAT, buffer, target, key_hash,
+                             *sentiments.values(), summary['confidence'], leaf_id)
+        return True
+    
+    def clear(self):
+        """Vacía la tabla y reinicia las estadísticas del proceso"""
+        for stripe, lock in enumerate(self._locks):
+            start = stripe * self.region_size * SLOT_SIZE
+            end = start + self.region_size * SLOT_SIZE
+            with lock:
+                self._memory.buf[start:end] = bytes(end - start)
+        self.hits = 0
+        self.misses = 0
+    
+    def close(self):
+        """Libera el segmento de memoria compartida"""
+        self._finalizer()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas del cache
+        
+        Returns:
+            Dict con ranuras, bytes, ocupación y aciertos/fallos de este proceso
+        """
+        buffer = self._memory.buf
+        used = sum(1 for slot in range(self.slots)
+                   if struct.unpack_from('<Q', buffer, slot * SLOT_SIZE)[0])
+        lookups = self.hits + self.misses
+        return {
+            'slots': self.slots,
+            'bytes': self.slots * SLOT_SIZE,
+            'size': used,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
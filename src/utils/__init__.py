@@ -6,4 +6,10 @@ Contiene las utilidades del sistema:
 - keyword_matcher: Coincidencia de palabras clave
 - intensity_calculator: Cálculo de intensidades
 - normalizer: Normalización de puntuaciones
+- streaming_normalizer: Normalización incremental con estadísticas de corpus
+- vocabulary: Vocabulario de tokens con identificadores enteros
+- cache: Cache LRU segmentado seguro entre hilos
+- log_queue: Escritura de logs en segundo plano
+- memory: Estimación del tamaño en memoria de las estructuras
+- bloom_filter: Filtro de Bloom para descartar tokens fuera del léxico
 """ 
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Filtro de Bloom
+===============
+
+Módulo con un filtro de Bloom compacto para descartar rápidamente los tokens
+que no pertenecen al léxico. Una respuesta negativa es segura (el token no
+está en el conjunto); una positiva puede ser un falso positivo con la tasa
+configurada. El filtro se serializa a bytes para compartirlo con los
+procesos trabajadores sin reconstruirlo.
+"""
+
+import hashlib
+import math
+import struct
+import unicodedata
+from typing import Iterable, Set
+from ..models.exceptions import ConfigurationError
+
+
+# Tasa de falsos positivos por defecto
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+# Cabecera serializada: bits, funciones hash y elementos agregados
+_HEADER_FORMAT = '<IIQ'
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+
+
+def fold_token(token: str) -> str:
+    """
+    Obtiene la forma plegada de un token (minúsculas y sin tildes)
+    
+    Args:
+        token: Token original
+    
+    Returns:
+        Token en minúsculas sin marcas diacríticas
+    """
+    decomposed = unicodedata.normalize('NFKD', token.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def token_forms(tokens: Iterable[str]) -> Set[str]:
+    """
+    Obtiene los tokens junto con sus formas en minúsculas y plegadas
+    
+    Args:
+        tokens: Tokens originales
+    
+    Returns:
+        Conjunto con todas las formas
+    """
+    forms = set()
+    for token in tokens:
+        forms.add(token)
+        forms.add(token.lower())
+        forms.add(fold_token(token))
+    return forms
+
+
+class BloomFilter:
+    """Filtro de Bloom sobre un arreglo de bits"""
+    
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE):
+        """
+        Args:
+            capacity: Número esperado de elementos
+            false_positive_rate: Tasa de falsos positivos deseada (entre 0 y 1)
+        """
+        capacity = max(1, int(capacity))
+        rate = min(max(false_positive_rate, 1e-9), 0.5)
+        
+        # Tamaño óptimo: m = -n ln(p) / ln(2)^2 y k = m/n ln(2)
+        num_bits = max(8, int(math.ceil(-capacity * math.log(rate) / (math.log(2) ** 2))))
+        self.num_bits = num_bits
+        self.hash_count = max(1, int(round(num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((num_bits + 7) // 8)
+    
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str],
+                    false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> 'BloomFilter':
+        """
+        Construye un filtro con los tokens y sus formas plegadas
+        
+        Args:
+            tokens: Tokens del conjunto
+            false_positive_rate: Tasa de falsos positivos deseada
+        
+        Returns:
+            Filtro con todas las formas agregadas
+        """
+        forms = token_forms(tokens)
+        bloom = cls(len(forms), false_positive_rate)
+        for form in forms:
+            bloom.add(form)
+        return bloom
+    
+    def _positions(self, token: str):
+        """Posiciones de bits de un token (doble hash sobre un único digest)"""
+        digest = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return [(first + i * second) % num_bits for i in range(self.hash_count)]
+    
+    def add(self, token: str):
+        """
+        Agrega un token al filtro
+        
+        Args:
+            token: Token a agregar
+        """
+        bits = self._bits
+        for position in self._positions(token):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, token: str) -> bool:
+        bits = self._bits
+        for position in self._positions(token):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa el filtro
+        
+        Returns:
+            Cabecera y arreglo de bits
+        """
+        return struct.pack(_HEADER_FORMAT, self.num_bits, self.hash_count, self.count) + bytes(self._bits)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """
+        Reconstruye un filtro serializado con `to_bytes`
+        
+        Args:
+            data: Bytes del filtro
+        
+        Returns:
+            Filtro reconstruido
+        
+        Raises:
+            ConfigurationError: Si los datos no corresponden a un filtro válido
+        """
+        if len(data) < _HEADER_SIZE:
+            raise ConfigurationError("Filtro de Bloom serializado inválido")
+        num_bits, hash_count, count = struct.unpack_from(_HEADER_FORMAT, data)
+        if num_bits == 0 or hash_count == 0 or len(data) - _HEADER_SIZE != (num_bits + 7) // 8:
+            raise ConfigurationError("Filtro de Bloom serializado inválido")
+        
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.hash_count = hash_count
+        bloom.count = count
+        bloom._bits = bytearray(data[_HEADER_SIZE:])
+        return bloom
@@ -0,0 +1,189 @@
+"""
+Cache LRU Segmentado
+====================
+
+Módulo con un cache LRU seguro entre hilos. Las claves se reparten entre
+varios segmentos, cada uno con su propio candado, de modo que los hilos que
+consultan claves distintas rara vez compiten por el mismo candado.
+
+Además del número de elementos, el cache puede limitarse por bytes: el
+tamaño aproximado de cada entrada se mide al insertarla y se expulsan las
+menos usadas hasta quedar dentro del presupuesto.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
+from .memory import deep_sizeof
+
+
+class StripedLRUCache:
+    """Cache LRU con candados por segmento"""
+    
+    def __init__(self, capacity: int, stripes: int = 16, max_bytes: int = 0,
+                 sizeof: Callable[[Any], int] = deep_sizeof):
+        """
+        Args:
+            capacity: Número máximo de elementos (0 = sin límite)
+            stripes: Número de segmentos (se limita a la capacidad)
+            max_bytes: Tamaño máximo aproximado en bytes (0 = sin límite)
+            sizeof: Función que estima el tamaño de una entrada (clave, valor)
+        """
+        self.capacity = max(0, int(capacity))
+        self.max_bytes = max(0, int(max_bytes or 0))
+        self._sizeof = sizeof
+        stripe_count = max(1, int(stripes))
+        if self.capacity:
+            stripe_count = min(stripe_count, self.capacity)
+        
+        self._segments: List[OrderedDict] = [OrderedDict() for _ in range(stripe_count)]
+        self._locks = [threading.Lock() for _ in range(stripe_count)]
+        self._hits = [0] * stripe_count
+        self._misses = [0] * stripe_count
+        
+        # Capacidad por segmento; el resto de la división se reparte entre los primeros
+        base, extra = divmod(self.capacity, stripe_count)
+        self._segment_capacity = [base + (1 if i < extra else 0) for i in range(stripe_count)]
+        
+        # Tamaño de cada entrada y bytes por segmento (solo con presupuesto en bytes)
+        self._sizes: List[Dict[Hashable, int]] = [{} for _ in range(stripe_count)]
+        self._bytes = [0] * stripe_count
+        base, extra = divmod(self.max_bytes, stripe_count)
+        self._segment_bytes = [base + (1 if i < extra else 0) for i in range(stripe_count)]
+    
+    def _stripe(self, key: Hashable) -> int:
+        """Segmento asignado a una clave"""
+        return hash(key) % len(self._segments)
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Obtiene un elemento y lo marca como usado recientemente
+        
+        Args:
+            key: Clave a buscar
+            default: Valor si la clave no existe
+        
+        Returns:
+            Valor almacenado o `default`
+        """
+        stripe = self._stripe(key)
+        segment = self._segments[stripe]
+        with self._locks[stripe]:
+            try:
+                value = segment[key]
+            except KeyError:
+                self._misses[stripe] += 1
+                return default
+            segment.move_to_end(key)
+            self._hits[stripe] += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Agrega o reemplaza un elemento, expulsando el menos usado si es necesario
+        
+        Args:
+            key: Clave del elemento
+            value: Valor a almacenar
+        """
+        stripe = self._stripe(key)
+        segment = self._segments[stripe]
+        capacity = self._segment_capacity[stripe]
+        # El tamaño se mide fuera del candado
+        size = self._sizeof((key, value)) if self.max_bytes else 0
+        
+        with self._locks[stripe]:
+            if self.max_bytes:
+                self._discard(stripe, key)
+                # Una entrada mayor que el presupuesto del segmento no se almacena
+                if size > self._segment_bytes[stripe]:
+                    return
+                self._sizes[stripe][key] = size
+                self._bytes[stripe] += size
+            
+            segment[key] = value
+            segment.move_to_end(key)
+            while ((self.capacity and len(segment) > capacity) or
+                   (self.max_bytes and self._bytes[stripe] > self._segment_bytes[stripe])):
+                oldest, _ = segment.popitem(last=False)
+                self._bytes[stripe] -= self._sizes[stripe].pop(oldest, 0)
+    
+    def _discard(self, stripe: int, key: Hashable):
+        """Elimina una entrada y su tamaño (con el candado del segmento tomado)"""
+        self._segments[stripe].pop(key, None)
+        self._bytes[stripe] -= self._sizes[stripe].pop(key, 0)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Elimina un elemento
+        
+        Args:
+            key: Clave a eliminar
+            default: Valor si la clave no existe
+        
+        Returns:
+            Valor eliminado o `default`
+        """
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            self._bytes[stripe] -= self._sizes[stripe].pop(key, 0)
+            return self._segments[stripe].pop(key, default)
+    
+    def clear(self):
+        """Elimina todos los elementos y reinicia las estadísticas"""
+        for stripe, segment in enumerate(self._segments):
+            with self._locks[stripe]:
+                segment.clear()
+                self._sizes[stripe].clear()
+                self._bytes[stripe] = 0
+                self._hits[stripe] = 0
+                self._misses[stripe] = 0
+    
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Copia de los elementos (de menos a más usado dentro de cada segmento)"""
+        items = []
+        for stripe, segment in enumerate(self._segments):
+            with self._locks[stripe]:
+                items.extend(segment.items())
+        return items
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Obtiene las estadísticas del cache
+        
+        Returns:
+            Dict con tamaño, capacidad, aciertos y fallos (y bytes usados y
+            máximos si hay presupuesto en bytes)
+        """
+        stats = {
+            'size': len(self),
+            'capacity': self.capacity,
+            'hits': sum(self._hits),
+            'misses': sum(self._misses)
+        }
+        if self.max_bytes:
+            stats['bytes'] = sum(self._bytes)
+            stats['max_bytes'] = self.max_bytes
+        return stats
+    
+    def memory_usage(self) -> int:
+        """
+        Estima los bytes ocupados por las entradas
+        
+        Returns:
+            Bytes registrados (con presupuesto) o medidos sobre las entradas actuales
+        """
+        if self.max_bytes:
+            return sum(self._bytes)
+        return deep_sizeof(self.items())
+    
+    def __contains__(self, key: Hashable) -> bool:
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            return key in self._segments[stripe]
+    
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments)
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for key, _ in self.items()])
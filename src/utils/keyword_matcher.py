@@ -6,17 +6,48 @@ Módulo responsable de encontrar coincidencias de palabras clave
 por sentimiento en el texto preprocesado.
 """
 
+import copy
 import json
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterable, List, Tuple
+from .vocabulary import Vocabulary, OOV_ID
+from .bloom_filter import BloomFilter
+from ..models.sentiment_vector import SENTIMENTS
 from ..models.exceptions import KeywordMatchError
 
 
 class KeywordMatcher:
     """Coincidencia de palabras clave"""
     
-    def __init__(self, keywords_data: Dict):
+    def __init__(self, keywords_data: Dict, vocabulary: Vocabulary = None,
+                 extra_words: Iterable[str] = (), lexicon_filter: BloomFilter = None):
+        """
+        Args:
+            keywords_data: Datos de palabras clave (dict o ruta de un JSON)
+            vocabulary: Vocabulario compartido de tokens
+            extra_words: Palabras adicionales del filtro de Bloom (modificadores)
+            lexicon_filter: Filtro ya compilado (p. ej. recibido de otro proceso)
+        """
         self.keywords = self._load_keywords(keywords_data)
-        self.sentiments = ['alegria', 'tristeza', 'enojo', 'preocupacion', 'informacion', 'sorpresa']
+        self.sentiments = list(SENTIMENTS)
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self._extra_words = tuple(extra_words)
+        self._hits_by_id = self._build_hit_index()
+        self.lexicon_filter = (lexicon_filter if lexicon_filter is not None
+                               else self._build_lexicon_filter())
+        self._filter_lexicon = copy.deepcopy(self._lexicon_entries())
+    
+    def might_contain(self, word: str) -> bool:
+        """
+        Indica si una palabra puede pertenecer al léxico o a los modificadores
+        
+        Args:
+            word: Palabra a consultar
+            
+        Returns:
+            False si la palabra seguro no pertenece (True puede ser un falso positivo)
+        """
+        return word in self.lexicon_filter
     
     def find_matches(self, words: List[str]) -> Dict[str, List[str]]:
         """
@@ -33,8 +64,12 @@ class KeywordMatcher:
         if not words:
             return matches
         
-        # Normalizar palabras para búsqueda
+        # Normalizar palabras y descartar las que seguro no están en el léxico
+        lexicon_filter = self._current_filter()
         normalized_words = [word.lower().strip() for word in words]
+        normalized_words = [word for word in normalized_words if word in lexicon_filter]
+        if not normalized_words:
+            return matches
         
         # Buscar coincidencias exactas
         for sentiment in self.sentiments:
@@ -59,6 +94,142 @@ class KeywordMatcher:
         
         return matches
     
+    def find_matches_by_ids(self, token_ids: array) -> Dict[str, List[str]]:
+        """
+        Encuentra coincidencias de palabras clave a partir de identificadores
+        
+        Usa el índice compilado en la construcción; si se modifica
+        `keywords` después, debe llamarse a `rebuild_index`.
+        
+        Args:
+            token_ids: Identificadores de tokens según el vocabulario
+            
+        Returns:
+            Dict con sentimientos como claves y listas de palabras encontradas
+        """
+        matches = {sentiment: [] for sentiment in self.sentiments}
+        hits_by_id = self._hits_by_id
+        get_token = self.vocabulary.get_token
+        
+        for token_id in token_ids:
+            if token_id == OOV_ID:
+                continue
+            
+            hits = hits_by_id.get(token_id)
+            if hits:
+                # Las palabras se toman del vocabulario para compartir la instancia
+                word = get_token(token_id)
+                for sentiment, count in hits:
+                    matches[sentiment].extend([word] * count)
+        
+        return matches
+    
+    def count_matches_by_ids(self, token_ids: array) -> int:
+        """
+        Cuenta las coincidencias de palabras clave sin construir las listas
+        
+        Args:
+            token_ids: Identificadores de tokens según el vocabulario
+            
+        Returns:
+            Número total de coincidencias (igual a la suma de las listas de
+            `find_matches_by_ids`)
+        """
+        hits_by_id = self._hits_by_id
+        total = 0
+        for token_id in token_ids:
+            hits = hits_by_id.get(token_id)
+            if hits:
+                for _, count in hits:
+                    total += count
+        return total
+    
+    def get_hit_index(self) -> Dict[int, Tuple[Tuple[str, int], ...]]:
+        """
+        Obtiene el índice compilado de coincidencias
+        
+        Returns:
+            Dict de identificador de token a tuplas (sentimiento, número de coincidencias)
+        """
+        return self._hits_by_id
+    
+    def rebuild_index(self):
+        """Reconstruye el índice de coincidencias y el filtro tras modificar el léxico"""
+        self._hits_by_id = self._build_hit_index()
+        self.lexicon_filter = self._build_lexicon_filter()
+        self._filter_lexicon = copy.deepcopy(self._lexicon_entries())
+    
+    def _build_lexicon_filter(self) -> BloomFilter:
+        """
+        Construye el filtro de Bloom del léxico y las palabras adicionales
+        
+        Returns:
+            Filtro con las palabras y sus formas en minúsculas y sin tildes
+        """
+        words = []
+        for sentiment in self.sentiments:
+            words.extend(self.get_sentiment_keywords(sentiment))
+        words.extend(self._extra_words)
+        return BloomFilter.from_tokens(words)
+    
+    def _lexicon_entries(self) -> List[Dict]:
+        """Entradas del léxico de cada sentimiento (las que usa el filtro)"""
+        return [self.keywords.get(sentiment) for sentiment in self.sentiments]
+    
+    def _current_filter(self) -> BloomFilter:
+        """
+        Obtiene el filtro del léxico, reconstruyéndolo si el léxico cambió
+        después de compilarlo
+        
+        Las entradas se comparan con una copia tomada al compilar el filtro
+        (la copia comparte las cadenas; la comparación recorre las listas en C),
+        por lo que se detecta cualquier modificación, también en el lugar.
+        
+        Returns:
+            Filtro de Bloom vigente
+        """
+        entries = self._lexicon_entries()
+        if entries != self._filter_lexicon:
+            self.lexicon_filter = self._build_lexicon_filter()
+            self._filter_lexicon = copy.deepcopy(entries)
+        return self.lexicon_filter
+    
+    def _build_hit_index(self) -> Dict[int, Tuple[Tuple[str, int], ...]]:
+        """
+        Construye el índice de identificador de token a sentimientos
+        
+        Cada entrada registra cuántas veces aparece la palabra en el léxico
+        del sentimiento (palabra clave, sinónimo y forma verbal), igual que
+        la búsqueda secuencial original.
+        
+        Returns:
+            Dict con tuplas (sentimiento, número de coincidencias) por token
+        """
+        index = {}
+        
+        for sentiment in self.sentiments:
+            if sentiment not in self.keywords:
+                continue
+            
+            sentiment_keywords = self.keywords[sentiment]
+            counts = {}
+            
+            for word in sentiment_keywords.get('keywords', []):
+                counts[word] = 1
+            
+            for group_name in ('synonyms', 'verb_forms'):
+                found = set()
+                for group in sentiment_keywords.get(group_name, []):
+                    found.update(group)
+                for word in found:
+                    counts[word] = counts.get(word, 0) + 1
+            
+            for word, count in counts.items():
+                token_id = self.vocabulary.add_token(word)
+                index.setdefault(token_id, []).append((sentiment, count))
+        
+        return {token_id: tuple(hits) for token_id, hits in index.items()}
+    
     def calculate_word_scores(self, matches: Dict[str, List[str]]) -> Dict[str, float]:
         """
         Calcula puntuaciones basadas en palabras encontradas
@@ -161,8 +332,10 @@ class KeywordMatcher:
             Dict con información de la palabra clave
         """
         word_lower = word.lower()
+        # Las palabras fuera del léxico no recorren las listas
+        sentiments = self.sentiments if word_lower in self._current_filter() else []
         
-        for sentiment in self.sentiments:
+        for sentiment in sentiments:
             if sentiment in self.keywords:
                 sentiment_data = self.keywords[sentiment]
                 
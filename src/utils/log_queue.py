@@ -0,0 +1,155 @@
+"""
+Logging en Segundo Plano
+========================
+
+Módulo que desacopla la escritura de logs del análisis. Los registros se
+encolan con un `QueueHandler` y un único `QueueListener` por proceso los
+escribe en los handlers de destino (archivo, consola) desde un hilo en
+segundo plano. Tras un `fork` el hilo no existe en el proceso hijo, por lo
+que el listener se vuelve a crear allí con una cola nueva; quien crea
+procesos con `fork` detiene antes el hilo con `paused_for_fork`, para que
+ningún lock de los handlers quede tomado en el hijo.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, List
+from .memory import deep_sizeof
+
+
+_lock = threading.Lock()
+
+# Estado del proceso (un listener y un handler de cola compartidos)
+_queue_handler: QueueHandler = None
+_listener: QueueListener = None
+_handlers: List[logging.Handler] = []
+_paused = False   # Listener detenido por paused_for_fork (los hijos inician el suyo)
+
+
+def start_queue_logging(handlers: List[logging.Handler]) -> QueueHandler:
+    """
+    Inicia (o amplía) el listener del proceso con los handlers de destino
+    
+    Args:
+        handlers: Handlers que escriben los registros (con su propio formato)
+    
+    Returns:
+        Handler de cola que se agrega a los loggers
+    """
+    global _queue_handler, _listener
+    with _lock:
+        for handler in handlers:
+            if handler not in _handlers:
+                _handlers.append(handler)
+        
+        if _listener is None:
+            # Tras detenerse, el listener se reanuda sobre la misma cola
+            if _queue_handler is None:
+                _queue_handler = QueueHandler(queue.Queue())
+            _listener = QueueListener(_queue_handler.queue, *_handlers,
+                                      respect_handler_level=True)
+            _listener.start()
+        else:
+            _listener.handlers = tuple(_handlers)
+        
+        return _queue_handler
+
+
+def stop_queue_logging():
+    """
+    Escribe los registros pendientes, detiene el listener y olvida los handlers
+    
+    Un inicio posterior solo usa los handlers que se le indiquen.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in _handlers:
+            # Al salir, el flujo de un handler de consola puede estar ya cerrado
+            stream = getattr(handler, 'stream', None)
+            if stream is not None and getattr(stream, 'closed', False):
+                continue
+            try:
+                handler.flush()
+            except (ValueError, OSError):
+                pass
+        _handlers.clear()
+
+
+@contextmanager
+def paused_for_fork() -> Iterator[None]:
+    """
+    Detiene el listener mientras se crean procesos con `fork`
+    
+    Si el fork ocurre mientras el hilo del listener escribe, el lock del
+    handler o de su flujo queda tomado en el hijo y el listener que se crea
+    allí se bloquea en la primera escritura. Al detenerlo se escriben los
+    registros pendientes; los registros emitidos mientras tanto se encolan y
+    se escriben al reanudarlo.
+    """
+    global _listener, _paused
+    with _lock:
+        paused = _listener is not None
+        if paused:
+            _listener.stop()
+            _listener = None
+            _paused = True
+    try:
+        yield
+    finally:
+        if paused:
+            with _lock:
+                _paused = False
+                if _listener is None and _handlers:
+                    _listener = QueueListener(_queue_handler.queue, *_handlers,
+                                              respect_handler_level=True)
+                    _listener.start()
+
+
+def pending_records() -> int:
+    """Número de registros encolados aún no escritos"""
+    if _queue_handler is None:
+        return 0
+    return _queue_handler.queue.qsize()
+
+
+def pending_bytes() -> int:
+    """Tamaño aproximado en bytes de los registros encolados aún no escritos"""
+    if _queue_handler is None:
+        return 0
+    records = _queue_handler.queue
+    with records.mutex:
+        pending = list(records.queue)
+    return deep_sizeof(pending)
+
+
+def _reinit_after_fork():
+    """Recrea cola y listener en el proceso hijo (el hilo del padre no se hereda)"""
+    global _listener, _lock, _paused
+    _lock = threading.Lock()
+    if _listener is None and not _paused:
+        return
+    _paused = False
+    
+    # Los registros heredados en la cola los escribe el proceso padre
+    records = queue.Queue()
+    _queue_handler.queue = records
+    _listener = QueueListener(records, *_handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Los trabajadores de multiprocessing terminan con os._exit (sin atexit)
+    from multiprocessing import util
+    util.Finalize(None, stop_queue_logging, exitpriority=10)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
+atexit.register(stop_queue_logging)
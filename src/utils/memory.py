@@ -0,0 +1,66 @@
+"""
+Medición de Memoria
+===================
+
+Utilidades para estimar el tamaño en bytes de las estructuras del sistema.
+El tamaño es aproximado: suma `sys.getsizeof` de cada objeto alcanzable
+(contando una sola vez los objetos compartidos) sin seguir clases, módulos
+ni funciones.
+"""
+
+import sys
+import types
+from array import array
+from typing import Any, Set
+
+
+# Objetos sin referencias a otros objetos (su tamaño ya es el total)
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None), array, range)
+
+# Objetos que no pertenecen a los datos medidos
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                  types.MethodType)
+
+
+def deep_sizeof(obj: Any, seen: Set[int] = None) -> int:
+    """
+    Estima el tamaño en bytes de un objeto y todo lo que contiene
+    
+    Args:
+        obj: Objeto a medir
+        seen: Identificadores ya contados (para medir varias estructuras sin
+            contar dos veces lo que comparten)
+    
+    Returns:
+        Tamaño aproximado en bytes
+    """
+    if seen is None:
+        seen = set()
+    
+    total = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        
+        if isinstance(current, _ATOMIC_TYPES):
+            continue
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        else:
+            attributes = getattr(current, '__dict__', None)
+            if attributes is not None:
+                pending.append(attributes)
+            for cls in type(current).__mro__:
+                slots = cls.__dict__.get('__slots__', ())
+                for slot in ((slots,) if isinstance(slots, str) else slots):
+                    if hasattr(current, slot):
+                        pending.append(getattr(current, slot))
+    
+    return total
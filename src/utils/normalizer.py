@@ -7,9 +7,21 @@ de sentimientos al rango [0, 1] y calcular la confianza del análisis.
 """
 
 import math
-from typing import Dict, List
+from array import array
+from typing import Any, Dict, List, Tuple
 from ..models.sentiment_result import SystemConfig
+from ..models.sentiment_vector import SENTIMENTS, SentimentVector
 from ..models.exceptions import NormalizationError
+from .streaming_normalizer import StreamingNormalizer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy solo es necesario para el procesamiento por lotes
+    np = None
+
+
+# Métodos de normalización admitidos
+NORMALIZATION_METHODS = ('min_max', 'z_score', 'softmax', 'streaming')
 
 
 class ScoreNormalizer:
@@ -17,7 +29,49 @@ class ScoreNormalizer:
     
     def __init__(self, config: SystemConfig):
         self.config = config
-        self.sentiments = ['alegria', 'tristeza', 'enojo', 'preocupacion', 'informacion', 'sorpresa']
+        self.sentiments = list(SENTIMENTS)
+        self.method = self._get_method()
+        self.streaming = self._create_streaming_normalizer() if self.method == 'streaming' else None
+    
+    def _get_method(self) -> str:
+        """
+        Obtiene el método de normalización configurado
+        
+        Raises:
+            NormalizationError: Si el método no está soportado
+        """
+        method = (self.config.normalization or {}).get('method', 'min_max')
+        if method not in NORMALIZATION_METHODS:
+            raise NormalizationError(f"Método de normalización no soportado: {method}")
+        return method
+    
+    def _create_streaming_normalizer(self) -> StreamingNormalizer:
+        """Crea el normalizador de corpus y restaura su estado persistido si existe"""
+        settings = self.config.normalization or {}
+        streaming = StreamingNormalizer(SENTIMENTS, int(settings.get('streaming_window') or 0))
+        
+        state_file = settings.get('state_file')
+        if state_file:
+            streaming.load_state(state_file)
+        
+        return streaming
+    
+    def save_state(self, path: str = None) -> bool:
+        """
+        Persiste las estadísticas del normalizador de corpus
+        
+        Args:
+            path: Ruta del archivo (por defecto, `normalization.state_file`)
+            
+        Returns:
+            True si se guardó el estado, False si no hay estado que guardar
+        """
+        path = path or (self.config.normalization or {}).get('state_file')
+        if self.streaming is None or not path:
+            return False
+        
+        self.streaming.save_state(path)
+        return True
     
     def normalize_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -32,15 +86,181 @@ class ScoreNormalizer:
         if not scores:
             return {}
         
+        try:
+            vector = SentimentVector.from_dict(scores)
+        except TypeError:
+            # Reportar el sentimiento con la puntuación inválida
+            self.cap_scores(scores)
+            raise
+        
+        return self.normalize_vector(vector).to_dict()
+    
+    def normalize_vector(self, scores: SentimentVector) -> SentimentVector:
+        """
+        Normaliza un vector de puntuaciones en el lugar
+        
+        Args:
+            scores: Vector de puntuaciones (se modifica)
+            
+        Returns:
+            El mismo vector normalizado
+        """
+        if not len(scores):
+            return scores
+        
         # Primero aplicar capped para limitar valores fuera de rango
-        capped_scores = self.cap_scores(scores)
+        values = scores.clamp(0.0, 1.0).values
+        decimals = self.config.output_format.get('round_decimals', 3)
         
-        # Aplicar normalización Min-Max
-        normalized_scores = self._min_max_normalize(capped_scores)
+        if self.method == 'z_score':
+            normalized = self._z_score_values(values)
+        elif self.method == 'softmax':
+            normalized = self._softmax_values(values)
+        elif self.method == 'streaming':
+            normalized = self._streaming_values(scores)
+        else:
+            normalized = self._min_max_values(values)
         
         # Redondear según configuración
+        for i in range(len(values)):
+            values[i] = round(normalized[i], decimals)
+        
+        return scores
+    
+    @staticmethod
+    def _min_max_values(values: array) -> List[float]:
+        """Min-Max sobre los valores de un vector (0.5 si todos son iguales)"""
+        min_score = min(values)
+        max_score = max(values)
+        
+        # Evitar división por cero
+        if max_score == min_score:
+            return [0.5] * len(values)
+        
+        score_range = max_score - min_score
+        return [(value - min_score) / score_range for value in values]
+    
+    @staticmethod
+    def _z_score_values(values: array) -> List[float]:
+        """Z-Score convertido a [0, 1] con la función sigmoide"""
+        mean = sum(values) / len(values)
+        std = math.sqrt(sum((value - mean) ** 2 for value in values) / len(values))
+        
+        if std == 0:
+            return [0.5] * len(values)
+        
+        return [1 / (1 + math.exp(-(value - mean) / std)) for value in values]
+    
+    @staticmethod
+    def _softmax_values(values: array) -> List[float]:
+        """Softmax estable (se resta el máximo antes de exponenciar)"""
+        max_val = max(values)
+        exp_values = [math.exp(value - max_val) for value in values]
+        sum_exp = sum(exp_values)
+        return [value / sum_exp for value in exp_values]
+    
+    def _streaming_values(self, scores: SentimentVector) -> List[float]:
+        """Incorpora el documento al corpus y lo normaliza con las estadísticas acumuladas"""
+        if scores.names != self.streaming.names:
+            raise NormalizationError("La normalización de corpus requiere el vector completo de sentimientos")
+        return self.streaming.update_and_normalize(scores.values)
+    
+    def normalize_batch(self, scores: Any) -> Any:
+        """
+        Normaliza por filas una matriz de puntuaciones con operaciones de NumPy
+        
+        Equivale a llamar a `normalize_vector` fila por fila con el método
+        configurado. Con la normalización de corpus las filas se incorporan
+        en orden al acumulador, ya que cada una depende de las anteriores.
+        
+        Args:
+            scores: Matriz N×6 de puntuaciones en el orden de SENTIMENTS
+            
+        Returns:
+            Nueva matriz N×6 con las puntuaciones normalizadas y redondeadas
+            
+        Raises:
+            NormalizationError: Si NumPy no está disponible o las dimensiones no coinciden
+        """
+        matrix = self._as_matrix(scores)
         decimals = self.config.output_format.get('round_decimals', 3)
-        return {k: round(v, decimals) for k, v in normalized_scores.items()}
+        
+        # Primero limitar al rango [0, 1]
+        matrix = np.clip(matrix, 0.0, 1.0)
+        
+        if self.method == 'z_score':
+            mean = matrix.mean(axis=1, keepdims=True)
+            std = matrix.std(axis=1, keepdims=True)
+            z_scores = np.divide(matrix - mean, std, out=np.zeros_like(matrix), where=std > 0)
+            normalized = 1.0 / (1.0 + np.exp(-z_scores))  # z = 0 (std nula) da 0.5
+        elif self.method == 'softmax':
+            exp_values = np.exp(matrix - matrix.max(axis=1, keepdims=True))
+            normalized = exp_values / exp_values.sum(axis=1, keepdims=True)
+        elif self.method == 'streaming':
+            normalized = np.array([self.streaming.update_and_normalize(row) for row in matrix.tolist()])
+            normalized = normalized.reshape(matrix.shape)
+        else:
+            min_score = matrix.min(axis=1, keepdims=True)
+            score_range = matrix.max(axis=1, keepdims=True) - min_score
+            normalized = np.divide(matrix - min_score, score_range,
+                                   out=np.full_like(matrix, 0.5), where=score_range > 0)
+        
+        return np.round(normalized, decimals)
+    
+    def rank_batch(self, scores: Any, count: int = 2) -> Tuple[Any, Any]:
+        """
+        Obtiene el sentimiento dominante y los secundarios de cada fila
+        
+        Usa `argpartition` para seleccionar los count + 1 mayores sin ordenar
+        la fila completa. Los empates se resuelven como en
+        `get_dominant_sentiment` y `get_secondary_sentiments` (gana el
+        sentimiento que aparece primero en SENTIMENTS).
+        
+        Args:
+            scores: Matriz N×6 de puntuaciones en el orden de SENTIMENTS
+            count: Número de sentimientos secundarios por fila
+            
+        Returns:
+            Tupla (dominantes, secundarios) con arreglos de índices de forma
+            (N,) y (N, count) sobre SENTIMENTS
+            
+        Raises:
+            NormalizationError: Si NumPy no está disponible o las dimensiones no coinciden
+        """
+        matrix = self._as_matrix(scores)
+        top = min(count + 1, matrix.shape[1])
+        
+        if top >= matrix.shape[1]:
+            ranking = np.argsort(-matrix, axis=1, kind='stable')
+        else:
+            # Selección parcial de los `top` mayores y orden estable por (valor, índice)
+            candidates = np.argpartition(-matrix, top - 1, axis=1)[:, :top]
+            values = np.take_along_axis(matrix, candidates, axis=1)
+            order = np.lexsort((candidates, -values), axis=1)
+            ranking = np.take_along_axis(candidates, order, axis=1)
+            
+            # Empates en el límite de la partición: recurrir al orden estable completo
+            threshold = values.min(axis=1, keepdims=True)
+            ambiguous = (matrix == threshold).sum(axis=1) != (values == threshold).sum(axis=1)
+            if ambiguous.any():
+                ranking[ambiguous] = np.argsort(-matrix[ambiguous], axis=1, kind='stable')[:, :top]
+        
+        return ranking[:, 0], ranking[:, 1:top]
+    
+    def _as_matrix(self, scores: Any) -> Any:
+        """Convierte y valida una matriz N×6 de puntuaciones"""
+        if np is None:
+            raise NormalizationError("El procesamiento por lotes requiere NumPy")
+        
+        try:
+            matrix = np.array(scores, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise NormalizationError(f"Puntuaciones inválidas: {str(e)}")
+        
+        if matrix.ndim != 2 or matrix.shape[1] != len(SENTIMENTS):
+            raise NormalizationError(f"Se esperaba una matriz N×{len(SENTIMENTS)}, se recibió {matrix.shape}")
+        
+        return matrix
     
     def cap_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -90,7 +310,123 @@ class ScoreNormalizer:
         # Factor 4: Confianza basada en umbrales
         threshold_confidence = self._calculate_threshold_confidence(scores)
         
-        # Promedio ponderado de todos los factores
+        return self._combine_confidence(keyword_confidence, distribution_confidence,
+                                        consistency_confidence, threshold_confidence)
+    
+    def summarize(self, scores: SentimentVector, matched_keywords: Dict[str, List[str]],
+                  count: int = 2, keyword_total: int = None,
+                  as_vector: bool = False) -> Dict[str, Any]:
+        """
+        Normaliza un vector y calcula confianza, dominante y secundarios en una pasada
+        
+        Equivale a `normalize_vector` seguido de `calculate_confidence`,
+        `get_dominant_sentiment` y `get_secondary_sentiments`, pero el
+        recorrido de normalización acumula a la vez el rango, los
+        sentimientos altos, los umbrales superados y los count + 1 mayores
+        (sin ordenar el vector).
+        
+        Args:
+            scores: Vector de puntuaciones (se normaliza en el lugar)
+            matched_keywords: Palabras clave encontradas por sentimiento
+            count: Número de sentimientos secundarios a obtener
+            keyword_total: Número de coincidencias ya contado (si se indica, no
+                se recorren las palabras de `matched_keywords`)
+            as_vector: Si 'sentiments' es el propio vector normalizado en lugar
+                de un diccionario nuevo
+            
+        Returns:
+            Dict con 'sentiments', 'confidence', 'dominant_sentiment' y
+            'secondary_sentiments'
+        """
+        if not len(scores):
+            return {'sentiments': {}, 'confidence': 0.0,
+                    'dominant_sentiment': None, 'secondary_sentiments': []}
+        
+        values = scores.values
+        names = scores.names
+        decimals = self.config.output_format.get('round_decimals', 3)
+        thresholds = self.config.sentiment_thresholds
+        
+        # Limitar al rango [0, 1]; el mínimo y el máximo se obtienen en el mismo recorrido
+        min_score = max_score = None
+        for i in range(len(values)):
+            value = max(0.0, min(1.0, values[i]))
+            values[i] = value
+            if min_score is None or value < min_score:
+                min_score = value
+            if max_score is None or value > max_score:
+                max_score = value
+        
+        normalized = None
+        if self.method == 'z_score':
+            normalized = self._z_score_values(values)
+        elif self.method == 'softmax':
+            normalized = self._softmax_values(values)
+        elif self.method == 'streaming':
+            normalized = self._streaming_values(scores)
+        score_range = max_score - min_score
+        
+        # Recorrido fusionado: normalizar, redondear y acumular estadísticas
+        keep = count + 1
+        top = []  # (puntuación, posición) en orden descendente estable
+        low = high = None
+        high_scores = threshold_matches = threshold_total = 0
+        
+        for i in range(len(values)):
+            if normalized is not None:
+                value = round(normalized[i], decimals)
+            elif score_range == 0:
+                value = round(0.5, decimals)
+            else:
+                value = round((values[i] - min_score) / score_range, decimals)
+            values[i] = value
+            
+            if low is None or value < low:
+                low = value
+            if high is None or value > high:
+                high = value
+            if value > 0.6:
+                high_scores += 1
+            
+            threshold = thresholds.get(names[i]) if thresholds else None
+            if threshold is not None:
+                threshold_total += 1
+                if value >= threshold:
+                    threshold_matches += 1
+            
+            # Inserción estable: un empate queda detrás del sentimiento anterior
+            if len(top) < keep or value > top[-1][0]:
+                position = len(top)
+                while position and value > top[position - 1][0]:
+                    position -= 1
+                top.insert(position, (value, i))
+                del top[keep:]
+        
+        if not thresholds or threshold_total == 0:
+            threshold_confidence = 0.5
+        else:
+            threshold_confidence = threshold_matches / threshold_total
+        
+        if keyword_total is None:
+            keyword_total = sum(len(words) for words in matched_keywords.values())
+        confidence = self._combine_confidence(
+            self._keyword_confidence_for_total(keyword_total),
+            min(1.0, (high - low) * 2),
+            self._consistency_for_count(high_scores),
+            threshold_confidence
+        )
+        
+        return {
+            'sentiments': scores if as_vector else scores.to_dict(),
+            'confidence': confidence,
+            'dominant_sentiment': names[top[0][1]],
+            'secondary_sentiments': [names[i] for _, i in top[1:]]
+        }
+    
+    @staticmethod
+    def _combine_confidence(keyword_confidence: float, distribution_confidence: float,
+                            consistency_confidence: float, threshold_confidence: float) -> float:
+        """Promedio ponderado de los factores de confianza limitado a [0, 1]"""
         confidence = (
             keyword_confidence * 0.4 +
             distribution_confidence * 0.3 +
@@ -114,18 +450,7 @@ class ScoreNormalizer:
         if not scores:
             return {}
         
-        min_score = min(scores.values())
-        max_score = max(scores.values())
-        
-        # Evitar división por cero
-        if max_score == min_score:
-            return {k: 0.5 for k in scores.keys()}
-        
-        normalized = {}
-        for sentiment, score in scores.items():
-            normalized[sentiment] = (score - min_score) / (max_score - min_score)
-        
-        return normalized
+        return dict(zip(scores.keys(), self._min_max_values(list(scores.values()))))
     
     def _z_score_normalize(self, scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -140,21 +465,7 @@ class ScoreNormalizer:
         if not scores:
             return {}
         
-        values = list(scores.values())
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        std = math.sqrt(variance)
-        
-        if std == 0:
-            return {k: 0.5 for k in scores.keys()}
-        
-        normalized = {}
-        for sentiment, score in scores.items():
-            z_score = (score - mean) / std
-            # Convertir Z-score a probabilidad usando función sigmoide
-            normalized[sentiment] = 1 / (1 + math.exp(-z_score))
-        
-        return normalized
+        return dict(zip(scores.keys(), self._z_score_values(list(scores.values()))))
     
     def _softmax_normalize(self, scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -169,18 +480,7 @@ class ScoreNormalizer:
         if not scores:
             return {}
         
-        values = list(scores.values())
-        max_val = max(values)
-        
-        # Aplicar softmax para evitar overflow
-        exp_values = [math.exp(v - max_val) for v in values]
-        sum_exp = sum(exp_values)
-        
-        normalized = {}
-        for i, sentiment in enumerate(scores.keys()):
-            normalized[sentiment] = exp_values[i] / sum_exp
-        
-        return normalized
+        return dict(zip(scores.keys(), self._softmax_values(list(scores.values()))))
     
     def _calculate_keyword_confidence(self, matched_keywords: Dict[str, List[str]]) -> float:
         """
@@ -193,7 +493,11 @@ class ScoreNormalizer:
             Confianza basada en palabras clave
         """
         total_keywords = sum(len(words) for words in matched_keywords.values())
-        
+        return self._keyword_confidence_for_total(total_keywords)
+    
+    @staticmethod
+    def _keyword_confidence_for_total(total_keywords: int) -> float:
+        """Confianza por palabras clave según el número de coincidencias"""
         if total_keywords == 0:
             return 0.1  # Confianza mínima
         
@@ -240,8 +544,12 @@ class ScoreNormalizer:
         
         # Contar sentimientos con puntuación alta
         high_scores = sum(1 for score in scores.values() if score > 0.6)
-        total_sentiments = len(scores)
         
+        return self._consistency_for_count(high_scores)
+    
+    @staticmethod
+    def _consistency_for_count(high_scores: int) -> float:
+        """Confianza de consistencia según el número de sentimientos altos"""
         # Confianza alta si hay pocos sentimientos dominantes
         if high_scores == 0:
             return 0.3  # Confianza baja si no hay sentimientos claros
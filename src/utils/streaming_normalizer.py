@@ -0,0 +1,206 @@
+"""
+Normalizador Incremental de Corpus
+==================================
+
+Módulo responsable de mantener la media y la varianza de cada sentimiento
+a lo largo de un flujo de documentos (algoritmo de Welford), de modo que
+cada documento se normalice en O(1) contra las estadísticas del corpus y
+las puntuaciones sean comparables entre documentos.
+"""
+
+import json
+import math
+import os
+import threading
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+from ..models.sentiment_vector import SENTIMENTS
+from ..models.exceptions import NormalizationError
+
+
+# Versión del formato del estado persistido
+STATE_VERSION = 1
+
+
+class StreamingNormalizer:
+    """Normalizador con estadísticas acumuladas por sentimiento"""
+    
+    def __init__(self, names: Tuple[str, ...] = SENTIMENTS, window: int = 0):
+        """
+        Args:
+            names: Sentimientos (orden de los vectores a normalizar)
+            window: Número efectivo máximo de documentos; al alcanzarlo las
+                estadísticas pasan a ser una media móvil exponencial con ese
+                tamaño de ventana (0 = todo el corpus)
+        """
+        if window < 0:
+            raise NormalizationError(f"Ventana inválida: {window}")
+        
+        self.names = tuple(names)
+        self.window = window
+        self.count = 0
+        self.mean = array('d', bytes(8 * len(self.names)))
+        self.m2 = array('d', bytes(8 * len(self.names)))  # Suma de cuadrados de las desviaciones
+        # Serializa las actualizaciones cuando varios hilos comparten el normalizador
+        self._lock = threading.Lock()
+    
+    def update(self, values: Sequence[float]):
+        """
+        Incorpora un documento a las estadísticas acumuladas
+        
+        Args:
+            values: Puntuaciones del documento en el orden de `names`
+        """
+        if len(values) != len(self.names):
+            raise NormalizationError(f"Se esperaban {len(self.names)} puntuaciones, se recibieron {len(values)}")
+        
+        mean = self.mean
+        m2 = self.m2
+        
+        if self.window and self.count >= self.window:
+            # Ventana llena: media y varianza móviles exponenciales con peso 1/window
+            alpha = 1.0 / self.window
+            for i, value in enumerate(values):
+                delta = value - mean[i]
+                mean[i] += alpha * delta
+                variance = m2[i] / self.count
+                m2[i] = (1 - alpha) * (variance + alpha * delta * delta) * self.count
+            return
+        
+        # Algoritmo de Welford
+        self.count += 1
+        count = self.count
+        for i, value in enumerate(values):
+            delta = value - mean[i]
+            mean[i] += delta / count
+            m2[i] += delta * (value - mean[i])
+    
+    def normalize(self, values: Sequence[float]) -> List[float]:
+        """
+        Normaliza un documento contra las estadísticas del corpus
+        
+        El z-score de cada sentimiento se convierte a [0, 1] con la función
+        sigmoide; sin dispersión acumulada el resultado es 0.5.
+        
+        Args:
+            values: Puntuaciones del documento en el orden de `names`
+        
+        Returns:
+            Puntuaciones normalizadas
+        """
+        normalized = []
+        for i, value in enumerate(values):
+            std = self.std(i)
+            if std == 0:
+                normalized.append(0.5)
+            else:
+                normalized.append(1 / (1 + math.exp(-(value - self.mean[i]) / std)))
+        return normalized
+    
+    def update_and_normalize(self, values: Sequence[float]) -> List[float]:
+        """
+        Incorpora un documento y lo normaliza con las estadísticas resultantes
+        
+        La actualización y la normalización se hacen de forma atómica, por lo
+        que es seguro llamarlo desde varios hilos.
+        
+        Args:
+            values: Puntuaciones del documento en el orden de `names`
+        
+        Returns:
+            Puntuaciones normalizadas
+        """
+        with self._lock:
+            self.update(values)
+            return self.normalize(values)
+    
+    def std(self, position: int) -> float:
+        """Desviación estándar poblacional acumulada de un sentimiento"""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(0.0, self.m2[position]) / self.count)
+    
+    def reset(self):
+        """Descarta las estadísticas acumuladas"""
+        self.count = 0
+        for i in range(len(self.names)):
+            self.mean[i] = 0.0
+            self.m2[i] = 0.0
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Obtiene el estado del acumulador (serializable a JSON)"""
+        with self._lock:
+            return {
+                'version': STATE_VERSION,
+                'sentiments': list(self.names),
+                'window': self.window,
+                'count': self.count,
+                'mean': list(self.mean),
+                'm2': list(self.m2)
+            }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restaura el estado del acumulador
+        
+        Args:
+            state: Estado obtenido con `get_state`
+        
+        Raises:
+            NormalizationError: Si el estado no corresponde a este normalizador
+        """
+        if state.get('version') != STATE_VERSION:
+            raise NormalizationError(f"Versión de estado no soportada: {state.get('version')}")
+        if tuple(state.get('sentiments', ())) != self.names:
+            raise NormalizationError("El estado guardado corresponde a otros sentimientos")
+        
+        count = int(state['count'])
+        mean = array('d', state['mean'])
+        m2 = array('d', state['m2'])
+        if len(mean) != len(self.names) or len(m2) != len(self.names):
+            raise NormalizationError("El estado guardado no tiene una entrada por sentimiento")
+        
+        with self._lock:
+            self.count, self.mean, self.m2 = count, mean, m2
+    
+    def save_state(self, path: str):
+        """
+        Guarda el estado del acumulador en un archivo JSON
+        
+        El archivo se escribe primero en una ruta temporal y luego se
+        reemplaza, para no dejar un estado truncado si el proceso termina.
+        
+        Args:
+            path: Ruta del archivo
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_state(), f)
+        os.replace(temp_path, path)
+    
+    def load_state(self, path: str) -> bool:
+        """
+        Carga el estado del acumulador desde un archivo JSON
+        
+        Args:
+            path: Ruta del archivo
+        
+        Returns:
+            True si se cargó el estado, False si el archivo no existe
+        
+        Raises:
+            NormalizationError: Si el archivo es inválido
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except json.JSONDecodeError as e:
+            raise NormalizationError(f"Error al cargar estado de normalización: {str(e)}")
+        
+        try:
+            self.set_state(state)
+        except (KeyError, TypeError, ValueError) as e:
+            raise NormalizationError(f"Estado de normalización inválido: {str(e)}")
+        return True
@@ -0,0 +1,152 @@
+"""
+Vocabulario de Tokens
+=====================
+
+Módulo responsable de asignar identificadores enteros a los tokens del
+léxico, modificadores y tokens frecuentes, de modo que el pipeline
+comparta una única instancia de cada cadena conocida.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+# Identificador reservado para tokens fuera de vocabulario
+OOV_ID = 0
+
+
+class Vocabulary:
+    """Vocabulario de tokens con identificadores enteros"""
+    
+    def __init__(self, tokens: Iterable[str] = ()):
+        self._token_to_id: Dict[str, int] = {}
+        self._id_to_token: List[Optional[str]] = [None]  # Posición 0 reservada para OOV
+        self.add_tokens(tokens)
+    
+    def add_token(self, token: str) -> int:
+        """
+        Agrega un token al vocabulario
+        
+        Args:
+            token: Token a agregar
+        
+        Returns:
+            Identificador del token (existente o nuevo)
+        """
+        token_id = self._token_to_id.get(token)
+        if token_id is None:
+            token_id = len(self._id_to_token)
+            self._token_to_id[token] = token_id
+            self._id_to_token.append(token)
+        return token_id
+    
+    def add_tokens(self, tokens: Iterable[str]):
+        """
+        Agrega varios tokens al vocabulario
+        
+        Args:
+            tokens: Tokens a agregar
+        """
+        for token in tokens:
+            self.add_token(token)
+    
+    def add_frequent_tokens(self, token_lists: Iterable[Iterable[str]],
+                            min_count: int = 2, max_tokens: int = None) -> int:
+        """
+        Agrega al vocabulario los tokens frecuentes de un corpus
+        
+        Args:
+            token_lists: Listas de tokens (una por documento)
+            min_count: Frecuencia mínima para incluir un token
+            max_tokens: Número máximo de tokens nuevos a agregar
+        
+        Returns:
+            Número de tokens agregados
+        """
+        counts = Counter()
+        for tokens in token_lists:
+            counts.update(tokens)
+        
+        added = 0
+        for token, count in counts.most_common():
+            if count < min_count or (max_tokens is not None and added >= max_tokens):
+                break
+            if token not in self._token_to_id:
+                self.add_token(token)
+                added += 1
+        
+        return added
+    
+    def get_id(self, token: str) -> int:
+        """
+        Obtiene el identificador de un token
+        
+        Args:
+            token: Token a buscar
+        
+        Returns:
+            Identificador del token u OOV_ID si no está en el vocabulario
+        """
+        return self._token_to_id.get(token, OOV_ID)
+    
+    def get_token(self, token_id: int) -> Optional[str]:
+        """
+        Obtiene el token asociado a un identificador
+        
+        Args:
+            token_id: Identificador a buscar
+        
+        Returns:
+            Token o None si el identificador es OOV_ID
+        """
+        return self._id_to_token[token_id]
+    
+    def encode(self, tokens: Iterable[str]) -> array:
+        """
+        Convierte una secuencia de tokens a identificadores
+        
+        Args:
+            tokens: Tokens a convertir
+        
+        Returns:
+            Arreglo compacto array('I') con los identificadores
+        """
+        lookup = self._token_to_id.get
+        return array('I', [lookup(token, OOV_ID) for token in tokens])
+    
+    def decode(self, token_ids: Iterable[int]) -> List[Optional[str]]:
+        """
+        Convierte identificadores a tokens
+        
+        Args:
+            token_ids: Identificadores a convertir
+        
+        Returns:
+            Lista de tokens (None para identificadores OOV)
+        """
+        return [self._id_to_token[token_id] for token_id in token_ids]
+    
+    def intern(self, tokens: List[str], token_ids: array) -> List[str]:
+        """
+        Reemplaza los tokens conocidos por la instancia compartida del vocabulario
+        
+        Args:
+            tokens: Tokens originales
+            token_ids: Identificadores ya calculados (posiblemente de la forma normalizada)
+        
+        Returns:
+            Lista de tokens con las cadenas conocidas compartidas
+        """
+        interned = []
+        for token, token_id in zip(tokens, token_ids):
+            canonical = self._id_to_token[token_id]
+            # Solo se comparte la instancia si el texto es idéntico
+            interned.append(canonical if canonical == token else token)
+        return interned
+    
+    def __contains__(self, token: str) -> bool:
+        return token in self._token_to_id
+    
+    def __len__(self) -> int:
+        return len(self._token_to_id)
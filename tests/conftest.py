@@ -6,6 +6,7 @@ Configuración y fixtures comunes para todas las pruebas del sistema.
 """
 
 import pytest
+import copy
 import json
 import tempfile
 import os
@@ -193,6 +194,42 @@ def sample_tree_data():
     }
 
 
+@pytest.fixture
+def make_analyzer(monkeypatch, sample_config, sample_keywords_data, sample_tree_data):
+    """
+    Fábrica de analizadores con los recursos de ejemplo y sin logging a archivo ni consola
+    
+    Cada analizador usa una copia de la configuración tomada al crearlo (por
+    defecto `sample_config`, con los cambios que la prueba ya le hizo) y las
+    secciones indicadas como argumentos con nombre; los diccionarios se
+    combinan con los de la configuración. Los caches compartidos se cierran
+    al terminar la prueba.
+    """
+    from src.models.sentiment_analyzer import SentimentAnalyzer
+    monkeypatch.setattr(SentimentAnalyzer, '_load_keywords_data', lambda self: sample_keywords_data)
+    monkeypatch.setattr(SentimentAnalyzer, '_load_tree_data', lambda self: sample_tree_data)
+    analyzers = []
+    
+    def make(config: SystemConfig = None, **config_overrides) -> SentimentAnalyzer:
+        config = copy.deepcopy(config if config is not None else sample_config)
+        config.logging['enable_file_logging'] = False
+        config.logging['enable_console_logging'] = False
+        for name, value in config_overrides.items():
+            section = getattr(config, name)
+            if isinstance(section, dict) and isinstance(value, dict):
+                section.update(value)
+            else:
+                setattr(config, name, value)
+        analyzer = SentimentAnalyzer(config)
+        analyzers.append(analyzer)
+        return analyzer
+    
+    yield make
+    for analyzer in analyzers:
+        if analyzer.shared_cache is not None:
+            analyzer.shared_cache.close()
+
+
 @pytest.fixture
 def sample_preprocessed_data():
     """Datos preprocesados de ejemplo"""
@@ -0,0 +1,142 @@
+"""
+Pruebas Unitarias para la API Asíncrona
+=======================================
+
+Pruebas para analyze_async, analyze_many_async y MicroBatcher.
+"""
+
+import asyncio
+import threading
+import pytest
+from src.models.async_batching import MicroBatcher
+from src.models.exceptions import SentimentAnalysisError
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo"""
+    return make_analyzer()
+
+
+class TestAsyncAnalysis:
+    """Pruebas para la API asíncrona del analizador"""
+    
+    def test_analyze_async_matches_sync(self, analyzer):
+        """Prueba que el análisis asíncrono coincida con el síncrono"""
+        async def run():
+            result = await analyzer.analyze_async("Estoy muy feliz")
+            await analyzer.aclose()
+            return result
+        
+        result = asyncio.run(run())
+        expected = analyzer.analyze("Estoy muy feliz")
+        
+        assert result.sentiments == expected.sentiments
+        assert result.dominant_sentiment == expected.dominant_sentiment
+    
+    def test_analyze_async_raises(self, analyzer):
+        """Prueba que los errores del análisis se propaguen al solicitante"""
+        async def run():
+            try:
+                await analyzer.analyze_async("")
+            finally:
+                await analyzer.aclose()
+        
+        with pytest.raises(SentimentAnalysisError):
+            asyncio.run(run())
+    
+    def test_analyze_many_async_order_and_errors(self, analyzer):
+        """Prueba el orden de los resultados y los resultados de error"""
+        texts = ["Estoy feliz", "", "Estoy triste", "Estoy enojado"] * 10
+        analyzer.config.batch_processing.update({'max_batch_size': 4, 'flush_interval_ms': 1})
+        
+        async def run():
+            results = await analyzer.analyze_many_async(texts)
+            await analyzer.aclose()
+            return results
+        
+        results = asyncio.run(run())
+        
+        assert [r.text for r in results] == texts
+        for text, result in zip(texts, results):
+            if not text:
+                assert result.sentiments == {}
+                assert result.analysis_quality == 'low'
+            else:
+                assert result.dominant_sentiment == analyzer.analyze(text).dominant_sentiment
+
+
+class TestMicroBatcher:
+    """Pruebas para MicroBatcher"""
+    
+    def test_batches_up_to_max_size(self):
+        """Prueba que las solicitudes concurrentes se agrupen en lotes de hasta N textos"""
+        sizes = []
+        
+        def analyze_batch(texts):
+            sizes.append(len(texts))
+            return [(True, text.upper()) for text in texts]
+        
+        async def run():
+            batcher = MicroBatcher(analyze_batch, max_batch_size=4, flush_interval_ms=50)
+            results = await asyncio.gather(*(batcher.submit(f"t{i}") for i in range(10)))
+            await batcher.close()
+            return results, batcher.stats
+        
+        results, stats = asyncio.run(run())
+        
+        assert results == [f"T{i}" for i in range(10)]
+        assert sizes == [4, 4, 2]
+        assert stats == {'batches': 3, 'items': 10}
+    
+    def test_flush_interval_dispatches_partial_batch(self):
+        """Prueba que un lote incompleto se despache al vencer el intervalo"""
+        async def run():
+            batcher = MicroBatcher(lambda texts: [(True, len(texts))] * len(texts),
+                                   max_batch_size=100, flush_interval_ms=5)
+            result = await asyncio.wait_for(batcher.submit("solo"), timeout=1.0)
+            await batcher.close()
+            return result
+        
+        assert asyncio.run(run()) == 1
+    
+    def test_max_in_flight_bounds_concurrency(self):
+        """Prueba que el semáforo limite las solicitudes en curso"""
+        in_flight = []
+        lock = threading.Lock()
+        active = [0]
+        
+        def analyze_batch(texts):
+            with lock:
+                active[0] += len(texts)
+                in_flight.append(active[0])
+            outcomes = [(True, text) for text in texts]
+            with lock:
+                active[0] -= len(texts)
+            return outcomes
+        
+        async def run():
+            batcher = MicroBatcher(analyze_batch, max_batch_size=2, flush_interval_ms=0,
+                                   max_in_flight=3)
+            await asyncio.gather(*(batcher.submit(str(i)) for i in range(20)))
+            await batcher.close()
+        
+        asyncio.run(run())
+        
+        assert max(in_flight) <= 3
+    
+    def test_executor_failure_propagates(self):
+        """Prueba que un fallo del lote completo llegue a todas sus solicitudes"""
+        def analyze_batch(texts):
+            raise RuntimeError("fallo del lote")
+        
+        async def run():
+            batcher = MicroBatcher(analyze_batch, max_batch_size=8, flush_interval_ms=1)
+            outcomes = await asyncio.gather(batcher.submit("a"), batcher.submit("b"),
+                                            return_exceptions=True)
+            await batcher.close()
+            return outcomes
+        
+        outcomes = asyncio.run(run())
+        
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
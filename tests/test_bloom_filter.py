@@ -0,0 +1,119 @@
+"""
+Pruebas Unitarias para BloomFilter
+==================================
+
+Pruebas para el filtro de Bloom del léxico y su uso en KeywordMatcher.
+"""
+
+import pickle
+import pytest
+from src.utils.bloom_filter import BloomFilter, fold_token
+from src.utils.keyword_matcher import KeywordMatcher
+from src.models.sentiment_analyzer import SentimentAnalyzer
+from src.models.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo"""
+    return make_analyzer()
+
+
+class TestBloomFilter:
+    """Pruebas para BloomFilter"""
+    
+    def test_no_false_negatives(self):
+        """Prueba que todos los tokens agregados se reconozcan"""
+        tokens = [f"palabra{i}" for i in range(1000)]
+        bloom = BloomFilter.from_tokens(tokens)
+        
+        assert all(token in bloom for token in tokens)
+    
+    def test_false_positive_rate(self):
+        """Prueba que la tasa de falsos positivos sea cercana a la configurada"""
+        bloom = BloomFilter.from_tokens([f"palabra{i}" for i in range(1000)], 0.01)
+        false_positives = sum(1 for i in range(10000) if f"ausente{i}" in bloom)
+        
+        assert false_positives < 300
+    
+    def test_folded_forms(self):
+        """Prueba que se agreguen las formas en minúsculas y sin tildes"""
+        bloom = BloomFilter.from_tokens(['Melancólico'])
+        
+        assert fold_token('Melancólico') == 'melancolico'
+        assert 'melancólico' in bloom
+        assert 'melancolico' in bloom
+    
+    def test_serialization_round_trip(self):
+        """Prueba que el filtro serializado responda igual"""
+        bloom = BloomFilter.from_tokens(['feliz', 'triste'])
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        
+        assert restored.to_bytes() == bloom.to_bytes()
+        assert 'feliz' in restored
+        assert len(restored) == len(bloom)
+    
+    def test_invalid_serialization(self):
+        """Prueba que los datos inválidos se rechacen"""
+        data = BloomFilter.from_tokens(['feliz']).to_bytes()
+        
+        with pytest.raises(ConfigurationError):
+            BloomFilter.from_bytes(data[:-1])
+        with pytest.raises(ConfigurationError):
+            BloomFilter.from_bytes(b'')
+
+
+class TestLexiconFilter:
+    """Pruebas para el filtro del léxico en KeywordMatcher y SentimentAnalyzer"""
+    
+    def test_matcher_filter_contains_lexicon_and_extra_words(self, sample_keywords_data):
+        """Prueba que el filtro incluya el léxico y las palabras adicionales"""
+        matcher = KeywordMatcher(sample_keywords_data, extra_words=['muy'])
+        
+        for sentiment in matcher.sentiments:
+            for word in matcher.get_sentiment_keywords(sentiment):
+                assert matcher.might_contain(word)
+        assert matcher.might_contain('muy')
+    
+    def test_filtered_matches_are_equivalent(self, keyword_matcher):
+        """Prueba que el filtro no cambie las coincidencias"""
+        words = ['estoy', 'muy', 'FELIZ', 'y', 'triste', 'xyz', 'enojado']
+        expected = {sentiment: [] for sentiment in keyword_matcher.sentiments}
+        for word in words:
+            info = keyword_matcher.get_keyword_info(word)
+            if info['sentiment'] is not None:
+                expected[info['sentiment']].append(word.lower())
+        
+        assert keyword_matcher.find_matches(words) == expected
+        assert keyword_matcher.get_keyword_info('xyz')['type'] == 'unknown'
+    
+    def test_rebuild_index_updates_filter(self, keyword_matcher):
+        """Prueba que el filtro se reconstruya tras modificar el léxico"""
+        keyword_matcher.keywords['alegria']['keywords'].append('jubiloso')
+        keyword_matcher.rebuild_index()
+        
+        assert keyword_matcher.might_contain('jubiloso')
+        assert 'jubiloso' in keyword_matcher.find_matches(['jubiloso'])['alegria']
+    
+    def test_in_place_replacement_updates_filter(self, keyword_matcher):
+        """Prueba que reemplazar una palabra en el lugar actualice el filtro"""
+        keyword_matcher.keywords['alegria']['keywords'][0] = 'zapatófilo'
+        
+        assert 'zapatófilo' in keyword_matcher.find_matches(['zapatófilo'])['alegria']
+        assert keyword_matcher.get_keyword_info('zapatófilo')['sentiment'] == 'alegria'
+    
+    def test_analyzer_filter_includes_modifiers(self, analyzer):
+        """Prueba que el filtro del analizador incluya los modificadores"""
+        matcher = analyzer.keyword_matcher
+        
+        assert matcher.might_contain('muy')
+        assert matcher.might_contain('jamás')
+        assert matcher.might_contain('jamas')
+    
+    def test_filter_shared_through_resources(self, analyzer):
+        """Prueba que otro analizador reutilice el filtro serializado"""
+        resources = pickle.loads(pickle.dumps(analyzer.get_resources()))
+        worker = SentimentAnalyzer(analyzer.config, resources=resources)
+        
+        assert worker.keyword_matcher.lexicon_filter.to_bytes() == resources['lexicon_filter']
+        assert worker.analyze("Estoy muy feliz").sentiments == analyzer.analyze("Estoy muy feliz").sentiments
@@ -0,0 +1,125 @@
+"""
+Pruebas Unitarias para StripedLRUCache
+======================================
+
+Pruebas para el cache LRU segmentado seguro entre hilos.
+"""
+
+import threading
+import pytest
+from src.utils.cache import StripedLRUCache
+
+
+class TestStripedLRUCache:
+    """Pruebas para StripedLRUCache"""
+    
+    def test_get_and_put(self):
+        """Prueba operaciones básicas y estadísticas"""
+        cache = StripedLRUCache(10, stripes=4)
+        cache.put('a', 1)
+        
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert 'a' in cache
+        assert len(cache) == 1
+        assert cache.stats() == {'size': 1, 'capacity': 10, 'hits': 1, 'misses': 1}
+    
+    def test_lru_eviction(self):
+        """Prueba que se expulse el elemento menos usado"""
+        cache = StripedLRUCache(2, stripes=1)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert len(cache) == 2
+    
+    def test_stripes_limited_by_capacity(self):
+        """Prueba que la capacidad total se respete con varios segmentos"""
+        cache = StripedLRUCache(5, stripes=16)
+        for i in range(100):
+            cache.put(i, i)
+        
+        assert len(cache) <= 5
+    
+    def test_clear(self):
+        """Prueba la limpieza del cache"""
+        cache = StripedLRUCache(10)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        
+        assert len(cache) == 0
+        assert cache.stats()['hits'] == 0
+    
+    def test_concurrent_access(self):
+        """Prueba accesos concurrentes desde varios hilos"""
+        cache = StripedLRUCache(64, stripes=8)
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = (offset + i) % 128
+                    cache.put(key, key)
+                    value = cache.get(key)
+                    assert value is None or value == key
+            except Exception as e:  # Propagar fallos al hilo principal
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not errors
+        assert len(cache) <= 64
+    
+    def test_byte_budget_eviction(self):
+        """Prueba que el presupuesto en bytes expulse los elementos menos usados"""
+        cache = StripedLRUCache(0, stripes=1, max_bytes=300, sizeof=lambda entry: 100)
+        for key in 'abcd':
+            cache.put(key, key)
+        
+        assert len(cache) == 3
+        assert 'a' not in cache
+        assert cache.stats()['bytes'] == 300
+        assert cache.stats()['max_bytes'] == 300
+        assert cache.memory_usage() == 300
+    
+    def test_byte_budget_tracks_updates_and_pops(self):
+        """Prueba que los reemplazos y eliminaciones actualicen los bytes"""
+        sizes = {'corto': 10, 'largo': 50}
+        cache = StripedLRUCache(0, stripes=1, max_bytes=100, sizeof=lambda entry: sizes[entry[1]])
+        cache.put('a', 'corto')
+        cache.put('a', 'largo')
+        assert cache.stats()['bytes'] == 50
+        
+        cache.pop('a')
+        assert cache.stats()['bytes'] == 0
+        
+        cache.put('b', 'corto')
+        cache.clear()
+        assert cache.stats()['bytes'] == 0
+    
+    def test_oversized_entry_not_stored(self):
+        """Prueba que una entrada mayor que el presupuesto no se almacene"""
+        cache = StripedLRUCache(10, stripes=1, max_bytes=50, sizeof=lambda entry: len(entry[1]))
+        cache.put('a', 'x' * 10)
+        cache.put('a', 'x' * 100)
+        
+        assert 'a' not in cache
+        assert cache.stats()['bytes'] == 0
+    
+    def test_default_sizeof_measures_entries(self):
+        """Prueba que el tamaño por defecto crezca con el contenido"""
+        cache = StripedLRUCache(10, stripes=2, max_bytes=10 ** 6)
+        cache.put('a', 'x')
+        small = cache.memory_usage()
+        cache.put('b', 'x' * 1000)
+        
+        assert small > 0
+        assert cache.memory_usage() > small + 1000
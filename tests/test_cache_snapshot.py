@@ -0,0 +1,128 @@
+"""
+Pruebas Unitarias para las Instantáneas de Cache
+================================================
+
+Pruebas para la exportación, importación y precarga de caches.
+"""
+
+import gzip
+import json
+import pytest
+from src.models.cache_snapshot import read_snapshot, read_top_texts, write_snapshot
+from src.models.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def cached_analyzer(make_analyzer):
+    """Fábrica de analizadores con recursos de ejemplo y cache de resultados"""
+    return lambda: make_analyzer(result_cache={'enabled': True, 'max_entries': 100})
+
+
+@pytest.fixture
+def texts():
+    """Textos de prueba"""
+    return ["Estoy muy feliz", "Me siento triste", "No estoy triste", "Estoy enojado"]
+
+
+class TestCacheSnapshot:
+    """Pruebas para las instantáneas de cache"""
+    
+    def test_export_and_import(self, cached_analyzer, texts, tmp_path):
+        """Prueba que un analizador nuevo recupere los caches exportados"""
+        path = str(tmp_path / 'cache.json.gz')
+        source = cached_analyzer()
+        expected = [source.analyze(text) for text in texts]
+        
+        exported = source.export_cache_snapshot(path)
+        target = cached_analyzer()
+        imported = target.import_cache_snapshot(path)
+        
+        assert imported == exported
+        assert imported['result_cache'] == len(texts)
+        results = [target.analyze(text) for text in texts]
+        assert target.result_cache.stats()['hits'] == len(texts)
+        for result, reference in zip(results, expected):
+            assert result.text == reference.text
+            assert result.sentiments == reference.sentiments
+            assert result.tree_path == reference.tree_path
+    
+    def test_imported_tree_cache_matches_search(self, cached_analyzer, texts, tmp_path):
+        """Prueba que las entradas importadas del árbol equivalgan a una búsqueda nueva"""
+        path = str(tmp_path / 'cache.json.gz')
+        source = cached_analyzer()
+        for text in texts:
+            source.analyze(text)
+        source.export_cache_snapshot(path)
+        
+        target = cached_analyzer()
+        target.result_cache = None
+        target.import_cache_snapshot(path)
+        fresh = cached_analyzer()
+        fresh.result_cache = None
+        fresh.tree_searcher.memoization_cache = None
+        
+        for text in texts:
+            assert target.analyze(text).sentiments == fresh.analyze(text).sentiments
+        assert target.tree_searcher.search_stats['cache_hits'] == 1
+    
+    def test_stale_snapshot_rejected(self, cached_analyzer, texts, tmp_path, sample_config):
+        """Prueba que una instantánea de otros recursos no se importe"""
+        path = str(tmp_path / 'cache.json.gz')
+        source = cached_analyzer()
+        source.analyze(texts[0])
+        source.export_cache_snapshot(path)
+        
+        sample_config.fuzzy_parameters['negation_factor'] = 0.9
+        target = cached_analyzer()
+        
+        assert target.import_cache_snapshot(path) == {'tree_cache': 0, 'result_cache': 0}
+        with pytest.raises(ConfigurationError):
+            read_snapshot(path, target.get_fingerprint())
+    
+    def test_invalid_snapshot(self, tmp_path):
+        """Prueba el rechazo de archivos dañados o de otra versión"""
+        broken = tmp_path / 'broken.json.gz'
+        broken.write_bytes(b'no es gzip')
+        with pytest.raises(ConfigurationError):
+            read_snapshot(str(broken), 'huella')
+        
+        old = tmp_path / 'old.json.gz'
+        with gzip.open(old, 'wt', encoding='utf-8') as f:
+            json.dump({'version': 0, 'fingerprint': 'huella'}, f)
+        with pytest.raises(ConfigurationError):
+            read_snapshot(str(old), 'huella')
+    
+    def test_snapshot_imported_at_startup(self, cached_analyzer, texts, tmp_path, sample_config):
+        """Prueba la importación de `result_cache.snapshot_file` al construir el analizador"""
+        path = str(tmp_path / 'cache.json.gz')
+        source = cached_analyzer()
+        source.analyze(texts[0])
+        source.export_cache_snapshot(path)
+        
+        sample_config.result_cache['snapshot_file'] = path
+        
+        assert len(cached_analyzer().result_cache) == 1
+    
+    def test_warmup_top_texts(self, cached_analyzer, tmp_path):
+        """Prueba la precarga con los textos más frecuentes"""
+        corpus = tmp_path / 'textos.txt'
+        corpus.write_text("Estoy feliz\nEstoy triste\nEstoy feliz\n\nEstoy enojado\nEstoy feliz\nEstoy triste\n",
+                          encoding='utf-8')
+        assert read_top_texts(str(corpus), 2) == ["Estoy feliz", "Estoy triste"]
+        
+        analyzer = cached_analyzer()
+        assert analyzer.warmup(str(corpus), top_n=2) == 2
+        assert len(analyzer.result_cache) == 2
+        
+        analyzer.analyze("estoy FELIZ")
+        assert analyzer.result_cache.stats()['hits'] == 1
+    
+    def test_write_snapshot_is_gzip_json(self, tmp_path):
+        """Prueba el formato del archivo de instantánea"""
+        path = str(tmp_path / 'sub' / 'cache.json.gz')
+        write_snapshot(path, 'huella', [], [["hola", {}]])
+        
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['fingerprint'] == 'huella'
+        assert data['result_cache'] == [["hola", {}]]
@@ -0,0 +1,120 @@
+"""
+Pruebas Unitarias para FuzzyRuleBase
+====================================
+
+Pruebas para el motor de inferencia Mamdani compilado.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.fuzzy_inference import FuzzyRuleBase
+from src.core.fuzzy_logic import FuzzyLogicProcessor
+from src.models.sentiment_vector import SENTIMENTS, SentimentVector
+from src.models.exceptions import FuzzyLogicError
+
+
+@pytest.fixture
+def rule_base():
+    """Base de reglas del sistema"""
+    return FuzzyRuleBase.from_file('resources/fuzzy_rules.json')
+
+
+@pytest.fixture
+def minimal_rules():
+    """Base de reglas mínima para pruebas"""
+    return {
+        "resolution": 101,
+        "variables": {
+            "base_score": {"range": [0, 1], "terms": {
+                "bajo": {"type": "trapezoid", "points": [0, 0, 0.4, 0.6]},
+                "alto": {"type": "trapezoid", "points": [0.4, 0.6, 1, 1]}
+            }},
+            "modifier_intensity": {"range": [-3, 3], "terms": {
+                "neutro": {"type": "triangle", "points": [-1, 0, 1]}
+            }},
+            "punctuation_emphasis": {"range": [0, 5], "terms": {
+                "ninguno": {"type": "trapezoid", "points": [0, 0, 0, 1]}
+            }}
+        },
+        "output": {"range": [0, 1], "terms": {
+            "bajo": {"type": "triangle", "points": [0, 0.25, 0.5]},
+            "alto": {"type": "triangle", "points": [0.5, 0.75, 1]}
+        }},
+        "rules": [
+            {"if": {"base_score": "bajo", "modifier_intensity": "neutro"}, "then": "bajo"},
+            {"if": {"base_score": "alto", "modifier_intensity": "neutro"}, "then": "alto"}
+        ]
+    }
+
+
+class TestFuzzyRuleBase:
+    """Pruebas para FuzzyRuleBase"""
+    
+    def test_compiled_tables_match_membership(self, minimal_rules):
+        """Prueba que las tablas discretizadas coincidan con la función de pertenencia"""
+        rule_base = FuzzyRuleBase(minimal_rules)
+        processor_membership = FuzzyLogicProcessor.calculate_membership
+        variable = rule_base.inputs['base_score']
+        
+        alto = variable.table[variable.term_index['alto']]
+        
+        for x, degree in zip(variable.grid, alto):
+            assert degree == pytest.approx(processor_membership(None, x, 0.4, 0.6))
+    
+    def test_centroid_of_single_rule(self, minimal_rules):
+        """Prueba el centroide cuando se activa una sola regla"""
+        rule_base = FuzzyRuleBase(minimal_rules)
+        
+        result = rule_base.infer([0.1, 0.9], 0, 0)
+        
+        assert result == pytest.approx([0.25, 0.75], abs=1e-9)
+    
+    def test_no_rule_keeps_base_score(self, minimal_rules):
+        """Prueba que sin reglas activas se conserve la puntuación base"""
+        rule_base = FuzzyRuleBase(minimal_rules)
+        
+        result = rule_base.infer([0.3], 3, 0)  # 'neutro' no se activa con intensidad 3
+        
+        assert result[0] == 0.3
+    
+    def test_modifiers_shift_scores(self, rule_base):
+        """Prueba que intensificadores y atenuadores desplacen las puntuaciones"""
+        base = np.array([0.25, 0.5, 0.75])
+        
+        neutral = rule_base.infer(base, 0, 0)
+        intensified = rule_base.infer(base, 1, 0)
+        attenuated = rule_base.infer(base, -1, 0)
+        
+        assert neutral == pytest.approx(base, abs=1e-3)  # Error de discretización
+        assert np.all(intensified > neutral)
+        assert np.all(attenuated < neutral)
+        assert rule_base.infer([0.0], 2, 0)[0] == pytest.approx(0.0, abs=1e-3)
+    
+    def test_invalid_rule_term(self, minimal_rules):
+        """Prueba que un término inexistente se rechace al compilar"""
+        minimal_rules['rules'].append({"if": {"base_score": "medio"}, "then": "alto"})
+        
+        with pytest.raises(FuzzyLogicError):
+            FuzzyRuleBase(minimal_rules)
+    
+    def test_processor_vector_matches_batch(self, sample_config, rule_base):
+        """Prueba que el procesador con base de reglas sea consistente entre vector y lote"""
+        processor = FuzzyLogicProcessor(sample_config, rule_base)
+        rng = np.random.default_rng(7)
+        scores = rng.random((50, len(SENTIMENTS)))
+        modifiers_list = [{
+            'intensifiers': ['muy'] * int(rng.integers(0, 3)),
+            'attenuators': ['poco'] * int(rng.integers(0, 2)),
+            'negations': ['no'] * int(rng.integers(0, 2)),
+            'emoticons': ['😊'] * int(rng.integers(0, 2)),
+            'exclamation_count': int(rng.integers(0, 3)),
+            'question_count': int(rng.integers(0, 2))
+        } for _ in range(len(scores))]
+        
+        batch = processor.apply_fuzzy_rules_batch(scores, processor.count_modifiers(modifiers_list))
+        
+        for row, modifiers in enumerate(modifiers_list):
+            vector = processor.apply_fuzzy_rules_vector(SentimentVector(scores[row]), modifiers)
+            assert np.allclose(batch[row], list(vector.values), atol=1e-12)
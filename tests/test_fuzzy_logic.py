@@ -377,6 +377,7 @@ class TestFuzzyLogicProcessor:
         # Cambiar parámetros de configuración
         fuzzy_logic_processor.config.fuzzy_parameters['intensification_factor'] = 2.0
         fuzzy_logic_processor.config.fuzzy_parameters['attenuation_factor'] = 0.5
+        fuzzy_logic_processor.refresh_parameters()  # Los parámetros se congelan en tablas
         
         score = 0.5
         intensifiers = ['muy']
@@ -387,4 +388,61 @@ class TestFuzzyLogicProcessor:
         
         # Debería usar los nuevos parámetros
         assert intensified > 0.5
-        assert attenuated < 0.5 
\ No newline at end of file
+        assert attenuated < 0.5
+    
+    def test_lookup_tables_match_formulas(self, fuzzy_logic_processor):
+        """Prueba que las tablas precalculadas reproduzcan las fórmulas originales"""
+        params = fuzzy_logic_processor.config.fuzzy_parameters
+        
+        for n in range(0, 60):
+            assert fuzzy_logic_processor._intensify_factor(n) == 1.0 + n * params['intensification_factor']
+            assert fuzzy_logic_processor._attenuate_factor(n) == params['attenuation_factor'] ** n
+            assert fuzzy_logic_processor._lookup(fuzzy_logic_processor.emoticon_boost_table, n) == min(0.2, n * 0.1)
+            assert fuzzy_logic_processor._lookup(fuzzy_logic_processor.exclamation_boost_table, n) == min(0.15, n * 0.05)
+            assert fuzzy_logic_processor._lookup(fuzzy_logic_processor.question_boost_table, n) == min(0.1, n * 0.05)
+    
+    def test_parameters_frozen_until_refresh(self, fuzzy_logic_processor):
+        """Prueba que los parámetros se congelen en la construcción"""
+        fuzzy_logic_processor.config.fuzzy_parameters['attenuation_factor'] = 0.5
+        
+        assert fuzzy_logic_processor.attenuate_sentiment(0.8, ['poco']) == pytest.approx(0.8 * 0.7)
+        
+        fuzzy_logic_processor.refresh_parameters()
+        
+        assert fuzzy_logic_processor.attenuate_sentiment(0.8, ['poco']) == pytest.approx(0.4)
+    
+    def test_batch_matches_scalar_path(self, fuzzy_logic_processor):
+        """Prueba que el lote vectorizado coincida con el camino escalar"""
+        np = pytest.importorskip("numpy")
+        from src.models.sentiment_vector import SENTIMENTS, SentimentVector
+        
+        rng = np.random.default_rng(42)
+        scores = rng.random((200, len(SENTIMENTS)))
+        scores[::7] = 0.0
+        modifiers_list = []
+        for i in range(len(scores)):
+            modifiers_list.append({
+                'intensifiers': ['muy'] * int(rng.integers(0, 3)),
+                'attenuators': ['poco'] * int(rng.integers(0, 3)),
+                'negations': ['no'] * int(rng.integers(0, 3)),
+                'emoticons': ['😊'] * int(rng.integers(0, 3)),
+                'exclamation_count': int(rng.integers(0, 4)),
+                'question_count': int(rng.integers(0, 3))
+            })
+        
+        batch = fuzzy_logic_processor.apply_fuzzy_rules_batch(
+            scores, fuzzy_logic_processor.count_modifiers(modifiers_list)
+        )
+        
+        for row, modifiers in zip(range(len(scores)), modifiers_list):
+            vector = SentimentVector(scores[row])
+            expected = fuzzy_logic_processor.apply_fuzzy_rules_vector(vector, modifiers)
+            assert np.allclose(batch[row], list(expected.values), atol=1e-12)
+    
+    def test_batch_rejects_wrong_shape(self, fuzzy_logic_processor):
+        """Prueba que el lote valide las dimensiones de la matriz"""
+        pytest.importorskip("numpy")
+        from src.models.exceptions import FuzzyLogicError
+        
+        with pytest.raises(FuzzyLogicError):
+            fuzzy_logic_processor.apply_fuzzy_rules_batch([[0.1, 0.2]], {})
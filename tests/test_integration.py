@@ -411,4 +411,19 @@ class TestIntegration:
             
         finally:
             SentimentAnalyzer._load_keywords_data = original_load_keywords
-            SentimentAnalyzer._load_tree_data = original_load_tree 
\ No newline at end of file
+            SentimentAnalyzer._load_tree_data = original_load_tree 
+    
+    def test_concurrent_analysis_shared_instance(self, make_analyzer):
+        """TC-INT-011: Un único analizador atendiendo varios hilos"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        analyzer = make_analyzer()
+        texts = ["Estoy muy feliz", "Me siento triste", "Estoy enojado", "Estoy preocupado"] * 50
+        expected = [analyzer.analyze(text) for text in texts[:4]]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(analyzer.analyze, texts))
+        
+        for i, result in enumerate(results):
+            assert result.sentiments == expected[i % 4].sentiments
+            assert result.tree_path == expected[i % 4].tree_path
@@ -0,0 +1,181 @@
+"""
+Pruebas Unitarias para el Logging en Segundo Plano
+==================================================
+
+Pruebas para log_queue y el logging del analizador.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import pytest
+from src.models.parallel_batch import worker_pool
+from src.utils import log_queue
+
+
+class RecordingHandler(logging.Handler):
+    """Handler que conserva los registros y el hilo que los escribió"""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append((self.format(record), threading.current_thread().name))
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo"""
+    return make_analyzer()
+
+
+class TestLogQueue:
+    """Pruebas para el listener de logs en segundo plano"""
+    
+    def test_records_written_by_listener_thread(self):
+        """Prueba que los registros se escriban fuera del hilo que los emite"""
+        handler = RecordingHandler()
+        was_running = log_queue._listener is not None
+        previous = list(log_queue._handlers)
+        logger = logging.getLogger('test_log_queue')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        queue_handler = log_queue.start_queue_logging([handler])
+        logger.addHandler(queue_handler)
+        
+        try:
+            logger.info("mensaje %d", 7)
+        finally:
+            log_queue.stop_queue_logging()
+            logger.removeHandler(queue_handler)
+            stopped = list(log_queue._handlers)
+            if was_running:
+                log_queue.start_queue_logging(previous)
+        
+        assert stopped == []
+        assert [message for message, _ in handler.records] == ["mensaje 7"]
+        assert handler.records[0][1] != threading.current_thread().name
+        assert log_queue.pending_records() == 0
+    
+    def test_stop_skips_closed_streams(self):
+        """Prueba que detener el listener tolere handlers con el flujo ya cerrado"""
+        import io
+        was_running = log_queue._listener is not None
+        previous = list(log_queue._handlers)
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        log_queue.start_queue_logging([handler])
+        stream.close()
+        
+        try:
+            log_queue.stop_queue_logging()
+        finally:
+            if was_running:
+                log_queue.start_queue_logging(previous)
+        
+        assert handler not in log_queue._handlers
+
+
+def _log_in_worker(message: str) -> int:
+    """Registra un mensaje desde un proceso trabajador"""
+    logging.getLogger('test_log_queue.worker').warning(message)
+    return os.getpid()
+
+    
+    def test_paused_for_fork_resumes_listener(self):
+        """Prueba que el listener se detenga durante el fork y escriba lo encolado al reanudarse"""
+        handler = RecordingHandler()
+        was_running = log_queue._listener is not None
+        previous = list(log_queue._handlers)
+        logger = logging.getLogger('test_log_queue.pause')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        queue_handler = log_queue.start_queue_logging([handler])
+        logger.addHandler(queue_handler)
+        
+        try:
+            with log_queue.paused_for_fork():
+                paused_listener = log_queue._listener
+                logger.info("durante la pausa")
+                written_during_pause = list(handler.records)
+            resumed_listener = log_queue._listener
+        finally:
+            log_queue.stop_queue_logging()
+            logger.removeHandler(queue_handler)
+            if was_running:
+                log_queue.start_queue_logging(previous)
+        
+        assert paused_listener is None
+        assert written_during_pause == []
+        assert resumed_listener is not None
+        assert [message for message, _ in handler.records] == ["durante la pausa"]
+    
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                        reason="requiere fork")
+    def test_forked_workers_write_logs(self, analyzer, tmp_path):
+        """Prueba que los trabajadores creados con fork escriban sus registros"""
+        log_file = tmp_path / 'trabajadores.log'
+        handler = logging.FileHandler(log_file, encoding='utf-8')
+        was_running = log_queue._listener is not None
+        previous = list(log_queue._handlers)
+        logger = logging.getLogger('test_log_queue.worker')
+        logger.propagate = False
+        queue_handler = log_queue.start_queue_logging([handler])
+        logger.addHandler(queue_handler)
+        analyzer.config.batch_processing['start_method'] = 'fork'
+        
+        try:
+            with worker_pool(analyzer, 2) as executor:
+                pid = executor.submit(_log_in_worker, "desde el trabajador").result(timeout=30)
+            assert log_queue._listener is not None
+        finally:
+            log_queue.stop_queue_logging()
+            logger.removeHandler(queue_handler)
+            handler.close()
+            if was_running:
+                log_queue.start_queue_logging(previous)
+        
+        assert pid != os.getpid()
+        assert "desde el trabajador" in log_file.read_text(encoding='utf-8')
+
+
+class TestAnalyzerLogging:
+    """Pruebas para el logging del analizador"""
+    
+    def test_no_per_request_info_by_default(self, analyzer, caplog):
+        """Prueba que por defecto no se registre cada análisis"""
+        with caplog.at_level(logging.INFO, logger='SentimentAnalyzer'):
+            analyzer.analyze("Estoy feliz")
+        
+        assert not [r for r in caplog.records if 'análisis' in r.getMessage().lower()]
+    
+    def test_log_requests_enabled(self, analyzer, caplog):
+        """Prueba el registro por análisis cuando se habilita"""
+        analyzer._log_requests = True
+        
+        with caplog.at_level(logging.INFO, logger='SentimentAnalyzer'):
+            analyzer.analyze("Estoy feliz")
+        
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(m.startswith("Iniciando análisis de texto: 'Estoy feliz") for m in messages)
+        assert any(m.startswith("Análisis completado") for m in messages)
+    
+    def test_debug_arguments_not_formatted_when_disabled(self, analyzer, monkeypatch):
+        """Prueba que los datos de depuración no se formateen con el nivel INFO"""
+        formatted = []
+        original = analyzer.preprocessor.preprocess
+        
+        class TrackedDict(dict):
+            def __repr__(self):
+                formatted.append(True)
+                return dict.__repr__(self)
+        
+        monkeypatch.setattr(analyzer.preprocessor, 'preprocess',
+                            lambda text: TrackedDict(original(text)))
+        analyzer.logger.setLevel(logging.INFO)
+        
+        analyzer.analyze("Estoy feliz")
+        
+        assert formatted == []
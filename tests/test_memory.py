@@ -0,0 +1,89 @@
+"""
+Pruebas Unitarias para la Medición de Memoria
+=============================================
+
+Pruebas para deep_sizeof y el informe de memoria de SentimentAnalyzer.
+"""
+
+import sys
+import pytest
+from src.utils.memory import deep_sizeof
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo y cache de resultados habilitado"""
+    return make_analyzer(result_cache={'enabled': True, 'max_entries': 100, 'max_bytes': 10 ** 6})
+
+
+class _Slotted:
+    """Objeto con __slots__ para las pruebas"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+
+
+class TestDeepSizeof:
+    """Pruebas para deep_sizeof"""
+    
+    def test_includes_contents(self):
+        """Prueba que el tamaño incluya los elementos contenidos"""
+        text = 'x' * 1000
+        
+        assert deep_sizeof([text]) == sys.getsizeof([text]) + sys.getsizeof(text)
+        assert deep_sizeof({'clave': [text]}) > sys.getsizeof(text)
+    
+    def test_shared_objects_counted_once(self):
+        """Prueba que un objeto referenciado varias veces se cuente una vez"""
+        text = 'x' * 1000
+        
+        assert deep_sizeof([text, text]) == sys.getsizeof([text, text]) + sys.getsizeof(text)
+    
+    def test_objects_and_slots(self):
+        """Prueba que se midan los atributos de instancias con y sin __slots__"""
+        text = 'x' * 1000
+        
+        assert deep_sizeof(_Slotted(text)) >= sys.getsizeof(text)
+        assert deep_sizeof(_Slotted(_Slotted(text))) > deep_sizeof(_Slotted(None))
+    
+    def test_cycles(self):
+        """Prueba que las referencias circulares no se recorran indefinidamente"""
+        data = []
+        data.append(data)
+        
+        assert deep_sizeof(data) == sys.getsizeof(data)
+
+
+class TestMemoryFootprint:
+    """Pruebas para SentimentAnalyzer.get_memory_footprint"""
+    
+    def test_reports_components(self, analyzer):
+        """Prueba que el informe incluya cada componente y el total"""
+        footprint = analyzer.get_memory_footprint()
+        components = ['lexicon', 'lexicon_filter', 'vocabulary', 'fuzzy_rules', 'tree',
+                      'tree_cache', 'result_cache', 'shared_cache', 'fast_path', 'logger_buffers']
+        
+        assert set(footprint) == set(components) | {'total', 'persistent_cache_disk'}
+        assert footprint['lexicon'] > 0
+        assert footprint['lexicon_filter'] >= len(analyzer.keyword_matcher.lexicon_filter.to_bytes())
+        assert footprint['tree'] > 0
+        assert footprint['total'] == sum(footprint[name] for name in components)
+    
+    def test_caches_grow_with_results(self, analyzer):
+        """Prueba que los caches informen más bytes tras analizar textos"""
+        before = analyzer.get_memory_footprint()
+        analyzer.analyze("Estoy muy feliz")
+        analyzer.analyze("Estoy triste hoy")
+        after = analyzer.get_memory_footprint()
+        
+        assert after['result_cache'] > before['result_cache']
+        assert after['tree_cache'] > before['tree_cache']
+    
+    def test_result_cache_byte_budget(self, analyzer):
+        """Prueba que el cache de resultados respete el presupuesto en bytes"""
+        analyzer.analyze("Estoy muy feliz")
+        stats = analyzer.get_system_info()['cache_info']['result_cache']
+        
+        assert 0 < stats['bytes'] <= stats['max_bytes']
@@ -0,0 +1,119 @@
+"""
+Pruebas Unitarias para ModifierScopeEngine
+==========================================
+
+Pruebas para el alcance posicional de modificadores.
+"""
+
+import pytest
+from src.core.modifier_scope import ModifierScopeEngine
+from src.core.text_preprocessor import TextPreprocessor
+from src.models.exceptions import ConfigurationError
+from src.models.sentiment_vector import SENTIMENTS, SENTIMENT_INDEX, SentimentVector
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.vocabulary import Vocabulary
+
+
+@pytest.fixture
+def shared_components(sample_config, sample_keywords_data):
+    """Preprocesador y coincidencia de palabras con vocabulario compartido"""
+    vocabulary = Vocabulary()
+    preprocessor = TextPreprocessor(sample_config, vocabulary)
+    matcher = KeywordMatcher(sample_keywords_data, vocabulary)
+    return preprocessor, matcher
+
+
+def scope_text(engine, preprocessor, text):
+    """Calcula el alcance de modificadores para un texto"""
+    return engine.scope(preprocessor.preprocess(text)['token_ids'])
+
+
+class TestModifierScopeEngine:
+    """Pruebas para ModifierScopeEngine"""
+    
+    def test_negation_only_affects_next_hit(self, shared_components):
+        """Prueba que la negación solo alcance la siguiente coincidencia"""
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=1)
+        
+        scoped = scope_text(engine, preprocessor, "no estoy triste, estoy feliz")
+        
+        assert scoped.negated[SENTIMENT_INDEX['tristeza']] == 1
+        assert scoped.negated[SENTIMENT_INDEX['alegria']] == 0
+        assert scoped.has_effect
+    
+    def test_window_size(self, shared_components):
+        """Prueba que el modificador alcance K coincidencias"""
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=2)
+        
+        scoped = scope_text(engine, preprocessor, "muy feliz y triste pero enojado")
+        
+        assert scoped.intensifiers[SENTIMENT_INDEX['alegria']] == 1
+        assert scoped.intensifiers[SENTIMENT_INDEX['tristeza']] == 1
+        assert scoped.intensifiers[SENTIMENT_INDEX['enojo']] == 0
+    
+    def test_stacked_modifiers(self, shared_components):
+        """Prueba la acumulación de modificadores consecutivos y la doble negación"""
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=1)
+        
+        scoped = scope_text(engine, preprocessor, "un poco molesto, no nunca triste")
+        
+        assert scoped.attenuators[SENTIMENT_INDEX['enojo']] == 2
+        assert scoped.negated[SENTIMENT_INDEX['tristeza']] == 0
+        assert scoped.to_dict() == {'enojo': {'intensifiers': 0, 'attenuators': 2, 'negated': False}}
+    
+    def test_no_modifiers(self, shared_components):
+        """Prueba un texto sin modificadores"""
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=3)
+        
+        scoped = scope_text(engine, preprocessor, "estoy feliz y sorprendido")
+        
+        assert not scoped.has_effect
+        assert scoped.to_dict() == {}
+    
+    def test_requires_shared_vocabulary(self, sample_config, sample_keywords_data):
+        """Prueba que se exija un vocabulario compartido"""
+        preprocessor = TextPreprocessor(sample_config, Vocabulary())
+        matcher = KeywordMatcher(sample_keywords_data, Vocabulary())
+        
+        with pytest.raises(ConfigurationError):
+            ModifierScopeEngine(preprocessor, matcher, window=1)
+    
+    def test_scoped_rules_only_touch_reached_sentiments(self, shared_components, fuzzy_logic_processor):
+        """Prueba que la lógica difusa aplique los modificadores por sentimiento"""
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=1)
+        scoped = scope_text(engine, preprocessor, "no estoy triste, estoy muy feliz")
+        
+        scores = SentimentVector([0.2, 0.3, 0.0, 0.0, 0.0, 0.0])
+        fuzzy_logic_processor.apply_fuzzy_rules_vector(scores, {}, scoped)
+        
+        assert scores['tristeza'] == pytest.approx(0.7)
+        assert scores['alegria'] == pytest.approx(min(1.0, 0.2 * fuzzy_logic_processor._intensify_factor(1)))
+    
+    def test_scoped_batch_matches_vector(self, shared_components, fuzzy_logic_processor):
+        """Prueba que el lote con conteos por sentimiento coincida con el vector"""
+        np = pytest.importorskip("numpy")
+        preprocessor, matcher = shared_components
+        engine = ModifierScopeEngine(preprocessor, matcher, window=2)
+        texts = [
+            "no estoy triste, estoy muy feliz",
+            "un poco molesto y bastante nervioso",
+            "muy muy sorprendido pero no enojado ni triste",
+            "estoy feliz!!"
+        ]
+        preprocessed = [preprocessor.preprocess(text) for text in texts]
+        scoped_list = [engine.scope(data['token_ids']) for data in preprocessed]
+        rng = np.random.default_rng(3)
+        scores = rng.random((len(texts), len(SENTIMENTS)))
+        
+        batch = fuzzy_logic_processor.apply_fuzzy_rules_batch(
+            scores, fuzzy_logic_processor.count_modifiers(preprocessed, scoped_list)
+        )
+        
+        for row, (data, scoped) in enumerate(zip(preprocessed, scoped_list)):
+            vector = fuzzy_logic_processor.apply_fuzzy_rules_vector(SentimentVector(scores[row]), data, scoped)
+            assert np.allclose(batch[row], list(vector.values), atol=1e-12)
@@ -0,0 +1,121 @@
+"""
+Pruebas Unitarias para NeutralFastPath
+======================================
+
+Pruebas para la ruta rápida de textos sin coincidencias ni modificadores y
+su equivalencia con el pipeline completo.
+"""
+
+import pytest
+from src.core.neutral_fast_path import NeutralFastPath
+
+
+NEUTRAL_TEXTS = [
+    "el informe llega mañana",
+    "el informe llega mañana!",
+    "el informe llega mañana?",
+    "¿llega el informe mañana? ¿seguro?",
+    "reunión a las diez!!",
+    "texto",
+    "uno dos tres cuatro cinco seis siete",
+    "EL SERVIDOR REINICIÓ A LAS 3",
+]
+
+
+def comparable(result):
+    """Campos del resultado que no dependen del tiempo de procesamiento"""
+    data = result.to_dict()
+    del data['processing_time']
+    return data
+
+
+@pytest.fixture
+def analyzers(make_analyzer):
+    """Analizadores con y sin ruta rápida"""
+    return make_analyzer(enable_fast_path=True), make_analyzer(enable_fast_path=False)
+
+
+class TestNeutralFastPath:
+    """Pruebas para NeutralFastPath"""
+    
+    def test_eligibility(self, analyzers):
+        """Prueba que solo los textos sin léxico, modificadores ni emoticones sean elegibles"""
+        analyzer, _ = analyzers
+        fast_path = analyzer.fast_path
+        
+        def eligible(text):
+            return fast_path.is_eligible(analyzer.preprocessor.preprocess(text))
+        
+        assert eligible("el informe llega mañana")
+        assert not eligible("estoy feliz")
+        assert not eligible("el informe llega muy tarde")
+        assert not eligible("no llega el informe")
+        assert not eligible("el informe llega 😊")
+    
+    def test_tree_condition_words_are_triggers(self, make_analyzer, sample_tree_data):
+        """Prueba que las palabras de has_keyword fuera del léxico excluyan el texto"""
+        sample_tree_data['root']['condition'] = "has_keyword('informacion', 'servidor')"
+        analyzer = make_analyzer(enable_fast_path=True)
+        
+        preprocessed = analyzer.preprocessor.preprocess("el servidor reinició")
+        assert not analyzer.fast_path.is_eligible(preprocessed)
+    
+    def test_unsupported_conditions_disable_fast_path(self, make_analyzer, sample_tree_data):
+        """Prueba que una condición con nombres desconocidos deshabilite la ruta rápida"""
+        sample_tree_data['root']['condition'] = "has_emotion_words"
+        analyzer = make_analyzer(enable_fast_path=True)
+        
+        assert analyzer.fast_path.enabled is False
+        assert not analyzer.fast_path.is_eligible(analyzer.preprocessor.preprocess("texto"))
+    
+    def test_word_count_in_template_key(self):
+        """Prueba que el número de palabras forme parte de la clave solo si el árbol lo usa"""
+        assert NeutralFastPath._is_supported("word_count > 3 and not is_question()")
+        assert not NeutralFastPath._is_supported("len(words) > 3")
+    
+    def test_templates_reused(self, analyzers):
+        """Prueba que los textos con los mismos rasgos reutilicen la plantilla"""
+        analyzer, _ = analyzers
+        analyzer.analyze("el informe llega mañana")
+        analyzer.analyze("la reunión empieza tarde")
+        analyzer.analyze("la reunión empieza tarde?")
+        
+        stats = analyzer.get_system_info()['cache_info']['fast_path']
+        assert stats == {'enabled': True, 'templates': 2, 'hits': 1}
+        
+        analyzer.clear_cache()
+        assert analyzer.fast_path.stats()['templates'] == 0
+    
+    def test_templates_not_shared_between_results(self, analyzers):
+        """Prueba que modificar un resultado no altere la plantilla"""
+        analyzer, _ = analyzers
+        first = analyzer.analyze("el informe llega mañana")
+        first.sentiments['alegria'] = 99.0
+        first.tree_path.append('modificado')
+        second = analyzer.analyze("el informe llega hoy")
+        
+        assert second.sentiments['alegria'] != 99.0
+        assert 'modificado' not in second.tree_path
+    
+    @pytest.mark.parametrize('enable_fuzzy_logic', [True, False])
+    def test_equivalent_to_full_pipeline(self, make_analyzer, enable_fuzzy_logic):
+        """Prueba que la plantilla produzca el mismo resultado que el pipeline completo"""
+        fast = make_analyzer(enable_fuzzy_logic=enable_fuzzy_logic, enable_fast_path=True)
+        full = make_analyzer(enable_fuzzy_logic=enable_fuzzy_logic, enable_fast_path=False)
+        
+        # Dos pasadas: la primera calcula las plantillas y la segunda las usa
+        for _ in range(2):
+            for text in NEUTRAL_TEXTS + ["estoy muy feliz", "no estoy triste"]:
+                assert comparable(fast.analyze(text)) == comparable(full.analyze(text))
+        assert fast.fast_path.stats()['hits'] > 0
+    
+    def test_equivalent_with_word_count_conditions(self, make_analyzer, sample_tree_data):
+        """Prueba la equivalencia cuando el árbol consulta el número de palabras"""
+        sample_tree_data['node_2']['condition'] = "word_count > 3"
+        fast = make_analyzer(enable_fast_path=True)
+        full = make_analyzer(enable_fast_path=False)
+        
+        assert fast.fast_path.uses_word_count
+        for _ in range(2):
+            for text in NEUTRAL_TEXTS:
+                assert comparable(fast.analyze(text)) == comparable(full.analyze(text))
@@ -0,0 +1,227 @@
+"""
+Pruebas Unitarias para el Procesamiento Paralelo en Lote
+========================================================
+
+Pruebas para batch_analyze con un grupo de procesos.
+"""
+
+import gc
+import json
+import multiprocessing
+import pytest
+import main
+from src.models import parallel_batch
+from src.models.parallel_batch import resolve_start_method, resolve_workers, tune_chunk_size
+from src.models.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo"""
+    return make_analyzer()
+
+
+@pytest.fixture
+def texts():
+    """Textos de prueba, incluido uno inválido"""
+    return [
+        "Estoy muy feliz",
+        "Me siento triste",
+        "",
+        "Estoy enojado",
+        "Estoy preocupado",
+        "Estoy sorprendido",
+        "No estoy triste"
+    ] * 3
+
+
+class TestParallelBatch:
+    """Pruebas para el procesamiento paralelo en lote"""
+    
+    def test_parallel_matches_serial_order(self, analyzer, texts):
+        """Prueba que los resultados paralelos conserven el orden de entrada"""
+        analyzer.config.batch_processing.update({'chunk_size': 2, 'sample_size': 1})
+        
+        serial = analyzer.batch_analyze(texts, workers=1)
+        parallel = analyzer.batch_analyze(texts, workers=2)
+        
+        assert [r.text for r in parallel] == texts
+        assert [r.sentiments for r in parallel] == [r.sentiments for r in serial]
+        assert [r.dominant_sentiment for r in parallel] == [r.dominant_sentiment for r in serial]
+    
+    def test_error_results_in_parallel(self, analyzer, texts):
+        """Prueba que los textos inválidos produzcan resultados de error en su posición"""
+        analyzer.config.batch_processing.update({'chunk_size': 3, 'sample_size': 1})
+        
+        results = analyzer.batch_analyze(texts, workers=2)
+        
+        for text, result in zip(texts, results):
+            if not text:
+                assert result.sentiments == {}
+                assert result.confidence == 0.0
+                assert result.analysis_quality == 'low'
+            else:
+                assert result.dominant_sentiment is not None
+    
+    def test_workers_from_config(self, analyzer):
+        """Prueba que el número de procesos se tome de la configuración"""
+        analyzer.config.batch_processing['workers'] = 1
+        
+        results = analyzer.batch_analyze(["Estoy feliz", "Estoy triste"])
+        
+        assert [r.dominant_sentiment for r in results] == ['alegria', 'tristeza']
+    
+    def test_resolve_workers(self):
+        """Prueba la resolución del número de procesos"""
+        assert resolve_workers(None) == 1
+        assert resolve_workers(3) == 3
+        assert resolve_workers(0) >= 1
+    
+    def test_tune_chunk_size(self):
+        """Prueba el ajuste del tamaño de bloque"""
+        # Textos baratos: el bloque crece hasta la duración objetivo, limitado por el equilibrio
+        assert tune_chunk_size(0.001, 10000, 4, 0.05) == 50
+        assert tune_chunk_size(0.0001, 1000, 4, 0.05) == 63
+        # Textos costosos: un texto por bloque
+        assert tune_chunk_size(1.0, 1000, 4, 0.05) == 1
+    
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_start_methods_match_serial(self, analyzer, texts, start_method):
+        """Prueba que los procesos heredados y los reconstruidos den los mismos resultados"""
+        import multiprocessing
+        if start_method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"'{start_method}' no disponible")
+        analyzer.config.batch_processing.update({'chunk_size': 4, 'sample_size': 1,
+                                                 'start_method': start_method})
+        
+        serial = analyzer.batch_analyze(texts, workers=1)
+        parallel = analyzer.batch_analyze(texts, workers=2)
+        
+        assert [r.sentiments for r in parallel] == [r.sentiments for r in serial]
+    
+    def test_forked_worker_reuses_parent_analyzer(self, analyzer):
+        """Prueba que el trabajador creado con fork adopte el analizador heredado"""
+        import gc
+        frozen = gc.get_freeze_count()
+        analyzer.config.batch_processing['start_method'] = 'auto'
+        
+        with parallel_batch.worker_pool(analyzer, 1):
+            if resolve_start_method('auto') == 'fork':
+                assert parallel_batch._shared_analyzer is analyzer
+                parallel_batch._init_forked_worker()
+                assert parallel_batch._worker_analyzer is analyzer
+        
+        # El congelamiento del recolector se revierte al cerrar el grupo
+        assert gc.get_freeze_count() == frozen
+        assert parallel_batch._shared_analyzer is None
+        parallel_batch._worker_analyzer = None
+    
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                        reason="requiere fork")
+    def test_pool_keeps_existing_freeze(self, analyzer):
+        """Prueba que el grupo no revierta un gc.freeze() previo del proceso"""
+        analyzer.config.batch_processing['start_method'] = 'fork'
+        gc.freeze()
+        try:
+            with parallel_batch.worker_pool(analyzer, 2) as executor:
+                executor.submit(len, "x").result(timeout=30)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+        
+        with parallel_batch.worker_pool(analyzer, 2):
+            pass
+        assert gc.get_freeze_count() == 0
+    
+    def test_invalid_start_method(self):
+        """Prueba que un método de inicio desconocido se rechace"""
+        with pytest.raises(ConfigurationError):
+            resolve_start_method('thread')
+
+
+class TestAnalyzeStream:
+    """Pruebas para el análisis en flujo"""
+    
+    def test_stream_matches_batch(self, analyzer, texts):
+        """Prueba que el flujo entregue los mismos resultados que el lote, en orden"""
+        batch = analyzer.batch_analyze(texts, workers=1)
+        streamed = list(analyzer.analyze_stream(iter(texts), batch_size=4, workers=1))
+        
+        assert [r.text for r in streamed] == texts
+        assert [r.sentiments for r in streamed] == [r.sentiments for r in batch]
+    
+    def test_stream_reads_input_lazily(self, analyzer, texts):
+        """Prueba que la entrada se consuma por bloques y no completa"""
+        consumed = []
+        
+        def source():
+            for text in texts:
+                consumed.append(text)
+                yield text
+        
+        stream = analyzer.analyze_stream(source(), batch_size=3, workers=1)
+        first = next(stream)
+        
+        assert first.text == texts[0]
+        assert len(consumed) == 3
+        assert len(list(stream)) == len(texts) - 1
+    
+    def test_parallel_stream_is_bounded(self, analyzer, texts):
+        """Prueba que con procesos solo haya un número acotado de bloques leídos sin entregar"""
+        consumed = []
+        
+        def source():
+            for text in texts:
+                consumed.append(text)
+                yield text
+        
+        analyzer.config.batch_processing['stream_max_pending'] = 2
+        stream = analyzer.analyze_stream(source(), batch_size=2, workers=2)
+        first = next(stream)
+        
+        assert first.text == texts[0]
+        assert len(consumed) <= 2 * 2
+        rest = list(stream)
+        assert [r.text for r in [first] + rest] == texts
+        assert [r.sentiments for r in [first] + rest] == [r.sentiments for r in
+                                                          analyzer.batch_analyze(texts, workers=1)]
+    
+    def test_save_results_closes_array_on_error(self, analyzer, texts, tmp_path):
+        """Prueba que un error del flujo se propague y deje un JSON válido"""
+        def source():
+            yield from texts[:2]
+            raise UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'byte inválido')
+        
+        output_file = tmp_path / 'resultados.json'
+        with pytest.raises(UnicodeDecodeError):
+            main.save_results(analyzer.analyze_stream(source(), batch_size=1, workers=1), str(output_file))
+        
+        saved = json.loads(output_file.read_text(encoding='utf-8'))
+        assert [item['text'] for item in saved] == texts[:2]
+    
+    def test_save_results_reports_write_errors(self, analyzer, texts, tmp_path, capsys):
+        """Prueba que los errores de escritura se informen como tales"""
+        assert main.save_results(analyzer.batch_analyze(texts, workers=1), str(tmp_path)) is None
+        assert "Error al guardar resultados" in capsys.readouterr().out
+    
+    def test_save_results_reports_close_errors(self, analyzer, texts, tmp_path, capsys, monkeypatch):
+        """Prueba que un error al cerrar la salida se informe como error de escritura"""
+        class FailingClose:
+            def __init__(self, path, *args, **kwargs):
+                self.file = open(path, *args, **kwargs)
+                self.write = self.file.write
+            
+            def close(self):
+                self.file.close()
+                raise OSError("disco lleno")
+        
+        monkeypatch.setattr(main, 'open', FailingClose, raising=False)
+        results = analyzer.batch_analyze(texts, workers=1)
+        
+        assert main.save_results(results, str(tmp_path / 'resultados.json')) is None
+        assert "Error al guardar resultados: disco lleno" in capsys.readouterr().out
+    
+    def test_iter_chunks(self):
+        """Prueba la división de un iterable en bloques"""
+        assert list(parallel_batch.iter_chunks(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(parallel_batch.iter_chunks([], 2)) == []
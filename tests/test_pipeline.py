@@ -0,0 +1,119 @@
+"""
+Pruebas Unitarias para el Pipeline Especializado
+================================================
+
+Pruebas para el armado de etapas según la configuración y los perfiles.
+"""
+
+import copy
+import pytest
+from src.models.pipeline import PROFILES, apply_profile
+from src.models.exceptions import ConfigurationError
+from src.utils.keyword_matcher import KeywordMatcher
+from src.core.tree_searcher import TreeSearcher
+
+
+TEXTS = ["Estoy muy feliz hoy", "no estoy triste", "el informe llega mañana?", "feliz 😊!"]
+
+
+def profiled(config, profile):
+    """Copia de la configuración con el perfil indicado"""
+    config = copy.deepcopy(config)
+    apply_profile(config, profile)
+    return config
+
+
+@pytest.fixture
+def profiles(make_analyzer, sample_config):
+    """Analizadores con los perfiles 'throughput' y 'explain'"""
+    return (make_analyzer(config=profiled(sample_config, 'throughput')),
+            make_analyzer(config=profiled(sample_config, 'explain')))
+
+
+class TestPipeline:
+    """Pruebas para el pipeline especializado"""
+    
+    def test_stages_follow_config(self, make_analyzer):
+        """Prueba que las etapas deshabilitadas no formen parte del pipeline"""
+        analyzer = make_analyzer()
+        assert 'fuzzy' in analyzer.pipeline.stage_names
+        assert 'modifiers' in analyzer.pipeline.stage_names
+        
+        analyzer = make_analyzer(enable_fuzzy_logic=False, enable_fast_path=False)
+        assert analyzer.pipeline.stage_names == ['preprocess', 'keywords', 'tree', 'summary']
+    
+    def test_unknown_profile(self, sample_config):
+        """Prueba que un perfil desconocido se rechace"""
+        with pytest.raises(ConfigurationError):
+            apply_profile(sample_config, 'rapido')
+    
+    def test_throughput_omits_explanation(self, profiles):
+        """Prueba que el perfil 'throughput' omita los campos de explicación"""
+        throughput, _ = profiles
+        result = throughput.analyze("Estoy muy feliz hoy")
+        
+        assert result.matched_keywords == {}
+        assert result.tree_path == []
+        assert result.modifiers_applied == {}
+        assert result.processing_time == 0.0
+    
+    def test_profiles_agree_on_scores(self, profiles):
+        """Prueba que ambos perfiles calculen las mismas puntuaciones"""
+        throughput, explain = profiles
+        for text in TEXTS:
+            fast = throughput.analyze(text)
+            full = explain.analyze(text)
+            
+            assert fast.sentiments == full.sentiments
+            assert fast.confidence == full.confidence
+            assert fast.dominant_sentiment == full.dominant_sentiment
+            assert fast.secondary_sentiments == full.secondary_sentiments
+        assert explain.analyze("Estoy muy feliz hoy").matched_keywords['alegria'] == ['feliz']
+    
+    def test_throughput_does_less_work(self, profiles, monkeypatch):
+        """Prueba que el perfil 'throughput' arme otras etapas y haga menos llamadas"""
+        throughput, explain = profiles
+        assert 'tree_scores' in throughput.pipeline.stage_names
+        assert 'tree' not in throughput.pipeline.stage_names
+        assert 'tree' in explain.pipeline.stage_names
+        
+        calls = []
+        search = TreeSearcher.search
+        find_matches = KeywordMatcher.find_matches_by_ids
+        monkeypatch.setattr(TreeSearcher, 'search',
+                            lambda self, data: calls.append('search') or search(self, data))
+        monkeypatch.setattr(KeywordMatcher, 'find_matches_by_ids',
+                            lambda self, ids: calls.append('matches') or find_matches(self, ids))
+        
+        # Con un acierto del cache del árbol no se copia la ruta del resultado
+        text = "Estoy muy feliz hoy"
+        throughput.analyze(text)
+        calls.clear()
+        result = throughput.analyze(text)
+        assert result.explanation is None
+        assert result.matched_keywords == {}
+        assert calls == []
+        
+        # En 'explain' las coincidencias se construyen al consultarlas
+        explain.analyze(text)
+        calls.clear()
+        result = explain.analyze(text)
+        assert result.explanation is not None
+        assert calls == ['search']
+        assert result.matched_keywords['alegria'] == ['feliz']
+        result.matched_keywords
+        assert calls == ['search', 'matches']
+    
+    def test_count_matches_by_ids(self, profiles):
+        """Prueba que el conteo coincida con las listas de coincidencias"""
+        _, explain = profiles
+        matcher = explain.keyword_matcher
+        for text in TEXTS:
+            token_ids = explain.preprocessor.preprocess(text)['token_ids']
+            matches = matcher.find_matches_by_ids(token_ids)
+            
+            assert matcher.count_matches_by_ids(token_ids) == sum(len(words) for words in matches.values())
+    
+    def test_profiles_cover_output_fields(self):
+        """Prueba que los perfiles definan los mismos campos de salida"""
+        assert set(PROFILES['throughput']) == set(PROFILES['explain'])
@@ -0,0 +1,110 @@
+"""
+Pruebas Unitarias para el Lote Columnar de Resultados
+=====================================================
+
+Pruebas para ResultBatch y batch_analyze con salida columnar.
+"""
+
+import pickle
+import pytest
+from array import array
+from src.models.result_batch import ResultBatch
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo"""
+    return make_analyzer()
+
+
+@pytest.fixture
+def texts():
+    """Textos de prueba, incluido uno inválido"""
+    return ["Estoy muy feliz :)", "No estoy triste!", "", "Estoy preocupado?", "Estoy muy feliz :)"]
+
+
+def assert_same_dict(row, expected, same_run=True):
+    """Compara un diccionario de fila con el original (float32 en los reales)"""
+    assert row.keys() == expected.keys()
+    for key, value in expected.items():
+        if key == 'processing_time' and not same_run:
+            continue
+        if key == 'sentiments':
+            assert row[key].keys() == value.keys()
+            for sentiment, score in value.items():
+                assert row[key][sentiment] == pytest.approx(score, abs=1e-6)
+        elif isinstance(value, float):
+            assert row[key] == pytest.approx(value, abs=1e-6)
+        else:
+            assert row[key] == value
+
+
+class TestResultBatch:
+    """Pruebas para ResultBatch"""
+    
+    def test_round_trip(self, analyzer, texts):
+        """Prueba que las filas reproduzcan los resultados originales"""
+        results = analyzer.batch_analyze(texts)
+        batch = ResultBatch.from_results(results)
+        
+        assert len(batch) == len(results)
+        for row, result in zip(batch.to_dicts(), results):
+            assert_same_dict(row, result.to_dict())
+        for row, result in zip(batch, results):
+            assert_same_dict(row.to_dict(), result.to_dict())
+        assert_same_dict(batch[-1].to_dict(), results[-1].to_dict())
+    
+    def test_rows_equal_list_results(self, analyzer, texts):
+        """Prueba que las filas sean idénticas a los resultados de la lista (sin ruido float32)"""
+        results = analyzer.batch_analyze(texts)
+        decimals = analyzer.config.output_format.get('round_decimals', 3)
+        batch = ResultBatch.from_results(results, decimals)
+        
+        assert batch.to_dicts() == [result.to_dict() for result in results]
+        assert [row.to_dict() for row in batch] == [result.to_dict() for result in results]
+        assert batch[0] == results[0]
+    
+    def test_error_rows_stay_empty(self, analyzer, texts):
+        """Prueba que un resultado de error conserve sus campos vacíos"""
+        batch = ResultBatch.from_results(analyzer.batch_analyze(texts))
+        row = batch[2]
+        
+        assert row.sentiments == {}
+        assert row.matched_keywords == {}
+        assert row.tree_path == []
+        assert row.dominant_sentiment is None
+        assert row.analysis_quality == 'low'
+    
+    def test_columns_are_compact(self, analyzer, texts):
+        """Prueba que las columnas sean arreglos y las tablas no se repitan"""
+        batch = ResultBatch.from_results(analyzer.batch_analyze(texts))
+        
+        assert isinstance(batch.column('alegria'), array)
+        assert batch.column('alegria').typecode == 'f'
+        assert batch.column('confidence') is batch.confidence
+        assert batch.column('desconocido') is None
+        assert len(batch.words) == len(set(batch.words))
+        assert len(batch.paths) == len(set(batch.paths))
+        assert len(batch.keyword_offsets) == len(batch) + 1
+    
+    def test_index_out_of_range(self):
+        """Prueba que una posición fuera del lote se rechace"""
+        with pytest.raises(IndexError):
+            ResultBatch()[0]
+    
+    def test_batch_analyze_columnar(self, analyzer, texts):
+        """Prueba que batch_analyze devuelva un lote columnar si se pide"""
+        expected = analyzer.batch_analyze(texts)
+        batch = analyzer.batch_analyze(texts, columnar=True)
+        assert isinstance(batch, ResultBatch)
+        for row, result in zip(batch.to_dicts(), expected):
+            assert_same_dict(row, result.to_dict(), same_run=False)
+        
+        analyzer.config.batch_processing['columnar_results'] = True
+        assert isinstance(analyzer.batch_analyze(texts), ResultBatch)
+    
+    def test_pickle(self, analyzer, texts):
+        """Prueba que el lote se serialice sin perder filas"""
+        batch = analyzer.batch_analyze(texts, columnar=True)
+        restored = pickle.loads(pickle.dumps(batch))
+        assert restored.to_dicts() == batch.to_dicts()
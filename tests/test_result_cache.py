@@ -0,0 +1,215 @@
+"""
+Pruebas Unitarias para el Cache de Resultados
+=============================================
+
+Pruebas para ResultCache y su uso en SentimentAnalyzer.
+"""
+
+import copy
+import pytest
+from src.models.sentiment_result import SentimentResult
+from src.models.result_cache import PersistentResultCache, ResultCache, compute_fingerprint
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo y cache de resultados habilitado"""
+    return make_analyzer(result_cache={'enabled': True, 'max_entries': 100})
+
+
+def _sample_result(text):
+    """Resultado mínimo para las pruebas del cache persistente"""
+    return SentimentResult(text=text, sentiments={'alegria': 0.9, 'tristeza': 0.1}, confidence=0.7,
+                           processing_time=0.01, matched_keywords={'alegria': ['feliz']},
+                           tree_path=['root'], modifiers_applied={})
+
+
+class TestResultCache:
+    """Pruebas para ResultCache"""
+    
+    def test_key_normalizes_case_and_spaces(self):
+        """Prueba que la clave ignore mayúsculas y espacios repetidos"""
+        cache = ResultCache(10, 'huella')
+        
+        assert cache.key("  Estoy   MUY feliz ") == cache.key("estoy muy feliz")
+        exact_case = ResultCache(10, 'huella', fold_case=False)
+        assert exact_case.key("Estoy feliz") != exact_case.key("estoy feliz")
+    
+    def test_fingerprint_changes_with_resources(self, sample_config, sample_keywords_data, sample_tree_data):
+        """Prueba que la huella cambie con los recursos y no con el logging"""
+        resources = {'tree_data': sample_tree_data, 'keywords_data': sample_keywords_data}
+        base = compute_fingerprint(sample_config, resources)
+        
+        sample_config.logging['level'] = 'DEBUG'
+        assert compute_fingerprint(sample_config, resources) == base
+        
+        sample_config.fuzzy_parameters['negation_factor'] = 0.5
+        assert compute_fingerprint(sample_config, resources) != base
+
+
+class TestAnalyzerResultCache:
+    """Pruebas para el cache de resultados del analizador"""
+    
+    def test_duplicate_text_hits_cache(self, analyzer):
+        """Prueba que los duplicados por mayúsculas o espacios se sirvan del cache"""
+        first = analyzer.analyze("Estoy muy feliz")
+        second = analyzer.analyze("estoy   MUY feliz")
+        
+        assert second.text == "estoy   MUY feliz"
+        assert second.sentiments == first.sentiments
+        assert second.dominant_sentiment == first.dominant_sentiment
+        
+        stats = analyzer.get_system_info()['cache_info']['result_cache']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['size'] == 1
+    
+    def test_cached_results_match_uncached(self, analyzer):
+        """Prueba que los resultados cacheados coincidan con los del pipeline completo"""
+        texts = ["Estoy feliz", "Me siento triste", "No estoy triste", "Estoy enojado"]
+        cached = [analyzer.analyze(text) for text in texts + texts]
+        
+        analyzer.result_cache = None
+        for text, result in zip(texts + texts, cached):
+            expected = analyzer.analyze(text)
+            assert result.sentiments == expected.sentiments
+            assert result.confidence == expected.confidence
+            assert result.matched_keywords == expected.matched_keywords
+    
+    def test_hits_do_not_share_containers(self, analyzer):
+        """Prueba que modificar un resultado del cache no altere las consultas siguientes"""
+        first = analyzer.analyze("Estoy muy feliz")
+        hit = analyzer.analyze("Estoy muy feliz")
+        expected = copy.deepcopy(hit.to_dict())
+        
+        for result in (first, hit):
+            result.sentiments['alegria'] = -1.0
+            result.secondary_sentiments.append('sorpresa')
+            result.matched_keywords['alegria'].append('intruso')
+            result.tree_path.append('intruso')
+            result.modifiers_applied['intensifiers'].append('intruso')
+        
+        again = analyzer.analyze("Estoy muy feliz").to_dict()
+        again['processing_time'] = expected['processing_time']
+        assert again == expected
+    
+    def test_invalid_text_not_served_from_cache(self, analyzer):
+        """Prueba que un texto inválido falle aunque su forma normalizada esté cacheada"""
+        from src.models.exceptions import SentimentAnalysisError
+        analyzer.analyze("Estoy feliz")
+        
+        with pytest.raises(SentimentAnalysisError):
+            analyzer.analyze("Estoy\tfeliz\x00")
+    
+    def test_disabled_by_default(self, make_analyzer):
+        """Prueba que el cache esté deshabilitado por defecto"""
+        analyzer = make_analyzer()
+        
+        assert analyzer.result_cache is None
+        assert analyzer.get_system_info()['cache_info']['result_cache'] == {'enabled': False}
+
+
+class TestPersistentResultCache:
+    """Pruebas para el cache persistente en SQLite"""
+    
+    @pytest.fixture
+    def persistent_analyzer(self, make_analyzer, tmp_path):
+        """Fábrica de analizadores con cache persistente"""
+        return lambda: make_analyzer(result_cache={'enabled': False,
+                                                   'persistent_path': str(tmp_path / 'results.db')})
+    
+    def test_round_trip(self, tmp_path, analyzer):
+        """Prueba que un resultado guardado se reconstruya igual"""
+        cache = PersistentResultCache(str(tmp_path / 'results.db'), 'huella')
+        result = analyzer.analyze("Estoy muy feliz")
+        
+        cache.put("Estoy muy feliz", result)
+        restored = cache.get("ESTOY  muy feliz", 0.5)
+        
+        assert restored.text == "ESTOY  muy feliz"
+        assert restored.processing_time == 0.5
+        assert restored.sentiments == result.sentiments
+        assert restored.matched_keywords == result.matched_keywords
+        assert restored.dominant_sentiment == result.dominant_sentiment
+        assert cache.get("otro texto") is None
+    
+    def test_disk_usage_includes_wal(self, tmp_path, analyzer):
+        """Prueba que el tamaño en disco cuente el archivo -wal pendiente"""
+        path = tmp_path / 'results.db'
+        cache = PersistentResultCache(str(path), 'huella')
+        cache.put("Estoy muy feliz", analyzer.analyze("Estoy muy feliz"))
+        wal = tmp_path / 'results.db-wal'
+        
+        assert wal.exists() and wal.stat().st_size > 0
+        assert cache.disk_usage() >= path.stat().st_size + wal.stat().st_size
+        assert analyzer.get_memory_footprint()['persistent_cache_disk'] == 0
+    
+    def test_survives_restart(self, persistent_analyzer):
+        """Prueba que un analizador nuevo reutilice los resultados guardados"""
+        texts = ["Estoy feliz", "Me siento triste", "", "Estoy enojado"]
+        first = persistent_analyzer().batch_analyze(texts)
+        
+        restarted = persistent_analyzer()
+        second = restarted.batch_analyze(texts)
+        
+        stats = restarted.get_system_info()['cache_info']['persistent_cache']
+        assert stats['size'] == 3
+        assert stats['hits'] == 3
+        assert [r.sentiments for r in second] == [r.sentiments for r in first]
+        assert second[2].sentiments == {}
+    
+    def test_stream_uses_persistent_cache(self, persistent_analyzer):
+        """Prueba que el análisis en flujo consulte y actualice el cache persistente por bloques"""
+        texts = ["Estoy feliz", "Me siento triste", "", "Estoy enojado"]
+        first = list(persistent_analyzer().analyze_stream(iter(texts), batch_size=2))
+        
+        restarted = persistent_analyzer()
+        second = list(restarted.analyze_stream(iter(texts), batch_size=2))
+        
+        stats = restarted.get_system_info()['cache_info']['persistent_cache']
+        assert stats['hits'] == 3
+        assert [r.sentiments for r in second] == [r.sentiments for r in first]
+    
+    def test_parallel_stream_reuses_one_pool(self, persistent_analyzer, monkeypatch):
+        """Prueba que el flujo con procesos y cache persistente use un solo grupo"""
+        from src.models import sentiment_analyzer
+        pools = []
+        original = sentiment_analyzer.worker_pool
+        
+        def tracking(analyzer, workers):
+            pools.append(workers)
+            return original(analyzer, workers)
+        
+        monkeypatch.setattr(sentiment_analyzer, 'worker_pool', tracking)
+        monkeypatch.setattr(sentiment_analyzer, 'parallel_analyze',
+                            lambda *args: pytest.fail("grupo de procesos por bloque"))
+        texts = ["Estoy feliz", "Me siento triste", "", "Estoy enojado", "Estoy preocupado"]
+        analyzer = persistent_analyzer()
+        streamed = list(analyzer.analyze_stream(iter(texts * 2), batch_size=3, workers=2))
+        
+        assert pools == [2]
+        assert [r.text for r in streamed] == texts * 2
+        assert [r.sentiments for r in streamed[:5]] == [r.sentiments for r in streamed[5:]]
+    
+    def test_fingerprint_change_purges_entries(self, tmp_path):
+        """Prueba que las entradas de otra huella se eliminen al abrir la base"""
+        path = str(tmp_path / 'results.db')
+        cache = PersistentResultCache(path, 'lexico-v1')
+        cache.put_many([("hola", _sample_result("hola"))])
+        cache.close()
+        
+        assert PersistentResultCache(path, 'lexico-v1').get("hola") is not None
+        reopened = PersistentResultCache(path, 'lexico-v2')
+        assert reopened.get("hola") is None
+        assert reopened.stats()['size'] == 0
+    
+    def test_get_many_preserves_order(self, tmp_path):
+        """Prueba la consulta por lotes con duplicados y ausentes"""
+        cache = PersistentResultCache(str(tmp_path / 'results.db'), 'huella')
+        cache.put_many([("a", _sample_result("a")), ("b", _sample_result("b"))])
+        
+        results = cache.get_many(["b", "x", "A", "b"])
+        
+        assert [r.text if r else None for r in results] == ["b", None, "A", "b"]
+        assert cache.stats()['hits'] == 3
+
@@ -297,4 +297,113 @@ class TestScoreNormalizer:
         confidence = score_normalizer.calculate_confidence(scores, matched_keywords)
         
         # Confianza debería ser alta con sentimiento dominante claro
-        assert confidence > 0.7 
\ No newline at end of file
+        assert confidence > 0.7 
+    
+    @pytest.mark.parametrize("method", ["min_max", "z_score", "softmax"])
+    def test_configured_method(self, sample_config, method):
+        """Prueba que el método de normalización se seleccione desde la configuración"""
+        sample_config.normalization['method'] = method
+        normalizer = ScoreNormalizer(sample_config)
+        scores = {'alegria': 0.8, 'tristeza': 0.2, 'enojo': 0.5}
+        
+        expected = {
+            'min_max': normalizer._min_max_normalize,
+            'z_score': normalizer._z_score_normalize,
+            'softmax': normalizer._softmax_normalize
+        }[method](scores)
+        
+        result = normalizer.normalize_scores(scores)
+        
+        for sentiment in scores:
+            assert result[sentiment] == pytest.approx(expected[sentiment], abs=1e-3)
+    
+    def test_invalid_method(self, sample_config):
+        """Prueba que un método desconocido se rechace"""
+        sample_config.normalization['method'] = 'l2'
+        
+        with pytest.raises(NormalizationError):
+            ScoreNormalizer(sample_config)
+    
+    @pytest.mark.parametrize("method", ["min_max", "z_score", "softmax"])
+    def test_batch_matches_vector(self, sample_config, method):
+        """Prueba que el lote coincida con la normalización por vector"""
+        np = pytest.importorskip("numpy")
+        from src.models.sentiment_vector import SENTIMENTS, SentimentVector
+        
+        sample_config.normalization['method'] = method
+        normalizer = ScoreNormalizer(sample_config)
+        rng = np.random.default_rng(11)
+        scores = rng.random((100, len(SENTIMENTS))) * 1.4 - 0.2
+        scores[::9] = 0.4
+        
+        batch = normalizer.normalize_batch(scores)
+        
+        for row in range(len(scores)):
+            vector = normalizer.normalize_vector(SentimentVector(scores[row]))
+            assert np.allclose(batch[row], list(vector.values), atol=1e-9)
+    
+    def test_rank_batch_matches_scalar(self, score_normalizer):
+        """Prueba que dominante y secundarios coincidan con el cálculo escalar"""
+        np = pytest.importorskip("numpy")
+        from src.models.sentiment_vector import SENTIMENTS
+        
+        rng = np.random.default_rng(5)
+        scores = np.round(rng.random((300, len(SENTIMENTS))), 1)  # Redondeo para forzar empates
+        
+        dominant, secondary = score_normalizer.rank_batch(scores, count=2)
+        
+        assert secondary.shape == (300, 2)
+        for row in range(len(scores)):
+            row_scores = dict(zip(SENTIMENTS, scores[row]))
+            assert SENTIMENTS[dominant[row]] == score_normalizer.get_dominant_sentiment(row_scores)
+            assert [SENTIMENTS[i] for i in secondary[row]] == \
+                score_normalizer.get_secondary_sentiments(row_scores, 2)
+    
+    def test_batch_rejects_wrong_shape(self, score_normalizer):
+        """Prueba que el lote valide las dimensiones de la matriz"""
+        pytest.importorskip("numpy")
+        
+        with pytest.raises(NormalizationError):
+            score_normalizer.normalize_batch([[0.1, 0.2]])
+    
+    @pytest.mark.parametrize("method", ["min_max", "z_score", "softmax"])
+    def test_summarize_matches_separate_calls(self, sample_config, method):
+        """Prueba que el resumen fusionado coincida con las llamadas por separado"""
+        import random
+        from src.models.sentiment_vector import SENTIMENTS, SentimentVector
+        
+        sample_config.normalization['method'] = method
+        normalizer = ScoreNormalizer(sample_config)
+        rng = random.Random(17)
+        matched_keywords = {'alegria': ['feliz'], 'tristeza': ['triste', 'llorar']}
+        
+        for _ in range(200):
+            values = [round(rng.uniform(-0.2, 1.2), 1) for _ in SENTIMENTS]  # Con empates
+            
+            summary = normalizer.summarize(SentimentVector(values), matched_keywords)
+            
+            normalized = normalizer.normalize_vector(SentimentVector(values)).to_dict()
+            assert summary['sentiments'] == normalized
+            assert summary['confidence'] == normalizer.calculate_confidence(normalized, matched_keywords)
+            assert summary['dominant_sentiment'] == normalizer.get_dominant_sentiment(normalized)
+            assert summary['secondary_sentiments'] == normalizer.get_secondary_sentiments(normalized)
+    
+    def test_summarize_partial_schema(self, score_normalizer):
+        """Prueba el resumen con un subconjunto de sentimientos"""
+        from src.models.sentiment_vector import SentimentVector
+        
+        summary = score_normalizer.summarize(SentimentVector.from_dict({'alegria': 0.9, 'enojo': 0.1}), {})
+        
+        assert summary['sentiments'] == {'alegria': 1.0, 'enojo': 0.0}
+        assert summary['dominant_sentiment'] == 'alegria'
+        assert summary['secondary_sentiments'] == ['enojo']
+    
+    def test_summarize_as_vector(self, score_normalizer):
+        """Prueba que el resumen pueda devolver el propio vector normalizado"""
+        from src.models.sentiment_vector import SentimentVector
+        
+        scores = SentimentVector.from_dict({'alegria': 0.9, 'enojo': 0.1})
+        summary = score_normalizer.summarize(scores, {}, as_vector=True)
+        
+        assert summary['sentiments'] is scores
+        assert scores.to_dict() == {'alegria': 1.0, 'enojo': 0.0}
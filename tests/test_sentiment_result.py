@@ -0,0 +1,149 @@
+"""
+Pruebas Unitarias para SentimentResult
+======================================
+
+Pruebas para la explicación diferida y los campos ya calculados.
+"""
+
+import copy
+import pickle
+import pytest
+from src.models.sentiment_result import Explanation, SentimentResult
+from src.models.sentiment_vector import SentimentVector
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.vocabulary import Vocabulary
+
+
+class CountingMatcher(KeywordMatcher):
+    """Coincidencia de palabras que cuenta las listas construidas"""
+    
+    calls = 0
+    
+    def find_matches_by_ids(self, token_ids):
+        self.calls += 1
+        return super().find_matches_by_ids(token_ids)
+
+
+@pytest.fixture
+def lazy_result(sample_keywords_data):
+    """Resultado con los campos de explicación pendientes"""
+    vocabulary = Vocabulary()
+    matcher = CountingMatcher(sample_keywords_data, vocabulary)
+    token_ids = vocabulary.encode(['estoy', 'muy', 'feliz'])
+    result = SentimentResult(
+        text="Estoy muy feliz",
+        sentiments={'alegria': 0.8, 'tristeza': 0.1, 'sorpresa': 0.1},
+        confidence=0.7,
+        processing_time=0.0,
+        explanation=Explanation(matcher, token_ids, ['root', 'leaf'], {'intensifiers': ['muy']})
+    )
+    return result, matcher
+
+
+class TestSentimentResult:
+    """Pruebas para SentimentResult"""
+    
+    def test_explanation_built_on_access(self, lazy_result):
+        """Prueba que las coincidencias se construyan solo al consultarlas (una vez)"""
+        result, matcher = lazy_result
+        assert matcher.calls == 0
+        
+        assert result.matched_keywords['alegria'] == ['feliz']
+        assert result.matched_keywords is result.matched_keywords
+        assert matcher.calls == 1
+        assert result.tree_path == ['root', 'leaf']
+        assert result.modifiers_applied == {'intensifiers': ['muy']}
+    
+    def test_supplied_fields_not_recomputed(self, sample_sentiment_result):
+        """Prueba que los campos indicados se conserven tal cual"""
+        result = SentimentResult(
+            text="texto",
+            sentiments={'alegria': 0.5, 'tristeza': 0.3, 'enojo': 0.2},
+            confidence=0.9,
+            processing_time=0.0,
+            dominant_sentiment='tristeza',
+            secondary_sentiments=[],
+            analysis_quality='low'
+        )
+        assert result.dominant_sentiment == 'tristeza'
+        assert result.secondary_sentiments == []
+        assert result.analysis_quality == 'low'
+        assert sample_sentiment_result.analysis_quality == 'high'
+    
+    def test_missing_fields_derived(self):
+        """Prueba que los campos no indicados se calculen"""
+        result = SentimentResult(
+            text="texto",
+            sentiments={'alegria': 0.5, 'tristeza': 0.3, 'enojo': 0.2},
+            confidence=0.65,
+            processing_time=0.0
+        )
+        assert result.dominant_sentiment == 'alegria'
+        assert result.secondary_sentiments == ['tristeza', 'enojo']
+        assert result.analysis_quality == 'medium'
+        assert result.matched_keywords == {}
+        assert result.tree_path == []
+        assert result.modifiers_applied == {}
+    
+    def test_pickle_detaches_explanation(self, lazy_result):
+        """Prueba que al serializar se construya la explicación y no viaje el manejador"""
+        result, _ = lazy_result
+        restored = pickle.loads(pickle.dumps(result))
+        
+        assert restored.explanation is None
+        assert restored == result
+        assert restored.to_dict() == result.to_dict()
+    
+    def test_copy_keeps_explanation_lazy(self, lazy_result):
+        """Prueba que copiar un resultado no construya la explicación"""
+        result, matcher = lazy_result
+        copied = copy.copy(result)
+        
+        assert matcher.calls == 0
+        assert copied.__dict__.get('_matched_keywords') is None
+        assert copied.explanation is result.explanation
+        assert copied.to_dict() == result.to_dict()
+        assert copied.tree_path is not result.tree_path
+        assert matcher.calls == 2
+    
+    def test_equality_ignores_handle(self, lazy_result, sample_keywords_data):
+        """Prueba que la igualdad compare los campos y no el manejador"""
+        result, _ = lazy_result
+        eager = SentimentResult(
+            text=result.text,
+            sentiments=result.sentiments,
+            confidence=result.confidence,
+            processing_time=0.0,
+            matched_keywords=KeywordMatcher(sample_keywords_data).find_matches(['estoy', 'muy', 'feliz']),
+            tree_path=['root', 'leaf'],
+            modifiers_applied={'intensifiers': ['muy']}
+        )
+        assert eager == result
+    
+    def test_vector_sentiments_built_on_access(self):
+        """Prueba que un vector de puntuaciones se convierta a diccionario al consultarlo"""
+        vector = SentimentVector([0.8, 0.1, 0.0, 0.0, 0.1, 0.0])
+        result = SentimentResult(
+            text="texto",
+            sentiments=vector,
+            confidence=0.7,
+            processing_time=0.0,
+            dominant_sentiment='alegria',
+            secondary_sentiments=['tristeza', 'informacion']
+        )
+        assert result.__dict__['_sentiments'] is vector
+        
+        assert result.sentiments == vector.to_dict()
+        assert result.sentiments is result.sentiments
+        assert result.to_dict()['sentiments'] == vector.to_dict()
+        assert result.analysis_quality == 'medium'
+    
+    def test_result_without_explanation(self):
+        """Prueba que un resultado sin manejador dé campos de explicación vacíos"""
+        result = SentimentResult(text="texto", sentiments={}, confidence=0.0, processing_time=0.0)
+        
+        assert result.explanation is None
+        assert result.matched_keywords == {}
+        assert result.tree_path == []
+        assert result.modifiers_applied == {}
+        assert result.dominant_sentiment is None
@@ -0,0 +1,74 @@
+"""
+Pruebas Unitarias para SentimentVector
+======================================
+
+Pruebas para el esquema compartido y el vector de sentimientos.
+"""
+
+import pytest
+from src.models.sentiment_vector import SENTIMENTS, SENTIMENT_INDEX, SentimentVector
+
+
+class TestSentimentVector:
+    """Pruebas para SentimentVector"""
+    
+    def test_default_schema_order(self):
+        """Prueba el orden canónico de los sentimientos"""
+        vector = SentimentVector()
+        
+        assert vector.names is SENTIMENTS
+        assert len(vector) == 6
+        assert vector.index('enojo') == SENTIMENT_INDEX['enojo'] == 2
+        assert vector.index('inexistente') == -1
+    
+    def test_round_trip_full_dict(self):
+        """Prueba la conversión desde y hacia diccionario completo"""
+        scores = {sentiment: 0.1 * i for i, sentiment in enumerate(SENTIMENTS)}
+        
+        vector = SentimentVector.from_dict(scores)
+        
+        assert vector.names is SENTIMENTS  # Se reutiliza el esquema compartido
+        assert vector.to_dict() == scores
+    
+    def test_partial_dict_keeps_keys(self):
+        """Prueba que un diccionario parcial conserve sus claves y su orden"""
+        vector = SentimentVector.from_dict({'tristeza': 0.2, 'alegria': 0.6})
+        
+        assert list(vector.to_dict()) == ['tristeza', 'alegria']
+        assert vector['alegria'] == 0.6
+        assert vector.index('enojo') == -1
+    
+    def test_copy_is_independent(self):
+        """Prueba que la copia no comparta el almacenamiento"""
+        vector = SentimentVector.from_dict({'alegria': 0.5, 'tristeza': 0.5})
+        
+        copied = vector.copy()
+        copied['alegria'] = 0.9
+        
+        assert vector['alegria'] == 0.5
+        assert copied != vector
+    
+    def test_clamp_and_argmax(self):
+        """Prueba el recorte en el lugar y el máximo con desempate estable"""
+        vector = SentimentVector.from_dict({'alegria': 1.4, 'tristeza': -0.2, 'enojo': 1.0})
+        
+        vector.clamp()
+        
+        assert vector.to_dict() == {'alegria': 1.0, 'tristeza': 0.0, 'enojo': 1.0}
+        assert vector.argmax() == 0
+    
+    def test_invalid_length(self):
+        """Prueba que se rechacen vectores con longitud incorrecta"""
+        with pytest.raises(ValueError):
+            SentimentVector([0.1, 0.2])
+    
+    def test_tree_vectors_are_not_mutated(self, tree_searcher, fuzzy_logic_processor, sample_preprocessed_data):
+        """Prueba que el pipeline trabaje sobre copias del vector de la hoja"""
+        result = tree_searcher.search(sample_preprocessed_data)
+        original = result['score_vector'].copy()
+        
+        scores = result['score_vector'].copy()
+        fuzzy_logic_processor.apply_fuzzy_rules_vector(scores, {'intensifiers': ['muy']})
+        
+        assert result['score_vector'] == original
+        assert result['score_vector'].to_dict() == result['final_scores']
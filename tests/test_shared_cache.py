@@ -0,0 +1,109 @@
+"""
+Pruebas Unitarias para el Cache en Memoria Compartida
+=====================================================
+
+Pruebas para SharedResultCache y su uso en el procesamiento paralelo.
+"""
+
+import multiprocessing
+import pytest
+from src.models.shared_cache import SharedResultCache, SLOT_SIZE
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Analizador con recursos de ejemplo y cache compartido configurado"""
+    return make_analyzer(result_cache={'enabled': False, 'shared_slots': 256, 'shared_stripes': 4})
+
+
+@pytest.fixture
+def texts():
+    """Textos de prueba con duplicados"""
+    return ["Estoy muy feliz", "Me siento triste", "No estoy triste", "Estoy enojado",
+            "ESTOY MUY FELIZ", "Estoy preocupado"] * 4
+
+
+class TestSharedResultCache:
+    """Pruebas para SharedResultCache"""
+    
+    def test_put_and_get(self):
+        """Prueba que el registro empaquetado reconstruya el resumen"""
+        cache = SharedResultCache(16, 'huella', {'hoja': ['root', 'hoja']})
+        summary = {
+            'sentiments': {'alegria': 0.812, 'tristeza': 0.0, 'enojo': 0.1,
+                           'preocupacion': 0.1, 'informacion': 0.5, 'sorpresa': 0.5},
+            'confidence': 0.7345678912345,
+            'dominant_sentiment': 'alegria',
+            'secondary_sentiments': ['informacion', 'sorpresa']
+        }
+        
+        try:
+            assert cache.put("Hola  Mundo", summary, ['root', 'hoja'])
+            restored, path = cache.get("hola mundo")
+            
+            assert restored == summary
+            assert path == ['root', 'hoja']
+            assert cache.get("otro") is None
+            assert cache.stats()['size'] == 1
+            assert cache.stats()['bytes'] == 16 * SLOT_SIZE
+        finally:
+            cache.close()
+    
+    def test_unknown_path_not_stored(self):
+        """Prueba que una ruta sin hoja identificable no se almacene"""
+        cache = SharedResultCache(16, 'huella', {})
+        try:
+            summary = {'sentiments': {}, 'confidence': 0.5}
+            assert not cache.put("hola", summary, ['root', 'x'])
+        finally:
+            cache.close()
+    
+    def test_full_region_replaces_entries(self):
+        """Prueba que una tabla llena siga aceptando entradas"""
+        cache = SharedResultCache(4, 'huella', {'hoja': ['root', 'hoja']}, stripes=1)
+        summary = {'sentiments': {'alegria': 0.5, 'tristeza': 0.5, 'enojo': 0.5,
+                                  'preocupacion': 0.5, 'informacion': 0.5, 'sorpresa': 0.5},
+                   'confidence': 0.5}
+        try:
+            for i in range(20):
+                assert cache.put(f"texto {i}", summary, ['root', 'hoja'])
+            assert cache.get("texto 19") is not None
+            assert cache.stats()['size'] == 4
+        finally:
+            cache.close()
+
+
+class TestAnalyzerSharedCache:
+    """Pruebas para el cache compartido del analizador"""
+    
+    def test_results_match_uncached(self, analyzer, texts):
+        """Prueba que los resultados compartidos coincidan con el pipeline completo"""
+        expected = [analyzer.analyze(text) for text in texts]
+        assert analyzer.enable_shared_cache()
+        
+        first = [analyzer.analyze(text) for text in texts]
+        second = [analyzer.analyze(text) for text in texts]
+        
+        for result, reference in zip(first + second, expected + expected):
+            assert result.sentiments == reference.sentiments
+            assert result.confidence == reference.confidence
+            assert result.dominant_sentiment == reference.dominant_sentiment
+            assert result.secondary_sentiments == reference.secondary_sentiments
+            assert result.tree_path == reference.tree_path
+            assert result.matched_keywords == reference.matched_keywords
+        assert analyzer.shared_cache.hits >= len(texts)
+    
+    def test_forked_workers_share_entries(self, analyzer, texts):
+        """Prueba que las entradas escritas por los trabajadores sean visibles en el principal"""
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            pytest.skip("'fork' no disponible")
+        analyzer.config.batch_processing.update({'chunk_size': 2, 'sample_size': 1,
+                                                 'start_method': 'fork'})
+        
+        parallel = analyzer.batch_analyze(texts, workers=2)
+        
+        # Los textos analizados solo en los trabajadores ya están en el segmento compartido
+        hits_before = analyzer.shared_cache.hits
+        serial = [analyzer.analyze(text) for text in texts[1:]]
+        assert analyzer.shared_cache.hits - hits_before == len(texts) - 1
+        assert [r.sentiments for r in parallel[1:]] == [r.sentiments for r in serial]
@@ -0,0 +1,128 @@
+"""
+Pruebas Unitarias para StreamingNormalizer
+==========================================
+
+Pruebas para la normalización incremental con estadísticas de corpus.
+"""
+
+import json
+import math
+import random
+import statistics
+import pytest
+from src.utils.streaming_normalizer import StreamingNormalizer
+from src.utils.normalizer import ScoreNormalizer
+from src.models.sentiment_vector import SENTIMENTS, SentimentVector
+from src.models.exceptions import NormalizationError
+
+
+@pytest.fixture
+def corpus():
+    """Corpus sintético de puntuaciones"""
+    rng = random.Random(23)
+    return [[rng.random() for _ in SENTIMENTS] for _ in range(500)]
+
+
+class TestStreamingNormalizer:
+    """Pruebas para StreamingNormalizer"""
+    
+    def test_running_statistics(self, corpus):
+        """Prueba que media y desviación coincidan con el cálculo en dos pasadas"""
+        streaming = StreamingNormalizer()
+        for values in corpus:
+            streaming.update(values)
+        
+        for i in range(len(SENTIMENTS)):
+            column = [values[i] for values in corpus]
+            assert streaming.mean[i] == pytest.approx(statistics.fmean(column))
+            assert streaming.std(i) == pytest.approx(statistics.pstdev(column))
+    
+    def test_normalize_against_corpus(self, corpus):
+        """Prueba la normalización sigmoide del z-score de corpus"""
+        streaming = StreamingNormalizer()
+        for values in corpus:
+            streaming.update(values)
+        
+        document = [0.5] * len(SENTIMENTS)
+        normalized = streaming.normalize(document)
+        
+        for i, value in enumerate(normalized):
+            z_score = (0.5 - streaming.mean[i]) / streaming.std(i)
+            assert value == pytest.approx(1 / (1 + math.exp(-z_score)))
+    
+    def test_first_document_is_neutral(self):
+        """Prueba que sin dispersión acumulada el resultado sea 0.5"""
+        streaming = StreamingNormalizer()
+        
+        assert streaming.update_and_normalize([0.9, 0.1, 0.0, 0.0, 0.0, 0.0]) == [0.5] * len(SENTIMENTS)
+    
+    def test_window_tracks_recent_documents(self):
+        """Prueba que la ventana móvil olvide documentos antiguos"""
+        streaming = StreamingNormalizer(window=50)
+        for _ in range(200):
+            streaming.update([0.1] * len(SENTIMENTS))
+        for _ in range(500):
+            streaming.update([0.9] * len(SENTIMENTS))
+        
+        assert streaming.count == 50
+        assert streaming.mean[0] == pytest.approx(0.9, abs=1e-3)
+    
+    def test_save_and_load_state(self, corpus, tmp_path):
+        """Prueba la persistencia del acumulador entre ejecuciones"""
+        path = str(tmp_path / 'state.json')
+        streaming = StreamingNormalizer()
+        for values in corpus[:250]:
+            streaming.update(values)
+        streaming.save_state(path)
+        
+        restored = StreamingNormalizer()
+        assert restored.load_state(path)
+        for values in corpus[250:]:
+            streaming.update(values)
+            restored.update(values)
+        
+        assert restored.count == streaming.count
+        assert list(restored.mean) == list(streaming.mean)
+        assert list(restored.m2) == list(streaming.m2)
+    
+    def test_load_missing_and_invalid_state(self, tmp_path):
+        """Prueba la carga de un estado inexistente o inválido"""
+        streaming = StreamingNormalizer()
+        assert not streaming.load_state(str(tmp_path / 'missing.json'))
+        
+        path = tmp_path / 'state.json'
+        path.write_text(json.dumps({'version': 1, 'sentiments': ['alegria'], 'count': 1,
+                                    'mean': [0.1], 'm2': [0.0]}), encoding='utf-8')
+        with pytest.raises(NormalizationError):
+            streaming.load_state(str(path))
+    
+    def test_score_normalizer_streaming_method(self, sample_config, corpus, tmp_path):
+        """Prueba el método 'streaming' seleccionado desde la configuración"""
+        path = str(tmp_path / 'state.json')
+        sample_config.normalization = {'method': 'streaming', 'state_file': path}
+        normalizer = ScoreNormalizer(sample_config)
+        
+        for values in corpus[:100]:
+            normalizer.normalize_vector(SentimentVector(values))
+        assert normalizer.save_state()
+        
+        # Un normalizador nuevo retoma el estado persistido
+        resumed = ScoreNormalizer(sample_config)
+        assert resumed.streaming.count == 100
+        
+        first = normalizer.normalize_vector(SentimentVector(corpus[100]))
+        second = resumed.normalize_vector(SentimentVector(corpus[100]))
+        assert first == second
+    
+    def test_streaming_batch_matches_vector(self, sample_config, corpus):
+        """Prueba que el lote incorpore las filas en orden como el vector"""
+        np = pytest.importorskip("numpy")
+        sample_config.normalization = {'method': 'streaming'}
+        by_vector = ScoreNormalizer(sample_config)
+        by_batch = ScoreNormalizer(sample_config)
+        
+        batch = by_batch.normalize_batch(corpus[:50])
+        
+        for row, values in enumerate(corpus[:50]):
+            vector = by_vector.normalize_vector(SentimentVector(values))
+            assert np.allclose(batch[row], list(vector.values), atol=1e-9)
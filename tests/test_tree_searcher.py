@@ -28,6 +28,15 @@ class TestTreeSearcher:
         assert result['confidence'] > 0.0
         assert result['confidence'] <= 1.0
     
+    def test_search_scores_matches_search(self, tree_searcher, sample_preprocessed_data):
+        """Prueba que las puntuaciones sin ruta coincidan con la búsqueda completa"""
+        sample_preprocessed_data['words'] = ['estoy', 'muy', 'feliz', 'hoy']
+        
+        full = tree_searcher.search(sample_preprocessed_data)
+        scores = tree_searcher.search_scores(sample_preprocessed_data)
+        
+        assert scores.to_dict() == full['score_vector'].to_dict()
+    
     def test_tree_search_with_intensifier(self, tree_searcher, sample_preprocessed_data):
         """TC-TREE-002: Búsqueda con intensificador"""
         sample_preprocessed_data['words'] = ['estoy', 'muy', 'feliz']
@@ -361,4 +370,36 @@ class TestTreeSearcher:
         searcher.search(sample_data2)
         
         # El cache debería tener solo un elemento
-        assert len(searcher.memoization_cache) == 1 
\ No newline at end of file
+        assert len(searcher.memoization_cache) == 1 
+    
+    def test_cached_result_not_mutated(self, sample_config, sample_tree_data):
+        """Prueba que modificar un resultado devuelto no altere el cache"""
+        searcher = TreeSearcher(sample_tree_data, sample_config)
+        sample_data = {'words': ['estoy', 'feliz'], 'intensifiers': [], 'attenuators': [], 'negations': []}
+        
+        first = searcher.search(sample_data)
+        first['path'].append('modificado')
+        first['cache_hits'] = 99
+        
+        second = searcher.search(sample_data)
+        
+        assert 'modificado' not in second['path']
+        assert second['cache_hits'] == 1
+    
+    def test_concurrent_searches(self, sample_config, sample_tree_data):
+        """Prueba búsquedas concurrentes con un único buscador"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        sample_config.tree_search['cache_size'] = 2
+        searcher = TreeSearcher(sample_tree_data, sample_config)
+        inputs = [
+            {'words': ['estoy', word], 'intensifiers': [], 'attenuators': [], 'negations': []}
+            for word in ('feliz', 'triste', 'enojado', 'preocupado')
+        ]
+        expected = [TreeSearcher(sample_tree_data, sample_config).search(data)['path'] for data in inputs]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(searcher.search, inputs * 200))
+        
+        assert [result['path'] for result in results] == expected * 200
+        assert len(searcher.memoization_cache) <= 2
@@ -0,0 +1,88 @@
+"""
+Pruebas Unitarias para Vocabulary
+=================================
+
+Pruebas para el vocabulario de tokens con identificadores enteros.
+"""
+
+import pytest
+from array import array
+from src.utils.vocabulary import Vocabulary, OOV_ID
+from src.utils.keyword_matcher import KeywordMatcher
+from src.core.text_preprocessor import TextPreprocessor
+
+
+class TestVocabulary:
+    """Pruebas para Vocabulary"""
+    
+    def test_ids_are_stable(self):
+        """Prueba que cada token conserve su identificador"""
+        vocabulary = Vocabulary(['feliz', 'triste'])
+        
+        assert vocabulary.get_id('feliz') == vocabulary.add_token('feliz')
+        assert vocabulary.get_id('feliz') != vocabulary.get_id('triste')
+        assert len(vocabulary) == 2
+    
+    def test_oov_tokens_are_flagged(self):
+        """Prueba que los tokens desconocidos reciban OOV_ID"""
+        vocabulary = Vocabulary(['feliz'])
+        
+        token_ids = vocabulary.encode(['estoy', 'feliz'])
+        
+        assert isinstance(token_ids, array)
+        assert token_ids.typecode == 'I'
+        assert token_ids[0] == OOV_ID
+        assert vocabulary.decode(token_ids) == [None, 'feliz']
+    
+    def test_add_frequent_tokens(self):
+        """Prueba la incorporación de tokens frecuentes"""
+        vocabulary = Vocabulary()
+        
+        added = vocabulary.add_frequent_tokens(
+            [['hoy', 'clima'], ['hoy', 'lluvia'], ['hoy', 'clima']], min_count=2
+        )
+        
+        assert added == 2
+        assert 'hoy' in vocabulary
+        assert 'clima' in vocabulary
+        assert 'lluvia' not in vocabulary
+    
+    def test_intern_shares_known_strings(self):
+        """Prueba que los tokens conocidos compartan la instancia del vocabulario"""
+        vocabulary = Vocabulary(['feliz'])
+        word = ''.join(['fe', 'liz'])
+        
+        interned = vocabulary.intern([word, 'Feliz'], vocabulary.encode([word, 'feliz']))
+        
+        assert interned[0] is vocabulary.get_token(vocabulary.get_id('feliz'))
+        assert interned[1] == 'Feliz'  # Sin mayúsculas solo se comparte si es idéntico
+    
+    def test_matcher_by_ids_matches_word_search(self, sample_keywords_data, sample_config):
+        """Prueba que la búsqueda por identificadores equivalga a la búsqueda por palabras"""
+        vocabulary = Vocabulary()
+        matcher = KeywordMatcher(sample_keywords_data, vocabulary)
+        preprocessor = TextPreprocessor(sample_config, vocabulary)
+        
+        data = preprocessor.preprocess("Quiero informar que estoy feliz y no triste")
+        
+        assert matcher.find_matches_by_ids(data['token_ids']) == matcher.find_matches(data['words'])
+        assert data['oov_count'] == data['token_ids'].count(OOV_ID)
+        assert data['token_ids'][data['words'].index('no')] != OOV_ID
+    
+    def test_analyzer_adds_corpus_tokens(self, make_analyzer, tmp_path):
+        """Prueba que el analizador asigne identificadores a los tokens frecuentes del corpus"""
+        corpus = tmp_path / 'corpus.txt'
+        corpus.write_text("El clima de hoy\nHoy llueve\n\nEl CLIMA cambia\n", encoding='utf-8')
+        
+        analyzer = make_analyzer(preprocessing={'vocabulary_corpus': str(corpus)})
+        
+        assert 'hoy' in analyzer.vocabulary
+        assert 'clima' in analyzer.vocabulary
+        assert 'llueve' not in analyzer.vocabulary
+        assert analyzer.preprocessor.preprocess("hoy hay clima")['oov_count'] == 1
+        
+        # Un analizador construido con los recursos no relee el corpus
+        from src.models.sentiment_analyzer import SentimentAnalyzer
+        corpus.unlink()
+        rebuilt = SentimentAnalyzer(analyzer.config, resources=analyzer.get_resources())
+        assert rebuilt.vocabulary.get_id('clima') == analyzer.vocabulary.get_id('clima')